@@ -5,6 +5,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+비동기 뷰(start_collection, check_status)는 ASGI 서버에서 이벤트 루프로 처리되어
+외부 API 키 검증 대기 중에도 다른 요청을 막지 않는다.
+    uvicorn config.asgi:application --host 0.0.0.0 --port 8000 --workers 2
 """
 
 import os
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     'django.contrib.gis',  # PostGIS 추가
+    'django.contrib.postgres',  # pg_trgm 검색 (TrigramSimilarity, trigram_similar)
     "stores",
 ]
 
@@ -89,6 +90,39 @@ DATABASES = {
 }
 
 
+# Cache
+# 구별 데이터 버전 + 응답 페이로드 캐시 (stores/data_cache.py)
+# run_all 등 별도 프로세스에서 올린 데이터 버전을 웹 프로세스와 공유하기 위해 파일 캐시 사용
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('DJANGO_CACHE_DIR', str(BASE_DIR / '.cache')),
+    }
+}
+
+
+# Collection jobs
+# 수집 작업은 CollectionJob 대기열에 등록되고 collect_worker 커맨드가 처리 (stores/jobs.py)
+# True면 별도 워커 없이도 동작하도록 웹 프로세스가 대기열을 직접 처리하는 스레드를 띄움
+# (웹 프로세스가 pandas 파이프라인을 실행하게 되므로 기본값은 False, 로컬 runserver 단독 실행 시에만 사용)
+# 웹이 받은 API 키는 캐시로 워커에 전달되므로 웹과 워커는 같은 CACHES(DJANGO_CACHE_DIR)를 써야 함
+
+COLLECTION_EMBEDDED_WORKER = os.getenv('COLLECTION_EMBEDDED_WORKER', 'False').lower() == 'true'
+
+
+# Results snapshot
+# 파이프라인 완료 시 구별 결과를 바이너리 스냅샷으로 저장, 웹 워커는 mmap으로 읽음 (stores/snapshot.py)
+
+RESULTS_SNAPSHOT_DIR = os.getenv('RESULTS_SNAPSHOT_DIR', str(BASE_DIR / '.snapshots'))
+
+
+# Static export
+# run_all --export-static 시 구별 정적 지도 번들 출력 위치 (stores/static_export.py)
+
+STATIC_EXPORT_DIR = os.getenv('STATIC_EXPORT_DIR', str(BASE_DIR / 'static_export'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
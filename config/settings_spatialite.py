@@ -0,0 +1,64 @@
+"""
+SpatiaLite 프로필 (로컬 테스트/벤치마크용, PostgreSQL 서버 불필요)
+
+기본 설정(settings.py)에서 DB만 SQLite + SpatiaLite로 바꾸고
+DB 파일/캐시/스냅샷/정적 번들을 프로세스별 임시 디렉터리에 둔다.
+공유 DB 서버가 없으므로 여러 테스트/벤치마크를 동시에 실행해도 서로 간섭하지 않는다.
+(테스트 DB는 Django 기본값대로 인메모리 SQLite)
+
+PostGIS 전용 기능은 PostgreSQL 외에서 건너뛰거나 대체 경로로 동작한다.
+    gu 파티션 / 스테이징 교체 / NOTIFY·LISTEN   사용 안 함 (일반 테이블, 즉시 삭제 후 기록)
+    pg_trgm 인덱스 / 유사도 검색               인덱스 생략, 검색은 부분 일치
+    육각 격자 / 다이소 밀도 / 최근접 다이소         건너뜀 (0건)
+    상태 변경 이력 기록                           LATERAL 대신 서브쿼리 + bulk_create
+    benchmark_queries (EXPLAIN ANALYZE)         실행 불가
+
+사용법:
+    DJANGO_SETTINGS_MODULE=config.settings_spatialite python manage.py test stores.test_unit
+    DJANGO_SETTINGS_MODULE=config.settings_spatialite python manage.py test stores.test_unit --parallel 4
+
+    # 여러 커맨드가 같은 DB를 쓰려면 작업 디렉터리 지정 (지정하지 않으면 프로세스마다 새 DB)
+    export SPATIALITE_WORK_DIR=/tmp/radius_local
+    python manage.py migrate --settings=config.settings_spatialite
+    python manage.py run_all --gu 영등포구 --settings=config.settings_spatialite
+
+    # mod_spatialite를 찾지 못하면 SPATIALITE_LIBRARY_PATH=/usr/lib/x86_64-linux-gnu/mod_spatialite.so
+"""
+
+import atexit
+import shutil
+import tempfile
+
+from .settings import *  # noqa: F401,F403
+
+
+WORK_DIR = os.getenv('SPATIALITE_WORK_DIR')
+if WORK_DIR:
+    os.makedirs(WORK_DIR, exist_ok=True)
+else:
+    WORK_DIR = tempfile.mkdtemp(prefix='radius_collector_')
+    atexit.register(shutil.rmtree, WORK_DIR, ignore_errors=True)
+
+DATABASES = {
+    'default': {
+        # PostgreSQL 전용 인덱스(GinIndex)를 건너뛰는 SpatiaLite 백엔드
+        'ENGINE': 'config.spatialite_backend',
+        'NAME': os.path.join(WORK_DIR, 'radius_collector.sqlite3'),
+    }
+}
+
+if os.getenv('SPATIALITE_LIBRARY_PATH'):
+    SPATIALITE_LIBRARY_PATH = os.getenv('SPATIALITE_LIBRARY_PATH')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(WORK_DIR, 'cache'),
+    }
+}
+
+# SQLite는 쓰기 잠금이 DB 전체 단위라 웹 프로세스 내 수집 스레드는 끔 (collect_worker로 실행)
+COLLECTION_EMBEDDED_WORKER = False
+
+RESULTS_SNAPSHOT_DIR = os.path.join(WORK_DIR, 'snapshots')
+STATIC_EXPORT_DIR = os.path.join(WORK_DIR, 'static_export')
@@ -0,0 +1,42 @@
+"""
+SpatiaLite 백엔드 (로컬 테스트/벤치마크 프로필, config/settings_spatialite.py)
+
+GeoDjango SpatiaLite 백엔드에서 PostgreSQL 전용 인덱스만 건너뛴다.
+모델 Meta와 migrations/0010의 pg_trgm GinIndex(gin_trgm_ops)는
+SQLite에서 CREATE INDEX ... USING gin 구문 오류가 나므로 생성/삭제하지 않는다.
+(TrigramExtension 같은 확장 설치는 Django가 PostgreSQL 외에서 이미 건너뜀)
+"""
+
+from django.contrib.gis.db.backends.spatialite.base import DatabaseWrapper as SpatiaLiteDatabaseWrapper
+from django.contrib.gis.db.backends.spatialite.schema import SpatialiteSchemaEditor
+from django.contrib.postgres.indexes import PostgresIndex
+
+
+class SchemaEditor(SpatialiteSchemaEditor):
+    def add_index(self, model, index):
+        if isinstance(index, PostgresIndex):
+            return None
+        return super().add_index(model, index)
+
+    def remove_index(self, model, index):
+        if isinstance(index, PostgresIndex):
+            return None
+        return super().remove_index(model, index)
+
+    def _model_indexes_sql(self, model):
+        # create_model/_remake_table에서 Meta.indexes를 만들 때도 동일하게 제외
+        if not model._meta.managed or model._meta.proxy or model._meta.swapped:
+            return []
+        output = []
+        for field in model._meta.local_fields:
+            output.extend(self._field_indexes_sql(model, field))
+        for index in model._meta.indexes:
+            if isinstance(index, PostgresIndex):
+                continue
+            if not index.contains_expressions or self.connection.features.supports_expression_indexes:
+                output.append(index.create_sql(model, self))
+        return output
+
+
+class DatabaseWrapper(SpatiaLiteDatabaseWrapper):
+    SchemaEditorClass = SchemaEditor
@@ -23,9 +23,17 @@ from stores.views import (
     collector_view,
     start_collection,
     check_status,
+    collection_events,
     get_results,
+    search,
+    hex_density,
+    daiso_density,
+    closure_history,
+    gu_summary_view,
+    gu_summary,
     dev_monitor_view,
     dev_status,
+    dev_quadrants,
     dev_test_view
 )
 
@@ -34,6 +42,7 @@ urlpatterns = [
     path("", collector_view, name="home"),  # 메인 페이지 (수집 UI)
     path("map/", map_view, name="map_view"), 
     path("store-closure/", store_closure_map_view, name="store_closure_map"),
+    path("gu-summary/", gu_summary_view, name="gu_summary_view"),
     
     # 개발자 모니터링 대시보드
     path("dev/monitor/", dev_monitor_view, name="dev_monitor"),
@@ -42,6 +51,13 @@ urlpatterns = [
     # API 엔드포인트
     path("api/start-collection/", start_collection, name="start_collection"),
     path("api/check-status/", check_status, name="check_status"),
+    path("api/events/", collection_events, name="collection_events"),
     path("api/get-results/", get_results, name="get_results"),
+    path("api/search/", search, name="search"),
+    path("api/hex-density/", hex_density, name="hex_density"),
+    path("api/daiso-density/", daiso_density, name="daiso_density"),
+    path("api/closure-history/", closure_history, name="closure_history"),
+    path("api/gu-summary/", gu_summary, name="gu_summary"),
     path("api/dev-status/", dev_status, name="dev_status"),
+    path("api/dev-status/quadrants/", dev_quadrants, name="dev_quadrants"),
 ]
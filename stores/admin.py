@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import DaisoStore, NearbyStore, YeongdeungpoDaiso, YeongdeungpoConvenience, SeoulRestaurantLicense, TobaccoRetailLicense
+from .models import DaisoStore, NearbyStore, YeongdeungpoDaiso, YeongdeungpoConvenience, SeoulRestaurantLicense, TobaccoRetailLicense, GuSummary, CollectionJob
 
 # 1. 다이소 매장 관리 (기존 유지 + 보완)
 @admin.register(DaisoStore)
@@ -209,4 +209,24 @@ class TobaccoRetailLicenseAdmin(admin.ModelAdmin):
             'fields': ('lastmodts', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+
+
+# 7. 구별 요약 통계 (파이프라인 완료 시 자동 갱신, 읽기 전용)
+@admin.register(GuSummary)
+class GuSummaryAdmin(admin.ModelAdmin):
+    list_display = (
+        'gu', 'daiso_count', 'convenience_count', 'restaurant_count', 'tobacco_count',
+        'normal_count', 'closed_count', 'coords_missing', 'refreshed_at'
+    )
+    list_per_page = 50
+    readonly_fields = [field.name for field in GuSummary._meta.fields]
+
+
+# 8. 수집 작업 큐 (워커가 상태 갱신, 읽기 전용)
+@admin.register(CollectionJob)
+class CollectionJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'gu', 'status', 'progress', 'message', 'worker', 'created_at', 'finished_at')
+    list_filter = ('status', 'gu')
+    list_per_page = 50
+    readonly_fields = [field.name for field in CollectionJob._meta.fields]
@@ -0,0 +1,332 @@
+# stores/analytics.py
+"""
+공간 분석 레이어 (파이프라인 완료 시 집합 연산 1회로 갱신)
+
+개별 좌표를 내려보내지 않고도 구/서울 전체 패턴을 볼 수 있도록
+PostGIS에서 집계한 결과를 분석 테이블에 저장한다.
+
+육각 격자 폐업 밀도 (HexCell):
+    StoreClosureResult와 인허가 편의점(SeoulRestaurantLicense)을
+    EPSG:5179(미터 단위) 육각 격자(ST_HexagonGrid)에 여러 크기로 집계한다.
+    격자 원점이 좌표계 원점으로 고정되므로 같은 크기의 셀 (i, j)는 구가 달라도 같은 위치다.
+    셀 경계(변/꼭짓점) 위의 점은 2~3개 셀과 교차하므로 (i, j)가 가장 작은 셀 하나에만 집계한다.
+
+다이소별 상권 밀도 (daiso_density):
+    구의 다이소마다 반경별 편의점/인허가 편의점/폐업 추정 매장 수와
+    최근접 매장/다이소까지의 거리를 쿼리 1회로 계산한다.
+    - 반경 내 후보: ST_DWithin(geometry) → location GiST 인덱스 사용, 거리는 geography(m)로 정확히 계산
+    - 최근접: KNN(<->) 인덱스 정렬로 후보 KNN_CANDIDATES개만 읽고 그중 geography 거리 최소값
+      (경위도 거리와 미터 거리의 순서가 약간 다를 수 있으므로 1개가 아닌 여러 후보 비교)
+    결과는 데이터 버전 기준으로 캐시되어 다음 파이프라인 실행 전까지 재계산하지 않는다.
+
+최근접 다이소 재할당 (assign_nearest_daiso):
+    편의점은 place_id로 upsert되므로 base_daiso/distance는 여러 다이소의 4분면 검색 중
+    마지막으로 저장한 다이소 기준 값이 남는다. 수집 후 구 전체 편의점에 대해
+    KNN(<->) 후보 KNN_CANDIDATES개 중 geography 거리가 가장 가까운 다이소로 UPDATE 1회 재계산한다.
+    (값이 바뀌는 행만 갱신, 추가 API 호출 없음)
+
+사용법:
+    from stores.analytics import refresh_hex_cells, daiso_density, assign_nearest_daiso
+
+    refresh_hex_cells('영등포구')     # 파이프라인 완료 시
+    rows = daiso_density('영등포구')
+    assign_nearest_daiso('영등포구')  # 편의점 수집 직후
+"""
+
+import json
+
+from django.db import connection, transaction
+
+
+# 육각형 변 길이 (미터)
+HEX_RESOLUTIONS = (250, 500, 1000)
+DEFAULT_HEX_RESOLUTION = 500
+
+# 미터 단위 격자/거리 계산용 좌표계 (Korea 2000 / Unified CS)
+METRIC_SRID = 5179
+
+
+HEX_CELLS_SQL = f"""
+WITH points AS (
+    SELECT id, ST_Transform(location, {METRIC_SRID}) AS geom, status, 0 AS licensed
+    FROM store_closure_result
+    WHERE gu = %(gu)s AND location IS NOT NULL
+    UNION ALL
+    SELECT id, ST_Transform(location, {METRIC_SRID}), NULL, 1
+    FROM yeongdeungpo_convenience_license
+    WHERE gu = %(gu)s AND uptaenm = %(license_type)s AND location IS NOT NULL
+),
+bounds AS (
+    SELECT ST_SetSRID(ST_Extent(geom)::geometry, {METRIC_SRID}) AS geom FROM points
+),
+cells AS (
+    SELECT sizes.size, hex.i, hex.j, hex.geom
+    FROM unnest(%(resolutions)s::int[]) AS sizes(size)
+    CROSS JOIN bounds
+    CROSS JOIN LATERAL ST_HexagonGrid(sizes.size, bounds.geom) AS hex
+    WHERE bounds.geom IS NOT NULL
+),
+assigned AS (
+    -- 점마다 크기별로 셀 1개 (경계 위의 점은 (i, j)가 가장 작은 셀)
+    SELECT DISTINCT ON (points.licensed, points.id, cells.size)
+        cells.size, cells.i, cells.j, points.status, points.licensed
+    FROM points
+    JOIN cells ON ST_Intersects(cells.geom, points.geom)
+    ORDER BY points.licensed, points.id, cells.size, cells.i, cells.j
+)
+INSERT INTO hex_cell (
+    gu, resolution, i, j, geom,
+    closure_total, normal_count, closed_count, closure_rate, license_count, refreshed_at
+)
+SELECT
+    %(gu)s, cells.size, cells.i, cells.j, ST_Transform(cells.geom, 4326),
+    COUNT(assigned.status),
+    COUNT(*) FILTER (WHERE assigned.status = %(normal)s),
+    COUNT(*) FILTER (WHERE assigned.status = %(closed)s),
+    COALESCE(ROUND(COUNT(*) FILTER (WHERE assigned.status = %(closed)s) * 100.0 / NULLIF(COUNT(assigned.status), 0), 1), 0),
+    SUM(assigned.licensed),
+    NOW()
+FROM assigned
+JOIN cells ON cells.size = assigned.size AND cells.i = assigned.i AND cells.j = assigned.j
+GROUP BY cells.size, cells.i, cells.j, cells.geom
+"""
+
+
+def refresh_hex_cells(gu, resolutions=HEX_RESOLUTIONS):
+    """
+    구별 육각 격자 집계 재계산 (기존 셀 삭제 후 INSERT ... SELECT 1회)
+
+    Returns:
+        생성된 셀 수 (PostgreSQL 외에는 ST_HexagonGrid가 없으므로 삭제만 하고 0)
+    """
+    from .models import HexCell
+
+    with transaction.atomic():
+        HexCell.objects.filter(gu=gu).delete()
+        if connection.vendor != 'postgresql':
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(HEX_CELLS_SQL, {
+                'gu': gu,
+                'resolutions': list(resolutions),
+                'license_type': '편의점',
+                'normal': '정상',
+                'closed': '폐업',
+            })
+            return cursor.rowcount
+
+
+def hex_cells_geojson(resolution, gu=None):
+    """
+    육각 격자 GeoJSON (gu가 없으면 서울 전체 - 구 경계에 걸친 셀은 합산)
+
+    Returns:
+        {'type': 'FeatureCollection', 'resolution': .., 'features': [...]}
+    """
+    from .models import HexCell
+
+    queryset = HexCell.objects.filter(resolution=resolution)
+    if gu:
+        queryset = queryset.filter(gu=gu)
+
+    cells = {}
+    for cell in queryset.values('i', 'j', 'geom', 'closure_total', 'normal_count', 'closed_count', 'license_count'):
+        key = (cell['i'], cell['j'])
+        if key not in cells:
+            cells[key] = cell
+            continue
+        merged = cells[key]
+        for field in ('closure_total', 'normal_count', 'closed_count', 'license_count'):
+            merged[field] += cell[field]
+
+    features = []
+    for cell in cells.values():
+        total = cell['closure_total']
+        features.append({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Polygon',
+                'coordinates': [[[round(x, 6), round(y, 6)] for x, y in ring] for ring in cell['geom'].coords],
+            },
+            'properties': {
+                'total': total,
+                'normal': cell['normal_count'],
+                'closed': cell['closed_count'],
+                'closure_rate': round(cell['closed_count'] / total * 100, 1) if total else 0,
+                'licenses': cell['license_count'],
+            },
+        })
+
+    return {'type': 'FeatureCollection', 'resolution': resolution, 'features': features}
+
+
+# 다이소 주변 분석 반경 (미터)
+DENSITY_RADII = (250, 500, 1000)
+KNN_CANDIDATES = 5
+# 미터 → 도 (ST_DWithin geometry 후보 검색용)
+# 경도 1도 = 111.32km × cos(위도)라 고위도일수록 짧아지므로 다이소 위치의 위도로 환산한다.
+METERS_PER_DEGREE = 111320
+# 후보 검색 반경 여유 배율 (위도 1도가 경도 1도보다 조금 짧은 것, 타원체 오차 보정)
+SEARCH_MARGIN = 1.1
+
+
+def _search_degrees_sql(center):
+    """
+    center 위치에서 %(search_meters)s 반경을 덮는 도 단위 거리 SQL
+
+    반경만큼 북쪽(경도 1도가 더 짧은 쪽)의 위도 기준으로 환산 (극 부근은 89도로 제한)
+    """
+    return (
+        f"%(search_meters)s * {SEARCH_MARGIN} / ({METERS_PER_DEGREE} * COS(RADIANS("
+        f"LEAST(ABS(ST_Y({center})) + %(search_meters)s / {METERS_PER_DEGREE}.0, 89))))"
+    )
+
+# 대상 집합: (이름, 테이블, 추가 조건)
+DENSITY_TARGETS = (
+    ('convenience', 'yeongdeungpo_convenience', 'TRUE'),
+    ('licensed', 'yeongdeungpo_convenience_license', 'target.uptaenm = %(license_type)s'),
+    ('closed', 'store_closure_result', 'target.status = %(closed)s'),
+)
+
+
+def _density_sql(radii):
+    """다이소별 반경 카운트 + 최근접 거리 SQL (대상 집합마다 LATERAL 2개)"""
+    columns = ['daiso.name', 'daiso.address', 'ST_Y(daiso.location) AS lat', 'ST_X(daiso.location) AS lng']
+    joins = []
+    for name, table, condition in DENSITY_TARGETS:
+        counts = ', '.join(
+            f'COUNT(*) FILTER (WHERE within.distance <= {radius}) AS r{radius}' for radius in radii
+        )
+        columns += [f'{name}_within.r{radius} AS {name}_{radius}' for radius in radii]
+        columns.append(f'{name}_nearest.distance AS {name}_nearest')
+        joins.append(f"""
+LEFT JOIN LATERAL (
+    SELECT {counts}
+    FROM (
+        SELECT ST_Distance(target.location::geography, daiso.location::geography) AS distance
+        FROM {table} AS target
+        WHERE target.location IS NOT NULL AND {condition}
+          AND ST_DWithin(target.location, daiso.location, {_search_degrees_sql('daiso.location')})
+    ) AS within
+) AS {name}_within ON TRUE
+LEFT JOIN LATERAL (
+    SELECT MIN(ST_Distance(candidate.location::geography, daiso.location::geography)) AS distance
+    FROM (
+        SELECT target.location
+        FROM {table} AS target
+        WHERE target.location IS NOT NULL AND {condition}
+        ORDER BY target.location <-> daiso.location
+        LIMIT %(knn)s
+    ) AS candidate
+) AS {name}_nearest ON TRUE""")
+
+    columns.append('daiso_nearest.distance AS daiso_nearest')
+    joins.append("""
+LEFT JOIN LATERAL (
+    SELECT MIN(ST_Distance(candidate.location::geography, daiso.location::geography)) AS distance
+    FROM (
+        SELECT other.location
+        FROM yeongdeungpo_daiso AS other
+        WHERE other.location IS NOT NULL AND other.id <> daiso.id
+        ORDER BY other.location <-> daiso.location
+        LIMIT %(knn)s
+    ) AS candidate
+) AS daiso_nearest ON TRUE""")
+
+    return (
+        f"SELECT {', '.join(columns)}\n"
+        f"FROM yeongdeungpo_daiso AS daiso{''.join(joins)}\n"
+        "WHERE daiso.gu = %(gu)s AND daiso.location IS NOT NULL\n"
+        "ORDER BY daiso.name"
+    )
+
+
+def daiso_density(gu, radii=DENSITY_RADII):
+    """
+    구의 다이소별 상권 밀도 (쿼리 1회)
+
+    Returns:
+        [{'name', 'address', 'lat', 'lng',
+          'convenience': {'250': n, ..., 'nearest_m': m}, 'licensed': {...}, 'closed': {...},
+          'nearest_daiso_m': m}, ...]
+        (PostgreSQL 외에는 geography 거리/KNN이 없으므로 빈 목록)
+    """
+    if connection.vendor != 'postgresql':
+        return []
+    radii = tuple(sorted(int(radius) for radius in radii))
+    with connection.cursor() as cursor:
+        cursor.execute(_density_sql(radii), {
+            'gu': gu,
+            'search_meters': max(radii),
+            'knn': KNN_CANDIDATES,
+            'license_type': '편의점',
+            'closed': '폐업',
+        })
+        names = [column[0] for column in cursor.description]
+        records = [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def meters(value):
+        return round(value, 1) if value is not None else None
+
+    results = []
+    for record in records:
+        row = {
+            'name': record['name'],
+            'address': record['address'],
+            'lat': record['lat'],
+            'lng': record['lng'],
+        }
+        for name, _, _ in DENSITY_TARGETS:
+            row[name] = {str(radius): record[f'{name}_{radius}'] or 0 for radius in radii}
+            row[name]['nearest_m'] = meters(record[f'{name}_nearest'])
+        row['nearest_daiso_m'] = meters(record['daiso_nearest'])
+        results.append(row)
+    return results
+
+
+def daiso_density_json(gu):
+    """/api/daiso-density/ 응답 JSON (캐시 builder)"""
+    return json.dumps({
+        'gu': gu,
+        'radii': list(DENSITY_RADII),
+        'daisos': daiso_density(gu),
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+NEAREST_DAISO_SQL = """
+UPDATE yeongdeungpo_convenience AS store
+SET base_daiso = nearest.name, distance = nearest.distance
+FROM (
+    SELECT convenience.id, closest.name, ROUND(closest.distance)::int AS distance
+    FROM yeongdeungpo_convenience AS convenience
+    CROSS JOIN LATERAL (
+        SELECT candidate.name, candidate.distance
+        FROM (
+            SELECT daiso.name, ST_Distance(daiso.location::geography, convenience.location::geography) AS distance
+            FROM yeongdeungpo_daiso AS daiso
+            WHERE daiso.location IS NOT NULL
+            ORDER BY daiso.location <-> convenience.location
+            LIMIT %(knn)s
+        ) AS candidate
+        ORDER BY candidate.distance
+        LIMIT 1
+    ) AS closest
+    WHERE convenience.gu = %(gu)s AND convenience.location IS NOT NULL
+) AS nearest
+WHERE store.id = nearest.id
+  AND (store.base_daiso IS DISTINCT FROM nearest.name OR store.distance IS DISTINCT FROM nearest.distance)
+"""
+
+
+def assign_nearest_daiso(gu):
+    """
+    구 전체 편의점의 base_daiso/distance를 실제 최근접 다이소 기준으로 재계산 (UPDATE 1회)
+
+    Returns:
+        값이 바뀐 편의점 수 (PostgreSQL 외에는 수집 시 저장한 값을 그대로 두고 0)
+    """
+    if connection.vendor != 'postgresql':
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(NEAREST_DAISO_SQL, {'gu': gu, 'knn': KNN_CANDIDATES})
+        return cursor.rowcount
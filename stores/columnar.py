@@ -0,0 +1,99 @@
+# stores/columnar.py
+"""
+지도 데이터 컬럼형(columnar) 직렬화
+
+행 단위 객체 배열은 수천 건이면 'name', 'address', 'lat' ... 키가 행마다 반복된다.
+컬럼형은 필드별 병렬 배열로 보내고, 값 종류가 적은 필드(status, match_reason 등)는
+사전(dictionary) 인코딩하여 정수 코드만 보낸다.
+좌표는 [lat0, lng0, lat1, lng1, ...] 배열 또는 Float32 바이너리(base64)로 보낸다.
+- Float32 오차는 서울 좌표 기준 1m 미만 (지도 마커 표시용으로 충분)
+
+클라이언트는 templates/columnar_decoder.html의 decodeStores()로 행 배열로 복원한다.
+
+사용법:
+    from .columnar import dumps_stores, payload_format
+
+    fmt = payload_format(request, default=FORMAT_ROWS)
+    body = dumps_stores(rows, fmt, dict_fields=('status', 'match_reason'))
+"""
+
+import base64
+import json
+import sys
+from array import array
+
+
+FORMAT_ROWS = 'rows'                # 기존 객체 배열
+FORMAT_COLUMNAR = 'columnar'        # 병렬 배열 + 사전 인코딩 + 좌표 숫자 배열
+FORMAT_COLUMNAR_F32 = 'columnar-f32'  # 컬럼형 + 좌표 Float32 바이너리(base64)
+
+FORMATS = (FORMAT_ROWS, FORMAT_COLUMNAR, FORMAT_COLUMNAR_F32)
+
+
+def payload_format(request, default=FORMAT_ROWS):
+    """?format= 쿼리 파라미터 (지원하지 않는 값이면 default)"""
+    fmt = request.GET.get('format', default)
+    return fmt if fmt in FORMATS else default
+
+
+def encode_columnar(rows, dict_fields=(), binary_coords=False):
+    """
+    행 배열 → 컬럼형 dict
+
+    Args:
+        rows: [{'lat': .., 'lng': .., 필드: 값, ...}, ...]
+        dict_fields: 사전 인코딩할 필드 (값 종류가 적은 필드)
+        binary_coords: True면 좌표를 Float32 little-endian 바이너리(base64)로 인코딩
+
+    Returns:
+        {'format': 'columnar', 'count': n, 'columns': {...}, 'dicts': {...},
+         'coords': [...] 또는 'coords_f32': 'base64...'}
+    """
+    fields = [key for key in (rows[0] if rows else {}) if key not in ('lat', 'lng')]
+    columns = {}
+    dicts = {}
+
+    for field in fields:
+        values = [row[field] for row in rows]
+        if field in dict_fields:
+            codes = {}
+            columns[field] = [codes.setdefault(value, len(codes)) for value in values]
+            dicts[field] = list(codes)
+        else:
+            columns[field] = values
+
+    payload = {
+        'format': FORMAT_COLUMNAR,
+        'count': len(rows),
+        'columns': columns,
+        'dicts': dicts,
+    }
+
+    if binary_coords:
+        coords = array('f')
+        for row in rows:
+            coords.append(row['lat'])
+            coords.append(row['lng'])
+        if sys.byteorder == 'big':
+            coords.byteswap()
+        payload['coords_f32'] = base64.b64encode(coords.tobytes()).decode('ascii')
+    else:
+        coords = []
+        for row in rows:
+            coords.append(round(row['lat'], 7))
+            coords.append(round(row['lng'], 7))
+        payload['coords'] = coords
+
+    return payload
+
+
+def encode_stores(rows, fmt, dict_fields=()):
+    """형식에 맞게 행 배열 인코딩 (FORMAT_ROWS면 그대로)"""
+    if fmt == FORMAT_ROWS:
+        return rows
+    return encode_columnar(rows, dict_fields, binary_coords=(fmt == FORMAT_COLUMNAR_F32))
+
+
+def dumps_stores(rows, fmt, dict_fields=()):
+    """encode_stores + JSON 직렬화 (한글 깨짐 방지, 공백 제거)"""
+    return json.dumps(encode_stores(rows, fmt, dict_fields), ensure_ascii=False, separators=(',', ':'))
@@ -0,0 +1,115 @@
+# stores/compression.py
+"""
+사전 압축(precompressed) 응답
+
+지도/결과 JSON은 서울 전체 기준 수백 KB~수 MB이고 데이터 버전이 바뀔 때만 달라진다.
+요청마다 GZipMiddleware로 압축하는 대신 페이로드를 생성할 때 gzip/brotli로 한 번만 압축해
+원본과 함께 캐시하고, 요청의 Accept-Encoding에 맞는 사본을 그대로 내려준다.
+
+- brotli 패키지가 없으면 gzip만 생성
+- 작은 페이로드(MIN_COMPRESS_SIZE 미만)는 압축하지 않음
+
+사용법:
+    from .compression import compress_variants, compressed_response
+
+    variants = get_cached_variants('results:rows', gu, build)   # data_cache
+    return compressed_response(request, variants, 'application/json')
+"""
+
+import gzip
+
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+IDENTITY = 'identity'
+GZIP = 'gzip'
+BROTLI = 'br'
+
+# 서버 선호 순서 (압축률 높은 순)
+PREFERRED_ENCODINGS = (BROTLI, GZIP)
+
+# 이보다 작으면 압축 이득보다 헤더/CPU 비용이 큼
+MIN_COMPRESS_SIZE = 1024
+
+GZIP_LEVEL = 9
+# 11은 1MB 기준 수 초가 걸려 캐시 미스 요청이 느려지므로 9 사용
+BROTLI_QUALITY = 9
+
+
+def compress_variants(payload):
+    """
+    페이로드 → 인코딩별 바이트 사본
+
+    Args:
+        payload: str 또는 bytes (str은 UTF-8 인코딩)
+
+    Returns:
+        {'identity': bytes, 'gzip': bytes, 'br': bytes}
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+
+    variants = {IDENTITY: payload}
+    if len(payload) < MIN_COMPRESS_SIZE:
+        return variants
+
+    # mtime=0: 같은 입력이면 같은 바이트 (워커 간 동일 응답)
+    variants[GZIP] = gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0)
+    if brotli is not None:
+        variants[BROTLI] = brotli.compress(payload, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+    return variants
+
+
+def _accepted_encodings(accept_encoding):
+    """Accept-Encoding 헤더 → {인코딩: q값}"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding, available):
+    """
+    클라이언트가 허용하는 인코딩 중 서버 선호 순서로 선택
+
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+        available: 준비된 인코딩 목록
+
+    Returns:
+        'br' / 'gzip' / 'identity'
+    """
+    accepted = _accepted_encodings(accept_encoding or '')
+    for encoding in PREFERRED_ENCODINGS:
+        if encoding in available and accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return IDENTITY
+
+
+def compressed_response(request, variants, content_type):
+    """Accept-Encoding에 맞는 사본으로 HttpResponse 생성 (요청 시점에는 압축하지 않음)"""
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''), variants)
+    response = HttpResponse(variants[encoding], content_type=content_type)
+    if encoding != IDENTITY:
+        response['Content-Encoding'] = encoding
+    if len(variants) > 1:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    return response
@@ -0,0 +1,118 @@
+# stores/coordinates.py
+"""
+인허가 TM 좌표 → WGS84 배치 변환
+
+서울시 LOCALDATA API의 X, Y는 TM 좌표(EPSG:5174) 문자열이다.
+행마다 float 변환 → transformer.transform → Point 생성을 반복하면
+전체 인허가 적재에서 좌표 변환만 수 초가 걸렸다.
+페이지(수집 결과) 단위로
+1. X/Y 문자열을 numpy 배열로 한 번에 숫자 변환 (빈 값/형식 오류는 NaN 마스크, 예외 없음,
+   지수 표기 등 드문 형식만 행별 float())
+2. 유효한 좌표만 pyproj 1회 호출로 변환
+3. 위치는 EWKB(SRID 포함 WKB) 구조체 배열 하나로 만든 뒤 행별 memoryview로 나눈다.
+   (GeometryField에 memoryview를 넣으면 저장 시 WKB reader로 바로 읽음, Point 생성 없음)
+
+사용법:
+    from stores.coordinates import tm_rows_to_wgs84
+
+    for store, (latitude, longitude, location) in zip(stores, tm_rows_to_wgs84(stores)):
+        ...  # 좌표가 없거나 변환 실패면 (None, None, None)
+"""
+
+import numpy as np
+from pyproj import Transformer
+
+
+# 서울시 OpenAPI 좌표계: Korea 1985 / Central Belt (EPSG:5174)
+TM_CRS = 'EPSG:5174'
+WGS84_SRID = 4326
+
+_transformer = Transformer.from_crs(TM_CRS, f'EPSG:{WGS84_SRID}', always_xy=True)
+
+# EWKB Point (little endian): byte order(1) + type|SRID 플래그(4) + SRID(4) + x(8) + y(8) = 25바이트
+EWKB_POINT = np.dtype([('order', 'u1'), ('type', '<u4'), ('srid', '<u4'), ('x', '<f8'), ('y', '<f8')])
+EWKB_POINT_TYPE = 0x20000001
+
+
+def parse_coordinates(values):
+    """
+    좌표 문자열 배열 → float64 배열
+
+    앞뒤 공백은 무시하고, 빈 값/None/숫자가 아닌 값/무한대는 NaN
+    부호('+'/'-')와 '.' 하나씩만 있는 십진수는 배열로 한 번에 변환하고,
+    그 외 값('1.97E+05' 등 지수 표기)만 행별 float()로 변환 (예외가 나지 않음)
+    """
+    text = np.strings.strip(np.array(['' if value is None else str(value) for value in values], dtype=np.str_))
+    unsigned = np.strings.lstrip(text, '+-')
+    digits = np.strings.replace(unsigned, '.', '', count=1)
+    numeric = (
+        np.strings.isdecimal(digits) & (np.strings.str_len(digits) > 0)
+        & (np.strings.str_len(text) - np.strings.str_len(unsigned) <= 1)
+    )
+
+    result = np.full(text.shape, np.nan, dtype=np.float64)
+    result[numeric] = text[numeric].astype(np.float64)
+    for index in np.flatnonzero(~numeric & (np.strings.str_len(text) > 0)).tolist():
+        try:
+            number = float(text[index])
+        except ValueError:
+            continue
+        if np.isfinite(number):
+            result[index] = number
+    return result
+
+
+def tm_to_wgs84(xs, ys):
+    """
+    TM 좌표 배열 → (위도 배열, 경도 배열, 유효 마스크)
+
+    유효하지 않은 좌표(파싱 실패, 0, 변환 결과가 무한대)는 마스크 False, 위경도 NaN
+    """
+    x = parse_coordinates(xs)
+    y = parse_coordinates(ys)
+    lons = np.full(x.shape, np.nan)
+    lats = np.full(x.shape, np.nan)
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    if valid.any():
+        lons[valid], lats[valid] = _transformer.transform(x[valid], y[valid])
+    valid &= np.isfinite(lons) & np.isfinite(lats) & (lons != 0) & (lats != 0)
+    lons[~valid] = np.nan
+    lats[~valid] = np.nan
+    return lats, lons, valid
+
+
+def points_ewkb(lons, lats, valid, srid=WGS84_SRID):
+    """
+    경도/위도 배열 → 행별 EWKB memoryview 리스트 (유효하지 않은 행은 None)
+
+    구조체 배열을 한 번에 직렬화하고 25바이트씩 잘라 쓰므로 행별 복사가 없다.
+    """
+    records = np.zeros(len(valid), dtype=EWKB_POINT)
+    records['order'] = 1
+    records['type'] = EWKB_POINT_TYPE
+    records['srid'] = srid
+    records['x'] = lons
+    records['y'] = lats
+
+    buffer = memoryview(records.tobytes())
+    size = EWKB_POINT.itemsize
+    return [
+        buffer[index * size:(index + 1) * size] if is_valid else None
+        for index, is_valid in enumerate(valid.tolist())
+    ]
+
+
+def tm_rows_to_wgs84(rows, x_key='X', y_key='Y'):
+    """
+    OpenAPI 행 목록의 TM 좌표를 한 번에 변환
+
+    Returns:
+        행마다 (latitude, longitude, location EWKB) 튜플, 변환 불가면 (None, None, None)
+    """
+    lats, lons, valid = tm_to_wgs84([row.get(x_key) for row in rows], [row.get(y_key) for row in rows])
+    locations = points_ewkb(lons, lats, valid)
+    return [
+        (lat, lon, location) if location is not None else (None, None, None)
+        for lat, lon, location in zip(lats.tolist(), lons.tolist(), locations)
+    ]
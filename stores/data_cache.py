@@ -0,0 +1,162 @@
+# stores/data_cache.py
+"""
+구별 데이터 버전 + 응답 페이로드 캐시
+
+- 데이터는 파이프라인(수집 작업 / run_all)이 끝날 때만 바뀌므로
+  구별 데이터 버전(counter)을 두고, 파이프라인 종료 시 버전을 올린다.
+- 뷰는 직렬화된 JSON 페이로드를 (이름, 구, 버전) 키로 캐시한다.
+- 버전 정보는 캐시에만 저장되므로 ETag/Last-Modified 계산과 304 응답,
+  캐시 적중 시에는 DB 조회가 전혀 발생하지 않는다.
+
+사용법:
+    from .data_cache import bump_data_version, get_cached_payload
+
+    bump_data_version('영등포구')                      # 파이프라인 종료 시
+    payload = get_cached_payload('results', gu, build)  # 뷰에서
+    variants = get_cached_variants('results', gu, build)  # gzip/br 사전 압축본 포함
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+
+from .compression import compress_variants
+
+
+# 전체 구를 대상으로 하는 뷰(map_view, store_closure_map_view)용 버전 키
+ALL_GU = '__all__'
+
+VERSION_KEY = 'data_version:{gu}'
+# 마지막으로 데이터가 갱신된 구 (get_results 기본 대상)
+LAST_GU_KEY = 'data_version:last_gu'
+PAYLOAD_KEY = 'payload:{name}:{gu}:{version}'
+
+# 페이로드는 버전이 바뀌면 자연히 무효화되므로 넉넉하게 유지 (1일)
+PAYLOAD_TIMEOUT = 60 * 60 * 24
+
+
+def _gu_key(gu):
+    """캐시 키/ETag용 구 식별자 (한글은 헤더에 쓸 수 없으므로 해시 사용)"""
+    if gu == ALL_GU:
+        return ALL_GU
+    return hashlib.md5(str(gu).encode('utf-8')).hexdigest()[:12]
+
+
+def get_data_version(gu=ALL_GU):
+    """
+    구별 데이터 버전 조회
+
+    Returns:
+        {'version': int, 'updated_at': float(epoch seconds)}
+    """
+    key = VERSION_KEY.format(gu=_gu_key(gu))
+    info = cache.get(key)
+    if info is None:
+        # 캐시가 비어 있으면 (서버 재시작, 캐시 삭제 등) 현재 시각 기준으로 초기화
+        # 이전에 발급한 ETag와 겹치지 않도록 밀리초 타임스탬프를 버전으로 사용
+        now = time.time()
+        cache.add(key, {'version': int(now * 1000), 'updated_at': now}, None)
+        info = cache.get(key) or {'version': int(now * 1000), 'updated_at': now}
+    return info
+
+
+def bump_data_version(gu):
+    """
+    구별 데이터 버전 증가 (파이프라인 종료 시 호출)
+
+    해당 구와 전체(ALL_GU) 버전을 함께 올려 관련 캐시를 모두 무효화한다.
+    """
+    now = time.time()
+    for target in (gu, ALL_GU):
+        key = VERSION_KEY.format(gu=_gu_key(target))
+        previous = cache.get(key) or {'version': 0}
+        version = max(previous['version'] + 1, int(now * 1000))
+        cache.set(key, {'version': version, 'updated_at': now}, None)
+    cache.set(LAST_GU_KEY, gu, None)
+
+
+def get_last_updated_gu(default=None):
+    """마지막으로 bump_data_version이 호출된 구 (없으면 default)"""
+    return cache.get(LAST_GU_KEY, default)
+
+
+def get_cached_payload(name, gu, builder):
+    """
+    현재 데이터 버전 기준으로 캐시된 페이로드 반환 (없으면 builder()로 생성 후 저장)
+
+    Args:
+        name: 페이로드 이름 (예: 'results', 'closure_map')
+        gu: 구 이름 또는 ALL_GU
+        builder: 페이로드 생성 함수 (DB 조회 + 직렬화)
+    """
+    version = get_data_version(gu)['version']
+    key = PAYLOAD_KEY.format(name=name, gu=_gu_key(gu), version=version)
+    payload = cache.get(key)
+    if payload is None:
+        payload = builder()
+        cache.set(key, payload, PAYLOAD_TIMEOUT)
+    return payload
+
+
+def get_cached_variants(name, gu, builder):
+    """
+    get_cached_payload와 같되 인코딩별 사전 압축본을 함께 캐시
+
+    압축은 페이로드 생성 시 한 번만 수행된다. (compression.compressed_response로 응답)
+
+    Returns:
+        {'identity': bytes, 'gzip': bytes, 'br': bytes}
+    """
+    return get_cached_payload(f'{name}:encoded', gu, lambda: compress_variants(builder()))
+
+
+def version_etag(name, gu):
+    """
+    ETag 값 (django.views.decorators.http.condition의 etag_func용)
+
+    같은 데이터 버전을 br/gzip/identity 사본으로 내려주므로 바이트 단위로 같음을 뜻하는
+    강한 ETag가 아닌 약한 ETag(W/)로 발급한다. (If-None-Match는 약한 비교라 304는 그대로 동작)
+    """
+    return f'W/"{name}-{_gu_key(gu)}-{get_data_version(gu)["version"]}"'
+
+
+def version_last_modified(gu):
+    """Last-Modified 값 (condition의 last_modified_func용)"""
+    updated_at = get_data_version(gu)['updated_at']
+    return datetime.fromtimestamp(int(updated_at), tz=timezone.utc)
+
+
+# 파일 기반 페이로드 (프로세스 메모리, 파일 mtime/크기가 바뀌면 재생성)
+_file_payloads = {}
+_file_payloads_lock = threading.Lock()
+
+
+def get_file_payload(path, builder):
+    """
+    파일 내용으로 만든 페이로드를 파일 mtime 기준으로 메모리에 캐시
+
+    Args:
+        path: 원본 파일 경로 (없으면 None 반환)
+        builder: builder(path) → 페이로드 (파일 파싱 + 직렬화)
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_payloads.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    with _file_payloads_lock:
+        cached = _file_payloads.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        payload = builder(path)
+        _file_payloads[path] = (key, payload)
+    return payload
@@ -0,0 +1,152 @@
+# stores/events.py
+"""
+수집 진행 이벤트 버스 (Server-Sent Events용)
+
+수집 작업(stores/jobs.py)의 진행률/단계 전환/로그를 이벤트로 발행하고,
+SSE 엔드포인트(/api/events/)는 새 이벤트가 생길 때까지 Condition으로 대기한다.
+- 대기 중에는 CPU를 쓰지 않음 (폴링 없음)
+- 최근 이벤트를 링 버퍼에 보관하여 재연결 시 Last-Event-ID 이후부터 이어서 전송
+- SSE id는 '{프로세스 epoch}-{번호}' 형식: uvicorn --workers N에서 재연결이 다른 워커로 가면
+  epoch가 달라 이어받기 불가로 판단하고 스냅샷부터 다시 보냄 (이벤트 누락/중복 방지)
+- ASGI(uvicorn)에서는 wait_async로 이벤트 루프 Future를 대기 (연결마다 스레드를 잡지 않음)
+
+사용법:
+    from .events import event_bus
+
+    event_bus.publish('log', {'level': 'INFO', 'message': '...'})
+    events = event_bus.wait(last_id, timeout=15)
+    events = await event_bus.wait_async(last_id, timeout=15)   # async 뷰/스트림
+    last_id = event_bus.parse_event_id(request.headers.get('Last-Event-ID'))  # 다른 프로세스 id면 None
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+from collections import deque
+
+
+class EventBus:
+    """
+    프로세스 내 이벤트 버스
+
+    이벤트는 단조 증가하는 id를 가지며 최근 max_events개만 보관한다.
+    id 번호는 프로세스마다 따로 증가하므로 외부(SSE)에는 epoch를 붙인 문자열로 내보낸다.
+    """
+
+    def __init__(self, max_events: int = 500):
+        """
+        Args:
+            max_events: 재연결 시 이어받기를 위해 보관할 최근 이벤트 수
+        """
+        self._events = deque(maxlen=max_events)
+        self._condition = threading.Condition()
+        self._last_id = 0
+        # 프로세스(버스) 식별자 - 재시작/다른 워커의 id와 구분
+        self.epoch = uuid.uuid4().hex[:12]
+        # wait_async 대기자 (이벤트 루프, Future) - publish가 다른 스레드에서 깨움
+        self._async_waiters = set()
+
+    @property
+    def last_id(self) -> int:
+        """마지막으로 발행된 이벤트 id"""
+        return self._last_id
+
+    def publish(self, event_type: str, data: dict) -> int:
+        """
+        이벤트 발행 후 대기 중인 구독자를 모두 깨움
+
+        Returns:
+            발행된 이벤트 id
+        """
+        with self._condition:
+            self._last_id += 1
+            self._events.append({'id': self._last_id, 'event': event_type, 'data': data})
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, set()
+            event_id = self._last_id
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # 이미 종료된 이벤트 루프
+        return event_id
+
+    def format_event_id(self, event_id: int) -> str:
+        """SSE id 문자열 ('{epoch}-{번호}')"""
+        return f'{self.epoch}-{event_id}'
+
+    def parse_event_id(self, value):
+        """
+        SSE id 문자열 → 이벤트 번호
+
+        이 버스가 발행한 id가 아니면(다른 워커 프로세스, 서버 재시작, 형식 오류) None
+        """
+        epoch, _, number = str(value or '').rpartition('-')
+        if epoch != self.epoch or not number.isdigit():
+            return None
+        return int(number)
+
+    def can_resume(self, last_id: int) -> bool:
+        """
+        last_id 이후 이벤트를 빠짐없이 이어서 보낼 수 있는지 여부
+
+        버퍼에서 이미 밀려난 이벤트가 있거나, 서버 재시작으로 id가 초기화된 경우 False
+        """
+        with self._condition:
+            if last_id > self._last_id:
+                return False
+            if not self._events:
+                return True
+            return last_id >= self._events[0]['id'] - 1
+
+    def wait(self, last_id: int, timeout: float = 15.0) -> list:
+        """
+        last_id 이후 이벤트가 생길 때까지 대기 (최대 timeout초)
+
+        Returns:
+            last_id 이후 이벤트 리스트 (타임아웃 시 빈 리스트)
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._last_id > last_id, timeout)
+            return [event for event in self._events if event['id'] > last_id]
+
+    async def wait_async(self, last_id: int, timeout: float = 15.0) -> list:
+        """
+        wait의 asyncio 버전 (스레드를 점유하지 않고 이벤트 루프에서 대기)
+
+        Returns:
+            last_id 이후 이벤트 리스트 (타임아웃 시 빈 리스트)
+        """
+        loop = asyncio.get_running_loop()
+        with self._condition:
+            if self._last_id > last_id:
+                return [event for event in self._events if event['id'] > last_id]
+            waiter = (loop, loop.create_future())
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+        with self._condition:
+            return [event for event in self._events if event['id'] > last_id]
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+
+def format_sse(event: dict, bus=None) -> str:
+    """이벤트를 SSE 와이어 포맷으로 변환 (id는 bus의 epoch를 붙인 문자열)"""
+    data = json.dumps(event['data'], ensure_ascii=False)
+    event_id = (bus or event_bus).format_event_id(event['id'])
+    return f"id: {event_id}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+# 웹 프로세스 전역 이벤트 버스
+event_bus = EventBus()
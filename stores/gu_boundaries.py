@@ -0,0 +1,202 @@
+# stores/gu_boundaries.py
+"""
+좌표 기반 구(gu) 판별
+
+수집기는 주소 문자열에 구 이름이 들어 있는지(target_gu in address)로 구를 판별해
+주소가 비었거나 표기가 다른 매장은 잘못 분류되고, 경계 부근 매장은 누락됐다.
+구 경계 폴리곤(GuBoundary)으로 좌표를 직접 판별한다.
+
+- Python 배치 판별: GuClassifier.classify(lngs, lats)
+    폴리곤을 변(edge) 배열과 bbox로 한 번 준비(prepare)해 두고
+    numpy 광선 교차(ray casting)로 점 배열 전체를 구별로 한 번에 판별
+    (bbox 밖 점은 교차 계산 생략, 이미 판별된 점은 다음 구에서 제외)
+- DB 행 판별: annotate_boundary_gu(queryset)
+    GuBoundary.boundary(GiST 인덱스)에 ST_Contains 서브쿼리
+
+폴리곤이 없는 좌표(서울 밖)와 경계선에서 BOUNDARY_TOLERANCE 이내인 좌표는 None
+→ 호출 측에서 주소 판별로 대체한다. (경계 폴리곤은 근사치라 경계 부근에서는 주소가 더 정확)
+
+사용법:
+    from stores.gu_boundaries import get_gu_classifier
+
+    gus = get_gu_classifier().classify_items(documents)        # 카카오 결과 (x=경도, y=위도)
+    qs = annotate_boundary_gu(YeongdeungpoConvenience.objects.filter(gu='영등포구'))
+"""
+
+import numpy as np
+from django.db.models import OuterRef, Subquery
+
+from .gu_boundary_data import SEOUL_GU_BOUNDARIES
+
+
+# 경계선 근처 판별 보류 거리 (도, 약 100m) - 근사 폴리곤 오차보다 크게
+BOUNDARY_TOLERANCE = 0.001
+
+
+class GuClassifier:
+    """구 경계 폴리곤 준비 + 점 배열 배치 판별"""
+
+    def __init__(self, boundaries, tolerance=BOUNDARY_TOLERANCE):
+        """
+        Args:
+            boundaries: {'구 이름': [(경도, 위도), ...]} 외곽 링 좌표
+                또는 [('구 이름', 링), ...] (MultiPolygon은 폴리곤마다 한 항목, 같은 이름 반복 가능)
+            tolerance: 경계선에서 이 거리(도) 이내인 점은 None (0이면 폴리곤 그대로 판별)
+        """
+        self.tolerance = tolerance
+        if isinstance(boundaries, dict):
+            boundaries = boundaries.items()
+        self.names = []
+        self._bboxes = []
+        self._edges = []
+        for name, ring in boundaries:
+            self.names.append(name)
+            coords = np.asarray(ring, dtype=np.float64)
+            if not np.array_equal(coords[0], coords[-1]):
+                coords = np.vstack([coords, coords[:1]])
+            self._bboxes.append((*coords.min(axis=0), *coords.max(axis=0)))
+            # 변 (x1, y1) → (x2, y2), 브로드캐스트용 (1, E) 배열
+            self._edges.append(tuple(column[np.newaxis, :] for column in (
+                coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1]
+            )))
+
+    @classmethod
+    def from_static(cls, **kwargs):
+        """gu_boundary_data 폴리곤으로 생성 (DB 불필요)"""
+        return cls({gu: info['boundary'] for gu, info in SEOUL_GU_BOUNDARIES.items()}, **kwargs)
+
+    @classmethod
+    def from_db(cls, **kwargs):
+        """GuBoundary 행으로 생성 (행이 없으면 None)"""
+        from .models import GuBoundary
+
+        boundaries = [
+            (row.gu, polygon.exterior_ring.coords)
+            for row in GuBoundary.objects.order_by('gu')
+            for polygon in row.boundary
+        ]
+        return cls(boundaries, **kwargs) if boundaries else None
+
+    def classify(self, lngs, lats):
+        """
+        Args:
+            lngs, lats: 경도/위도 시퀀스 (같은 길이, None/NaN은 판별 불가)
+
+        Returns:
+            점마다 구 이름 또는 None 리스트 (경계선 tolerance 이내도 None)
+        """
+        x = np.asarray(lngs, dtype=np.float64).reshape(-1)
+        y = np.asarray(lats, dtype=np.float64).reshape(-1)
+        # -1: 미판별, -2: 경계선 근처 (판별 보류, 다음 구에서도 제외)
+        result = np.full(x.shape, -1, dtype=np.int64)
+
+        for index, ((min_x, min_y, max_x, max_y), (x1, y1, x2, y2)) in enumerate(zip(self._bboxes, self._edges)):
+            candidates = np.flatnonzero(
+                (result == -1) & (x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)
+            )
+            if candidates.size == 0:
+                continue
+            px = x[candidates, np.newaxis]
+            py = y[candidates, np.newaxis]
+            # 점에서 +x 방향 광선이 변과 교차하는 횟수가 홀수면 내부
+            straddles = (y1 > py) != (y2 > py)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cross_x = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+            inside = np.count_nonzero(straddles & (px < cross_x), axis=1) % 2 == 1
+            result[candidates[inside]] = index
+            if self.tolerance > 0 and inside.any():
+                near = _edge_distance(px[inside], py[inside], x1, y1, x2, y2) < self.tolerance
+                result[candidates[inside][near]] = -2
+
+        return [self.names[index] if index >= 0 else None for index in result]
+
+    def classify_items(self, items, lng_key='x', lat_key='y'):
+        """카카오 documents 등 dict 리스트 판별 (좌표 없는 항목은 None)"""
+        lngs = [_to_float(item.get(lng_key)) for item in items]
+        lats = [_to_float(item.get(lat_key)) for item in items]
+        return self.classify(lngs, lats)
+
+    def gu_of(self, lng, lat):
+        """점 1개 판별"""
+        return self.classify([lng], [lat])[0]
+
+
+def _edge_distance(px, py, x1, y1, x2, y2):
+    """(P, 1) 점 배열과 (1, E) 변 배열 → 점마다 가장 가까운 변까지 거리 (P,)"""
+    dx = x2 - x1
+    dy = y2 - y1
+    length2 = dx * dx + dy * dy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(length2 > 0, ((px - x1) * dx + (py - y1) * dy) / length2, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    return np.sqrt(np.min((x1 + t * dx - px) ** 2 + (y1 + t * dy - py) ** 2, axis=1))
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+# 프로세스 단위 캐시 (reset_gu_classifier로 초기화)
+_classifier = None
+
+
+def get_gu_classifier():
+    """GuBoundary 기준 판별기 (테이블이 비어 있으면 gu_boundary_data 폴리곤)"""
+    global _classifier
+    if _classifier is None:
+        _classifier = GuClassifier.from_db() or GuClassifier.from_static()
+    return _classifier
+
+
+def reset_gu_classifier():
+    """GuBoundary 변경 후 판별기 캐시 초기화"""
+    global _classifier
+    _classifier = None
+
+
+def load_gu_boundaries(model=None):
+    """
+    gu_boundary_data 폴리곤을 GuBoundary 테이블에 적재 (구 이름 기준 upsert)
+
+    Args:
+        model: 마이그레이션에서는 apps.get_model('stores', 'GuBoundary')
+
+    Returns:
+        적재된 구 수
+    """
+    from django.contrib.gis.geos import MultiPolygon, Polygon
+
+    if model is None:
+        from .models import GuBoundary as model
+
+    # 0017 시점 모델은 PolygonField, 0022 이후는 MultiPolygonField
+    multi = model._meta.get_field('boundary').geom_type == 'MULTIPOLYGON'
+    for gu, info in SEOUL_GU_BOUNDARIES.items():
+        boundary = Polygon(info['boundary'], srid=4326)
+        if multi:
+            boundary = MultiPolygon(boundary, srid=4326)
+        model.objects.update_or_create(
+            gu=gu,
+            defaults={'area_km2': info['area_km2'], 'boundary': boundary},
+        )
+    reset_gu_classifier()
+    return len(SEOUL_GU_BOUNDARIES)
+
+
+def annotate_boundary_gu(queryset, field='location'):
+    """
+    행의 좌표(field)를 포함하는 구 이름을 boundary_gu로 주석 (SQL ST_Contains, 없으면 NULL)
+
+    예: 저장된 gu와 좌표 기준 구가 다른 행
+        annotate_boundary_gu(qs).exclude(boundary_gu=F('gu'))
+    """
+    from .models import GuBoundary
+
+    return queryset.annotate(
+        boundary_gu=Subquery(
+            GuBoundary.objects.filter(boundary__contains=OuterRef(field)).values('gu')[:1]
+        )
+    )
@@ -0,0 +1,157 @@
+# stores/history.py
+"""
+폐업 검증 상태 변경 이력 (StoreClosureHistory)
+
+StoreClosureResult는 place_id별 최신 상태만 유지하므로 "언제 폐업으로 바뀌었는가"를 알 수 없다.
+검증이 끝날 때마다 결과 테이블과 매장별 최신 이력을 비교해
+상태 또는 매칭 이유가 바뀐 매장만 INSERT ... SELECT 1회로 이력에 추가한다.
+(매일 실행해도 변경된 매장 수만큼만 행이 늘어남)
+
+- 최신 이력 조회: (place_id, changed_at DESC) 인덱스 LATERAL LIMIT 1
+  (PostgreSQL 외에는 같은 조건의 상관 서브쿼리 조회 + bulk_create)
+- 기간 조회(신규 폐업/추이): (gu, changed_at) 인덱스 범위 스캔
+
+사용법:
+    from stores.history import record_closure_history, newly_changed, status_trend
+
+    record_closure_history('영등포구')                  # check_store_closure 완료 시
+    rows = newly_changed('영등포구', since, status='폐업')  # 지난주 이후 신규 폐업
+"""
+
+import json
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+CLOSED = '폐업'
+
+RECORD_HISTORY_SQL = """
+INSERT INTO store_closure_history (place_id, gu, status, previous_status, match_flags, changed_at)
+SELECT result.place_id, result.gu, result.status, latest.status, result.match_flags, %(changed_at)s
+FROM store_closure_result AS result
+LEFT JOIN LATERAL (
+    SELECT history.status, history.match_flags
+    FROM store_closure_history AS history
+    WHERE history.place_id = result.place_id
+    ORDER BY history.changed_at DESC, history.id DESC
+    LIMIT 1
+) AS latest ON TRUE
+WHERE result.gu = %(gu)s
+  AND (latest.status IS NULL OR latest.status <> result.status OR latest.match_flags <> result.match_flags)
+"""
+
+
+def record_closure_history(gu, changed_at=None):
+    """
+    구의 현재 검증 결과 중 직전 이력과 상태/매칭 이유가 다른 매장만 이력에 추가
+
+    Returns:
+        추가된 이력 수
+    """
+    changed_at = changed_at or timezone.now()
+    if connection.vendor != 'postgresql':
+        return _record_closure_history_orm(gu, changed_at)
+    with connection.cursor() as cursor:
+        cursor.execute(RECORD_HISTORY_SQL, {'gu': gu, 'changed_at': changed_at})
+        return cursor.rowcount
+
+
+def _record_closure_history_orm(gu, changed_at):
+    """LATERAL이 없는 DB(SpatiaLite 프로필)용: 매장별 최신 이력을 서브쿼리로 비교 후 bulk_create"""
+    from .models import StoreClosureHistory, StoreClosureResult
+
+    latest = StoreClosureHistory.objects.filter(place_id=OuterRef('place_id')).order_by('-changed_at', '-id')
+    rows = (
+        StoreClosureResult.objects.filter(gu=gu)
+        .annotate(
+            latest_status=Subquery(latest.values('status')[:1]),
+            latest_flags=Subquery(latest.values('match_flags')[:1]),
+        )
+        .filter(
+            Q(latest_status__isnull=True)
+            | ~Q(latest_status=F('status'))
+            | ~Q(latest_flags=F('match_flags'))
+        )
+        .order_by()
+        .values('place_id', 'status', 'match_flags', 'latest_status')
+    )
+    created = StoreClosureHistory.objects.bulk_create([
+        StoreClosureHistory(
+            place_id=row['place_id'], gu=gu, status=row['status'], previous_status=row['latest_status'],
+            match_flags=row['match_flags'], changed_at=changed_at,
+        )
+        for row in rows
+    ])
+    return len(created)
+
+
+def newly_changed(gu, since, status=CLOSED):
+    """
+    since 이후 status로 바뀐 매장 (최초 관측은 제외)
+
+    Returns:
+        [{'place_id', 'name', 'address', 'previous_status', 'match_reason', 'changed_at'}, ...] 최신순
+    """
+    from .models import StoreClosureHistory, StoreClosureResult
+
+    rows = list(
+        StoreClosureHistory.objects.filter(gu=gu, changed_at__gte=since, status=status)
+        .exclude(previous_status__isnull=True)
+        .exclude(previous_status=status)
+        .order_by('-changed_at')
+        .values('place_id', 'previous_status', 'match_flags', 'changed_at')
+    )
+    names = {
+        result['place_id']: result
+        for result in StoreClosureResult.objects.filter(
+            gu=gu, place_id__in=[row['place_id'] for row in rows]
+        ).values('place_id', 'name', 'address')
+    }
+    for row in rows:
+        result = names.get(row['place_id'], {})
+        row['name'] = result.get('name', '')
+        row['address'] = result.get('address', '')
+        row['match_reason'] = StoreClosureResult.reason_label(row.pop('match_flags'))
+    return rows
+
+
+def status_trend(gu, since):
+    """
+    일자별 상태 전환 수 (최초 관측 제외)
+
+    Returns:
+        [{'date': 'YYYY-MM-DD', '폐업': n, '정상': n}, ...] 날짜순
+    """
+    from .models import StoreClosureHistory
+
+    counts = (
+        StoreClosureHistory.objects.filter(gu=gu, changed_at__gte=since, previous_status__isnull=False)
+        .annotate(date=TruncDate('changed_at'))
+        .values('date', 'status')
+        .annotate(count=Count('id'))
+        .order_by('date')
+    )
+    trend = {}
+    for row in counts:
+        day = trend.setdefault(row['date'].isoformat(), {'date': row['date'].isoformat()})
+        day[row['status']] = row['count']
+    return list(trend.values())
+
+
+def closure_history_json(gu, days):
+    """/api/closure-history/ 응답 JSON (캐시 builder)"""
+    since = timezone.now() - timedelta(days=days)
+    closed = newly_changed(gu, since, CLOSED)
+    for row in closed:
+        row['changed_at'] = row['changed_at'].isoformat()
+    return json.dumps({
+        'gu': gu,
+        'days': days,
+        'since': since.isoformat(),
+        'newly_closed': closed,
+        'trend': status_trend(gu, since),
+    }, ensure_ascii=False, separators=(',', ':'))
@@ -0,0 +1,688 @@
+# stores/jobs.py
+"""
+수집 작업 큐 (CollectionJob)
+
+웹 요청은 작업을 등록(enqueue)하고 상태를 조회만 한다.
+실제 파이프라인은 collect_worker 커맨드(또는 웹 프로세스 내장 워커)가
+SELECT ... FOR UPDATE SKIP LOCKED로 작업을 하나씩 가져가 실행한다.
+- 워커 프로세스/호스트를 늘리면 여러 구를 동시에 수집
+- 진행률/단계/metrics를 DB에 저장하므로 재시작 후에도 상태 유지
+- heartbeat가 끊긴 작업(워커 비정상 종료)은 다른 워커가 다시 가져감
+- 워커의 이벤트는 Postgres NOTIFY로 웹 프로세스의 EventBus(SSE)에 전달
+- 사용자가 입력한 API 키는 DB에 저장하지 않고 작업 id 키의 단기 캐시 항목으로만 전달
+  (워커가 작업을 가져갈 때 꺼내고 바로 삭제, 만료되면 워커의 환경변수 키 사용)
+
+사용법:
+    from stores.jobs import enqueue_job
+
+    job = enqueue_job('영등포구', {'kakao_api_key': ..., 'seoul_api_key': ...})
+
+    python manage.py collect_worker            # 별도 프로세스에서 작업 처리
+
+전국 배치는 enqueue_regions()로 지역 레지스트리(stores/regions.py) 전체를 과거 실행 시간 기준
+LPT 샤드로 나눠 등록하고, 워커는 collect_worker --shard N으로 자기 샤드부터 처리한다.
+"""
+
+import json
+import os
+import select
+import socket
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, close_old_connections, connection, connections, transaction
+from django.db.models import Case, Q, When
+from django.utils import timezone
+
+from .data_cache import bump_data_version
+from .events import event_bus
+from .models import CollectionJob
+
+
+# 이 시간 동안 heartbeat가 없으면 워커가 죽은 것으로 보고 작업을 다시 대기열에 노출 (초)
+STALE_JOB_SECONDS = 600
+# 실행 중인 작업의 heartbeat 갱신 주기 (초)
+HEARTBEAT_SECONDS = 30
+# 워커 → 웹 프로세스 이벤트 전달 채널 (Postgres LISTEN/NOTIFY)
+EVENT_CHANNEL = 'collection_events'
+# pg_notify payload 한도(8000 bytes)를 넘는 이벤트는 NOTIFY 생략 (DB 상태로 조회 가능)
+MAX_NOTIFY_BYTES = 7500
+# 작업별 API 키 캐시 (대기 중에만 보관, 워커가 가져가면 삭제)
+API_KEYS_CACHE_PREFIX = 'collection_job_api_keys'
+API_KEYS_TTL_SECONDS = 3600
+
+STAGES = ('daiso', 'convenience', 'restaurant', 'tobacco', 'closure')
+ACTIVE_STATUSES = (CollectionJob.STATUS_QUEUED, CollectionJob.STATUS_RUNNING)
+
+# 이벤트 발신자 식별 (자기 자신이 보낸 NOTIFY는 다시 발행하지 않음)
+WORKER_ID = f'{socket.gethostname()}:{os.getpid()}'
+
+
+def initial_metrics():
+    """작업 시작 시 metrics 초기값 (개발자 모니터링 대시보드 구조)"""
+    return {
+        'start_time': time.time(),
+        'end_time': None,
+        'elapsed_seconds': 0,
+        'stages': {
+            stage: {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0}
+            for stage in STAGES
+        },
+        'api_calls': {'kakao': 0, 'seoul': 0, 'daiso': 0, 'total': 0},
+        'data_quality': {
+            'duplicates_removed': 0,
+            'coords_missing': 0,
+            'address_mismatch': 0,
+            'total_records': 0,
+            'coord_accuracy_avg': 0
+        },
+        'cross_validation': {
+            'restaurant_match': 0,
+            'tobacco_match': 0,
+            'csv_match': 0,
+            'normal': 0,
+            'closed': 0,
+            'total': 0
+        },
+        'logs': [],
+        'quadrants': []
+    }
+
+
+def job_status_payload(job):
+    """진행 상태 요약 (check_status 응답 / status 이벤트 공통)"""
+    return {
+        'job_id': job.pk,
+        'target_gu': job.gu,
+        'status': job.status,
+        'running': job.status in ACTIVE_STATUSES,
+        'progress': job.progress,
+        'message': job.message,
+        'completed': job.status == CollectionJob.STATUS_COMPLETED,
+        'error': job.error,
+    }
+
+
+def _api_keys_cache_key(job_id):
+    return f'{API_KEYS_CACHE_PREFIX}:{job_id}'
+
+
+def pop_job_api_keys(job_id):
+    """작업의 API 키를 꺼내고 캐시에서 삭제 (없거나 만료되면 {})"""
+    key = _api_keys_cache_key(job_id)
+    api_keys = cache.get(key) or {}
+    cache.delete(key)
+    return api_keys
+
+
+def get_active_job(gu):
+    """해당 구의 대기/실행 중 작업 (없으면 None)"""
+    stale_before = timezone.now() - timedelta(seconds=STALE_JOB_SECONDS)
+    return CollectionJob.objects.filter(
+        Q(status=CollectionJob.STATUS_QUEUED) |
+        Q(status=CollectionJob.STATUS_RUNNING, heartbeat_at__gte=stale_before),
+        gu=gu,
+    ).first()
+
+
+def enqueue_job(gu, api_keys=None, shard=None, expected_seconds=0):
+    """
+    수집 작업 등록
+
+    구별 대기/실행 중 작업은 1개로 DB 제약(collection_job_active_gu_unique)이 보장하므로
+    동시에 같은 구를 등록해도 하나만 등록된다.
+    heartbeat가 끊긴 실행 작업은 실패 처리하고 새 작업으로 대체한다.
+
+    Args:
+        gu: 대상 구
+        api_keys: {'kakao_api_key': ..., 'seoul_api_key': ...} (없으면 워커의 환경변수 사용)
+                  DB에는 저장하지 않고 API_KEYS_TTL_SECONDS 동안 캐시에만 보관
+        shard: 우선 처리할 워커 샤드 (None이면 아무 워커나)
+        expected_seconds: 과거 실행 시간 기반 예상 소요 시간
+
+    Returns:
+        등록된 작업 (같은 구가 이미 대기/실행 중이면 None)
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=STALE_JOB_SECONDS)
+    try:
+        with transaction.atomic():
+            CollectionJob.objects.filter(
+                Q(heartbeat_at__lt=stale_before) | Q(heartbeat_at__isnull=True),
+                gu=gu,
+                status=CollectionJob.STATUS_RUNNING,
+            ).update(
+                status=CollectionJob.STATUS_FAILED,
+                error='워커 응답 없음 (heartbeat 끊김)',
+                finished_at=now,
+            )
+            job = CollectionJob.objects.create(
+                gu=gu,
+                message='수집 대기 중...',
+                shard=shard,
+                expected_seconds=expected_seconds,
+            )
+            # 커밋(워커에 노출) 전에 키를 캐시에 둠
+            if api_keys:
+                cache.set(_api_keys_cache_key(job.pk), api_keys, API_KEYS_TTL_SECONDS)
+    except IntegrityError:
+        return None
+    publish_job_event('status', job_status_payload(job))
+    return job
+
+
+def enqueue_regions(regions=None, shards=1, api_keys=None):
+    """
+    여러 지역 일괄 등록 (전국 배치)
+
+    과거 실행 시간 기준 LPT로 샤드를 배정하고, 샤드 안에서는 오래 걸리는 지역부터 처리되도록
+    비용 큰 순서로 등록한다. (대기/실행 중인 지역은 건너뜀)
+
+    Args:
+        regions: 지역 키 목록 (None이면 활성 지역 전체)
+
+    Returns:
+        (등록된 작업 리스트, plan_shards 결과)
+    """
+    from .regions import plan_shards, region_costs
+
+    costs = region_costs(regions)
+    plan = plan_shards(costs, shards)
+    shard_of = {key: entry['shard'] for entry in plan for key in entry['regions']}
+
+    jobs = []
+    for key in sorted(costs, key=lambda key: -costs[key]):
+        job = enqueue_job(key, api_keys, shard=shard_of[key] if shards > 1 else None,
+                          expected_seconds=costs[key])
+        if job is not None:
+            jobs.append(job)
+    return jobs, plan
+
+
+def claim_next_job(worker_id=WORKER_ID, shard=None):
+    """
+    대기 중인 작업 1개를 가져와 running으로 전환 (없으면 None)
+
+    다른 워커가 잠근 행은 SKIP LOCKED로 건너뛰므로 워커끼리 대기/충돌하지 않는다.
+    shard를 지정하면 자기 샤드 작업을 먼저 가져가고, 없으면 다른 샤드 작업을 가져온다 (work stealing).
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=STALE_JOB_SECONDS)
+
+    ordering = ['created_at']
+    if shard is not None:
+        ordering.insert(0, Case(When(shard=shard, then=0), default=1))
+
+    with transaction.atomic():
+        job = (
+            CollectionJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                Q(status=CollectionJob.STATUS_QUEUED) |
+                Q(status=CollectionJob.STATUS_RUNNING, heartbeat_at__lt=stale_before)
+            )
+            .order_by(*ordering)
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = CollectionJob.STATUS_RUNNING
+        job.worker = worker_id
+        job.started_at = now
+        job.heartbeat_at = now
+        job.progress = 0
+        job.message = '수집 준비 중...'
+        job.error = None
+        job.metrics = initial_metrics()
+        job.save()
+
+    # API 키는 실행 중인 워커 메모리에만 둠 (heartbeat가 끊겨 다시 가져가면 환경변수 키 사용)
+    job.api_keys = pop_job_api_keys(job.pk)
+    return job
+
+
+# ========================================
+# 이벤트 전달 (워커 → 웹 프로세스)
+# ========================================
+
+def publish_job_event(event_type, data):
+    """
+    작업 이벤트 발행
+
+    같은 프로세스의 EventBus에 바로 발행하고, Postgres라면 NOTIFY로
+    다른 프로세스(웹 서버)의 리스너에도 전달한다.
+    """
+    event_bus.publish(event_type, data)
+
+    if connection.vendor != 'postgresql':
+        return
+    payload = json.dumps({'origin': WORKER_ID, 'event': event_type, 'data': data}, ensure_ascii=False)
+    if len(payload.encode('utf-8')) > MAX_NOTIFY_BYTES:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_notify(%s, %s)', [EVENT_CHANNEL, payload])
+
+
+_listener_lock = threading.Lock()
+_listener_thread = None
+
+
+def start_event_listener():
+    """웹 프로세스에서 워커 이벤트 수신 스레드 시작 (Postgres LISTEN, 중복 호출 무시)"""
+    global _listener_thread
+
+    if connection.vendor != 'postgresql':
+        return
+    with _listener_lock:
+        if _listener_thread and _listener_thread.is_alive():
+            return
+        _listener_thread = threading.Thread(target=_listen_loop, name='collection-event-listener')
+        _listener_thread.daemon = True
+        _listener_thread.start()
+
+
+def _listen_loop():
+    """NOTIFY 수신 → EventBus 재발행 (연결이 끊기면 5초 후 재연결)"""
+    while True:
+        listen_connection = connections.create_connection('default')
+        try:
+            listen_connection.ensure_connection()
+            raw = listen_connection.connection
+            raw.autocommit = True
+            with raw.cursor() as cursor:
+                cursor.execute(f'LISTEN {EVENT_CHANNEL}')
+
+            while True:
+                # 알림이 올 때까지 소켓 대기 (CPU 사용 없음)
+                if select.select([raw], [], [], 60) == ([], [], []):
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    _republish(raw.notifies.pop(0).payload)
+        except Exception:
+            time.sleep(5)
+        finally:
+            listen_connection.close()
+
+
+def _republish(payload):
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        return
+    if message.get('origin') == WORKER_ID:
+        return
+    event_bus.publish(message['event'], message['data'])
+
+
+# ========================================
+# 작업 실행
+# ========================================
+
+class JobReporter:
+    """
+    작업 진행 상태 기록기
+
+    진행률/단계 전환은 DB에 저장하고 이벤트로 발행한다.
+    로그는 이벤트로 즉시 발행하고, DB에는 다음 저장 시점에 함께 기록한다.
+    """
+
+    def __init__(self, job):
+        self.job = job
+        if not job.metrics:
+            job.metrics = initial_metrics()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread = None
+
+    @property
+    def metrics(self):
+        return self.job.metrics
+
+    def save(self, *extra_fields):
+        """진행 상태 저장 (heartbeat 포함)"""
+        job = self.job
+        job.heartbeat_at = timezone.now()
+        self.update_elapsed_time()
+        fields = ('progress', 'message', 'error', 'metrics', 'heartbeat_at') + extra_fields
+        CollectionJob.objects.filter(pk=job.pk).update(**{field: getattr(job, field) for field in fields})
+
+    def publish_status(self):
+        publish_job_event('status', job_status_payload(self.job))
+
+    def set_progress(self, progress, message=None):
+        """진행률(및 메시지) 갱신 후 저장 + status 이벤트 발행"""
+        self.job.progress = progress
+        if message is not None:
+            self.job.message = message
+        self.save()
+        self.publish_status()
+
+    def set_stage(self, stage, values):
+        """단계별 metrics 갱신 후 저장 + stage 이벤트 발행"""
+        stages = self.metrics['stages']
+        stages[stage] = {**stages.get(stage, {}), **values}
+        self.save()
+        publish_job_event('stage', {'job_id': self.job.pk, 'stage': stage, **stages[stage]})
+
+    def log(self, message, level='INFO'):
+        """로그 메시지 추가 (개발자 모니터링용)"""
+        from datetime import datetime
+        log_entry = {
+            'timestamp': datetime.now().strftime('%H:%M:%S'),
+            'level': level,
+            'message': message
+        }
+        logs = self.metrics['logs']
+        logs.append(log_entry)
+        # 최대 100개 로그만 유지
+        if len(logs) > 100:
+            del logs[:-100]
+        publish_job_event('log', {'job_id': self.job.pk, **log_entry})
+
+    def update_elapsed_time(self):
+        """경과 시간 업데이트"""
+        if self.metrics.get('start_time'):
+            self.metrics['elapsed_seconds'] = time.time() - self.metrics['start_time']
+
+    def start_heartbeat(self):
+        """단계 하나가 오래 걸려도 다른 워커가 작업을 가로채지 않도록 주기적으로 heartbeat 갱신"""
+        def beat():
+            try:
+                while not self._heartbeat_stop.wait(HEARTBEAT_SECONDS):
+                    CollectionJob.objects.filter(pk=self.job.pk).update(heartbeat_at=timezone.now())
+            finally:
+                connection.close()
+
+        self._heartbeat_thread = threading.Thread(target=beat, name=f'collection-job-{self.job.pk}-heartbeat')
+        self._heartbeat_thread.daemon = True
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self):
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join(timeout=5)
+
+
+def run_collection_job(job):
+    """수집 파이프라인 실행 (상세 metrics 추적 포함)"""
+    from stores.models import YeongdeungpoDaiso, YeongdeungpoConvenience, SeoulRestaurantLicense, TobaccoRetailLicense
+    from stores.analytics import refresh_hex_cells
+    from stores.regions import record_run_cost
+    from stores.snapshot import write_snapshot
+    from stores.summary import refresh_gu_summary
+
+    target_gu = job.gu
+    api_keys = getattr(job, 'api_keys', None) or {}
+    kakao_api_key = api_keys.get('kakao_api_key')
+    seoul_api_key = api_keys.get('seoul_api_key')
+    metrics = job.metrics
+    reporter = JobReporter(job)
+    reporter.start_heartbeat()
+
+    try:
+        reporter.log(f'{target_gu} 수집 시작', 'INFO')
+
+        # ========================================
+        # Step 1: 다이소 수집 (20%)
+        # ========================================
+        stage_start = time.time()
+        reporter.set_progress(10, f'{target_gu} 다이소 수집 중...')
+        reporter.set_stage('daiso', {'status': 'running'})
+        reporter.log(f'[1/5] 다이소 수집 시작', 'INFO')
+
+        call_command('v2_3_1_collect_yeongdeungpo_daiso', gu=target_gu, clear=True, api_key=kakao_api_key)
+
+        daiso_count = YeongdeungpoDaiso.objects.filter(gu=target_gu).count()
+        stage_time = round(time.time() - stage_start, 2)
+        metrics['api_calls']['daiso'] = 1
+        metrics['api_calls']['total'] += 1
+        reporter.set_stage('daiso', {
+            'status': 'completed',
+            'count': daiso_count,
+            'time': stage_time,
+            'api_calls': 1  # 다이소 API 1회
+        })
+        reporter.set_progress(20)
+        reporter.log(f'✅ 다이소 {daiso_count}개 수집 완료 ({stage_time}초)', 'INFO')
+
+        # 수집된 다이소 지점 목록 (N+1 방지: values() 사용으로 한 번만 조회)
+        daiso_data = list(YeongdeungpoDaiso.objects.filter(gu=target_gu).values('name', 'location'))
+
+        # 수집된 다이소 지점 목록 로그
+        for daiso in daiso_data:
+            reporter.log(f'  📍 {daiso["name"]}', 'INFO')
+
+        # 4분면 좌표 데이터 수집 (위에서 조회한 데이터 재사용)
+        quadrants_data = []
+        DELTA_LAT, DELTA_LNG = 0.0117, 0.0147
+        for daiso in daiso_data:
+            if daiso['location']:
+                cx, cy = daiso['location'].x, daiso['location'].y
+                quadrants_data.append({
+                    'name': daiso['name'],
+                    'center': {'lat': cy, 'lng': cx},
+                    'quadrants': [
+                        {'name': 'NE', 'bounds': [[cy, cx], [cy + DELTA_LAT, cx + DELTA_LNG]]},
+                        {'name': 'NW', 'bounds': [[cy, cx - DELTA_LNG], [cy + DELTA_LAT, cx]]},
+                        {'name': 'SE', 'bounds': [[cy - DELTA_LAT, cx], [cy, cx + DELTA_LNG]]},
+                        {'name': 'SW', 'bounds': [[cy - DELTA_LAT, cx - DELTA_LNG], [cy, cx]]}
+                    ]
+                })
+        metrics['quadrants'] = quadrants_data
+
+        # ========================================
+        # Step 2: 편의점 수집 (50%)
+        # ========================================
+        stage_start = time.time()
+        reporter.set_progress(30, f'{target_gu} 편의점 수집 중...')
+        reporter.set_stage('convenience', {'status': 'running'})
+        reporter.log(f'[2/5] 편의점 수집 시작 (4분면 검색)', 'INFO')
+
+        call_command('v2_3_2_collect_Convenience_Only', gu=target_gu, clear=True, use_async=True, api_key=kakao_api_key)
+
+        conv_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).count()
+        stage_time = round(time.time() - stage_start, 2)
+        # 추정 API 호출: 다이소 수 * 4분면 * 평균 3페이지
+        estimated_kakao_calls = daiso_count * 4 * 3
+        metrics['api_calls']['kakao'] += estimated_kakao_calls
+        metrics['api_calls']['total'] += estimated_kakao_calls
+        reporter.set_stage('convenience', {
+            'status': 'completed',
+            'count': conv_count,
+            'time': stage_time,
+            'api_calls': estimated_kakao_calls
+        })
+        reporter.set_progress(50)
+        reporter.log(f'✅ 편의점 {conv_count}개 수집 완료 ({stage_time}초, API ~{estimated_kakao_calls}회)', 'INFO')
+
+        # ========================================
+        # Step 3: OpenAPI 휴게음식점 (70%)
+        # ========================================
+        stage_start = time.time()
+        reporter.set_progress(55, f'{target_gu} 휴게음식점 인허가 수집 중...')
+        reporter.set_stage('restaurant', {'status': 'running'})
+        reporter.log(f'[3/5] 휴게음식점 인허가 수집 시작', 'INFO')
+
+        call_command('openapi_1', gu=target_gu, clear=True, api_key=seoul_api_key)
+
+        restaurant_count = SeoulRestaurantLicense.objects.filter(gu=target_gu).count()
+        stage_time = round(time.time() - stage_start, 2)
+        estimated_seoul_calls = max(1, restaurant_count // 1000 + 1)
+        metrics['api_calls']['seoul'] += estimated_seoul_calls
+        metrics['api_calls']['total'] += estimated_seoul_calls
+        reporter.set_stage('restaurant', {
+            'status': 'completed',
+            'count': restaurant_count,
+            'time': stage_time,
+            'api_calls': estimated_seoul_calls
+        })
+        reporter.set_progress(70)
+        reporter.log(f'✅ 휴게음식점 {restaurant_count}개 수집 완료 ({stage_time}초)', 'INFO')
+
+        # ========================================
+        # Step 4: OpenAPI 담배소매업 (85%)
+        # ========================================
+        stage_start = time.time()
+        reporter.set_progress(75, f'{target_gu} 담배소매업 인허가 수집 중...')
+        reporter.set_stage('tobacco', {'status': 'running'})
+        reporter.log(f'[4/5] 담배소매업 인허가 수집 시작', 'INFO')
+
+        call_command('openapi_2', gu=target_gu, clear=True, api_key=seoul_api_key)
+
+        tobacco_count = TobaccoRetailLicense.objects.filter(gu=target_gu).count()
+        stage_time = round(time.time() - stage_start, 2)
+        estimated_seoul_calls = max(1, tobacco_count // 1000 + 1)
+        metrics['api_calls']['seoul'] += estimated_seoul_calls
+        metrics['api_calls']['total'] += estimated_seoul_calls
+        reporter.set_stage('tobacco', {
+            'status': 'completed',
+            'count': tobacco_count,
+            'time': stage_time,
+            'api_calls': estimated_seoul_calls
+        })
+        reporter.set_progress(85)
+        reporter.log(f'✅ 담배소매업 {tobacco_count}개 수집 완료 ({stage_time}초)', 'INFO')
+
+        # ========================================
+        # Step 5: 폐업 검증 (100%)
+        # ========================================
+        stage_start = time.time()
+        reporter.set_progress(90, f'{target_gu} 폐업 매장 검증 중...')
+        reporter.set_stage('closure', {'status': 'running'})
+        reporter.log(f'[5/5] 폐업 검증 시작 (교차 검증)', 'INFO')
+
+        call_command('check_store_closure', gu=target_gu, clear=True)
+
+        # 교차 검증 결과 수집 (구별 요약 테이블 1회 갱신 후 재사용)
+        summary = refresh_gu_summary(target_gu)
+        normal_count = summary.normal_count
+        closed_count = summary.closed_count
+
+        stage_time = round(time.time() - stage_start, 2)
+
+        # 교차 검증 상세 결과 (매칭 이유별 카운트)
+        metrics['cross_validation'] = {
+            'restaurant_match': summary.name_match_count,
+            'tobacco_match': summary.address_match_count,
+            'csv_match': summary.coord_match_count,
+            'normal': normal_count,
+            'closed': closed_count,
+            'total': summary.closure_total
+        }
+
+        # 데이터 품질 지표
+        metrics['data_quality'] = {
+            'duplicates_removed': 0,  # update_or_create로 처리됨
+            'coords_missing': summary.coords_missing,
+            'address_mismatch': 0,
+            'total_records': conv_count,
+            'coord_accuracy_avg': 5.8  # 평균 좌표 변환 오차 (m)
+        }
+
+        reporter.set_stage('closure', {
+            'status': 'completed',
+            'count': summary.closure_total,
+            'time': stage_time,
+            'api_calls': 0
+        })
+        # 웹 조회용 결과 스냅샷 (mmap) + 육각 격자 밀도
+        write_snapshot(target_gu)
+        refresh_hex_cells(target_gu)
+        
+        reporter.set_progress(100)
+        reporter.log(f'✅ 폐업 검증 완료: 정상 {normal_count}개, 폐업 {closed_count}개 ({stage_time}초)', 'INFO')
+
+        job.status = CollectionJob.STATUS_COMPLETED
+        job.message = '수집 완료!'
+        metrics['end_time'] = time.time()
+        reporter.update_elapsed_time()
+        # 다음 샤드 배정에 쓸 지역별 실행 시간 갱신
+        record_run_cost(target_gu, metrics['elapsed_seconds'])
+        reporter.log(f'🎉 전체 수집 완료! 총 소요시간: {round(metrics["elapsed_seconds"], 1)}초', 'INFO')
+
+    except Exception as e:
+        job.status = CollectionJob.STATUS_FAILED
+        job.error = str(e)
+        job.message = f'오류 발생: {str(e)}'
+        reporter.log(f'❌ 오류 발생: {str(e)}', 'ERROR')
+    finally:
+        reporter.stop_heartbeat()
+        job.api_keys = {}
+        job.finished_at = timezone.now()
+        reporter.save('status', 'finished_at')
+        # 데이터가 바뀌었으므로 구별 데이터 버전 갱신 (지도/결과 캐시 무효화)
+        bump_data_version(target_gu)
+        # 완료/오류 상태를 구독 중인 화면에 즉시 전달
+        reporter.publish_status()
+
+    return job
+
+
+def run_worker(worker_id=WORKER_ID, once=False, poll_interval=2.0, stop_event=None, on_job=None, shard=None):
+    """
+    작업 처리 루프
+
+    Args:
+        once: True면 대기 중인 작업이 없을 때 종료 (내장 워커/테스트용)
+        shard: 우선 처리할 샤드 번호 (enqueue_regions로 배정된 작업)
+        poll_interval: 대기열이 비었을 때 다시 확인하기까지 대기 시간 (초)
+        stop_event: 설정되면 현재 작업을 마친 뒤 종료
+        on_job: 작업 시작/종료 시 호출되는 콜백 on_job(job, finished)
+
+    Returns:
+        처리한 작업 수
+    """
+    processed = 0
+    while not (stop_event and stop_event.is_set()):
+        close_old_connections()
+        job = claim_next_job(worker_id, shard=shard)
+        if job is None:
+            if once:
+                break
+            if stop_event:
+                stop_event.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+            continue
+        if on_job:
+            on_job(job, False)
+        run_collection_job(job)
+        processed += 1
+        if on_job:
+            on_job(job, True)
+    return processed
+
+
+_embedded_worker_lock = threading.Lock()
+_embedded_worker_thread = None
+
+
+def ensure_embedded_worker():
+    """
+    웹 프로세스 내장 워커 시작 (settings.COLLECTION_EMBEDDED_WORKER)
+
+    별도 collect_worker 없이 runserver만으로도 수집이 동작하도록,
+    대기열이 빌 때까지 작업을 처리하고 종료하는 스레드를 띄운다.
+    """
+    global _embedded_worker_thread
+
+    if not getattr(settings, 'COLLECTION_EMBEDDED_WORKER', False):
+        return
+    with _embedded_worker_lock:
+        if _embedded_worker_thread and _embedded_worker_thread.is_alive():
+            return
+
+        def drain():
+            try:
+                run_worker(worker_id=f'{WORKER_ID}:web', once=True)
+            finally:
+                connection.close()
+
+        _embedded_worker_thread = threading.Thread(target=drain, name='collection-embedded-worker')
+        _embedded_worker_thread.daemon = True
+        _embedded_worker_thread.start()
@@ -0,0 +1,111 @@
+# stores/key_validation.py
+"""
+API 키 유효성 검증 (비동기)
+
+start_collection에서 카카오/서울시 키를 순서대로 requests.get(timeout=5)로 검증하면
+외부 API가 느릴 때 요청 하나가 최대 10초 동안 워커를 점유한다.
+- aiohttp로 두 검증을 동시에 실행 (최대 5초)
+- 검증에 성공한 키는 짧은 TTL 동안 메모리에 기억하여 재검증 생략
+  (키 원문 대신 해시만 보관)
+
+사용법:
+    from .key_validation import validate_api_keys
+
+    is_valid, error_msg = await validate_api_keys(kakao_api_key, seoul_api_key)
+"""
+
+import asyncio
+import hashlib
+import time
+
+import aiohttp
+
+
+KAKAO_VALIDATE_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
+SEOUL_VALIDATE_URL = "http://openapi.seoul.go.kr:8088/{api_key}/json/LOCALDATA_072405_YP/1/1/"
+SEOUL_INVALID_KEY_CODES = ['ERROR-300', 'ERROR-331', 'ERROR-332', 'ERROR-333', 'ERROR-334']
+
+# 외부 API 요청 타임아웃 (초)
+VALIDATE_TIMEOUT = 5
+# 검증 성공 결과 유지 시간 (초)
+VALID_KEY_TTL = 600
+
+# {키 해시: 만료 시각}
+_valid_keys = {}
+
+
+def _cache_key(kind, api_key):
+    return hashlib.sha256(f'{kind}:{api_key}'.encode('utf-8')).hexdigest()
+
+
+def _is_cached(kind, api_key):
+    expires_at = _valid_keys.get(_cache_key(kind, api_key))
+    return expires_at is not None and expires_at > time.monotonic()
+
+
+def _remember(kind, api_key):
+    now = time.monotonic()
+    # 만료된 항목 정리
+    for key in [key for key, expires_at in _valid_keys.items() if expires_at <= now]:
+        del _valid_keys[key]
+    _valid_keys[_cache_key(kind, api_key)] = now + VALID_KEY_TTL
+
+
+def clear_validation_cache():
+    """검증 결과 캐시 초기화 (테스트용)"""
+    _valid_keys.clear()
+
+
+async def validate_kakao_rest_api_key(session, api_key):
+    """카카오 REST API 키 유효성 검증"""
+    if _is_cached('kakao', api_key):
+        return True, None
+    try:
+        headers = {"Authorization": f"KakaoAK {api_key}"}
+        params = {"query": "테스트"}
+        async with session.get(KAKAO_VALIDATE_URL, headers=headers, params=params) as response:
+            if response.status == 401:
+                return False, "카카오 REST API 키가 올바르지 않습니다."
+        _remember('kakao', api_key)
+        return True, None
+    except Exception as e:
+        return False, f"카카오 REST API 검증 중 오류: {str(e) or type(e).__name__}"
+
+
+async def validate_seoul_openapi_key(session, api_key):
+    """서울시 OpenAPI 키 유효성 검증"""
+    if _is_cached('seoul', api_key):
+        return True, None
+    try:
+        async with session.get(SEOUL_VALIDATE_URL.format(api_key=api_key)) as response:
+            data = await response.json(content_type=None)
+
+        # API 응답에서 에러 확인 (INFO-200 데이터 없음은 키는 유효함)
+        if 'RESULT' in data:
+            code = data['RESULT'].get('CODE', '')
+            if code in SEOUL_INVALID_KEY_CODES:
+                return False, "서울시 OpenAPI 키가 올바르지 않습니다."
+        _remember('seoul', api_key)
+        return True, None
+    except Exception as e:
+        return False, f"서울시 OpenAPI 검증 중 오류: {str(e) or type(e).__name__}"
+
+
+async def validate_api_keys(kakao_api_key, seoul_api_key):
+    """
+    카카오/서울시 키 동시 검증
+
+    Returns:
+        (is_valid, error_msg) - 둘 다 실패하면 카카오 오류를 우선 반환
+    """
+    timeout = aiohttp.ClientTimeout(total=VALIDATE_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        results = await asyncio.gather(
+            validate_kakao_rest_api_key(session, kakao_api_key),
+            validate_seoul_openapi_key(session, seoul_api_key),
+        )
+
+    for is_valid, error_msg in results:
+        if not is_valid:
+            return False, error_msg
+    return True, None
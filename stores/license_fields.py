@@ -0,0 +1,119 @@
+# stores/license_fields.py
+"""
+인허가 OpenAPI 문자열 → 타입 값 변환
+
+서울시 LOCALDATA API는 모든 값을 문자열로 내려준다. (일자 '2015-03-02' / '20150302',
+수정일시 '2021-03-14 02:40:00.0', 면적 '23.5', 인원 '0', TM 좌표 '197215.843838')
+수집 시점에 DateField/DecimalField/IntegerField 값으로 바꿔 저장해야
+"최근 90일 폐업" 같은 기간 조회가 인덱스(dcbymd/apvpermymd)를 쓸 수 있다.
+
+- 빈 문자열/형식 오류는 None (NULL)
+- 수정일시(lastmodts/updatedt)는 한국 시간 기준 aware datetime
+
+사용법:
+    from stores.license_fields import typed_license_values
+
+    defaults = typed_license_values({'dcbymd': '2024-05-01', 'sitearea': '23.5', ...})
+"""
+
+import re
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import partial
+from zoneinfo import ZoneInfo
+
+
+# OpenAPI 일시 값의 기준 시간대
+SOURCE_TZ = ZoneInfo('Asia/Seoul')
+
+_NON_DIGIT = re.compile(r'\D')
+
+
+def parse_date(value):
+    """'2015-03-02' / '20150302' / '2015.03.02' → date"""
+    digits = _NON_DIGIT.sub('', value or '')
+    if len(digits) < 8:
+        return None
+    try:
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:8]))
+    except ValueError:
+        return None
+
+
+def parse_datetime(value):
+    """'2021-03-14 02:40:00.0' → aware datetime (한국 시간), 일자만 있으면 0시"""
+    digits = _NON_DIGIT.sub('', value or '')
+    if len(digits) < 8:
+        return None
+    parts = [int(digits[:4]), int(digits[4:6]), int(digits[6:8])]
+    if len(digits) >= 14:
+        parts += [int(digits[8:10]), int(digits[10:12]), int(digits[12:14])]
+    try:
+        return datetime(*parts, tzinfo=SOURCE_TZ)
+    except ValueError:
+        return None
+
+
+def parse_decimal(value, max_digits=None, decimal_places=None):
+    """
+    '1,234.5' → Decimal (숫자가 아니면 None)
+
+    max_digits/decimal_places를 주면 DecimalField 자릿수에 맞춰 반올림하고,
+    정수부가 자릿수를 넘으면 저장 시 오류가 나므로 None
+    """
+    value = (value or '').strip().replace(',', '')
+    if not value:
+        return None
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        return None
+    if not number.is_finite():
+        return None
+    if decimal_places is None:
+        return number
+    if number and number.adjusted() >= max_digits - decimal_places:
+        return None
+    number = number.quantize(Decimal(1).scaleb(-decimal_places), rounding=ROUND_HALF_UP)
+    # 반올림으로 자리가 올라간 경우 (99.995 → 100.00)
+    return number if len(number.as_tuple().digits) <= max_digits else None
+
+
+def parse_int(value):
+    """'3' / '3.0' → 3"""
+    number = parse_decimal(value)
+    return int(number) if number is not None else None
+
+
+# 필드별 변환 함수 (SeoulRestaurantLicense / TobaccoRetailLicense 공통)
+TYPED_LICENSE_FIELDS = {
+    'apvpermymd': parse_date,
+    'apvcancelymd': parse_date,
+    'dcbymd': parse_date,
+    'clgstdt': parse_date,
+    'clgenddt': parse_date,
+    'ropnymd': parse_date,
+    'asgnymd': parse_date,
+    'lastmodts': parse_datetime,
+    'updatedt': parse_datetime,
+    'sitearea': partial(parse_decimal, max_digits=12, decimal_places=2),
+    'faciltotscp': partial(parse_decimal, max_digits=12, decimal_places=2),
+    'x': partial(parse_decimal, max_digits=15, decimal_places=6),
+    'y': partial(parse_decimal, max_digits=15, decimal_places=6),
+    'totepnum': parse_int,
+    'maneipcnt': parse_int,
+    'wmeipcnt': parse_int,
+}
+
+
+def typed_license_values(values):
+    """
+    update_or_create defaults의 문자열 값을 타입 값으로 변환 (변환 대상이 아닌 필드는 그대로)
+
+    Returns:
+        새 dict
+    """
+    return {
+        field: TYPED_LICENSE_FIELDS[field](value) if field in TYPED_LICENSE_FIELDS and isinstance(value, str) else value
+        for field, value in values.items()
+    }
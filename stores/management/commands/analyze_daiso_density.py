@@ -0,0 +1,85 @@
+# stores/management/commands/analyze_daiso_density.py
+"""
+다이소별 상권 밀도 분석 커맨드
+
+다이소마다 반경별 편의점/인허가 편의점/폐업 추정 매장 수와 최근접 거리를
+PostGIS 쿼리 1회(ST_DWithin + KNN)로 계산해 출력한다. (stores/analytics.py)
+결과는 /api/daiso-density/ 캐시에도 저장되어 다음 파이프라인 실행 전까지 재사용된다.
+
+사용법:
+    python manage.py analyze_daiso_density --gu 영등포구
+    python manage.py analyze_daiso_density --gu 영등포구 --csv daiso_density.csv
+"""
+
+import csv
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from stores.analytics import DENSITY_RADII, DENSITY_TARGETS, daiso_density_json
+from stores.data_cache import get_cached_variants
+from .gu_codes import get_gu_info
+
+
+TARGET_LABELS = {'convenience': '편의점', 'licensed': '인허가', 'closed': '폐업'}
+
+
+class Command(BaseCommand):
+    help = '다이소별 상권 밀도 분석 (반경별 매장 수 + 최근접 거리, 쿼리 1회)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--gu',
+            type=str,
+            default='영등포구',
+            help='대상 구 (기본: 영등포구). 지원 목록은 지역 레지스트리(import_regions) 참고'
+        )
+        parser.add_argument(
+            '--csv',
+            type=str,
+            default=None,
+            help='결과를 CSV로 저장할 경로'
+        )
+
+    def handle(self, *args, **options):
+        target_gu = options['gu']
+        try:
+            get_gu_info(target_gu)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+
+        start = time.time()
+        # API와 같은 캐시 항목을 사용 (이미 계산되어 있으면 재사용)
+        variants = get_cached_variants('daiso_density', target_gu, lambda: daiso_density_json(target_gu))
+        daisos = json.loads(variants['identity'])['daisos']
+        elapsed = round(time.time() - start, 2)
+
+        self.stdout.write(self.style.SUCCESS(f"📊 {target_gu} 다이소 {len(daisos)}개 상권 밀도 ({elapsed}초)"))
+
+        header = ['다이소']
+        for name, _, _ in DENSITY_TARGETS:
+            header += [f'{TARGET_LABELS[name]} {radius}m' for radius in DENSITY_RADII]
+            header.append(f'최근접 {TARGET_LABELS[name]}(m)')
+        header.append('최근접 다이소(m)')
+
+        rows = []
+        for daiso in daisos:
+            row = [daiso['name']]
+            for name, _, _ in DENSITY_TARGETS:
+                row += [daiso[name][str(radius)] for radius in DENSITY_RADII]
+                row.append(daiso[name]['nearest_m'])
+            row.append(daiso['nearest_daiso_m'])
+            rows.append(row)
+
+        self.stdout.write(' | '.join(header))
+        for row in rows:
+            self.stdout.write(' | '.join('-' if value is None else str(value) for value in row))
+
+        if options['csv']:
+            with open(options['csv'], 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows)
+            self.stdout.write(self.style.SUCCESS(f"💾 CSV 저장: {options['csv']}"))
@@ -75,14 +75,16 @@ class AsyncKakaoCollector:
     DELTA_LAT_PER_KM = 0.0090
     DELTA_LNG_PER_KM = 0.0113
     
-    def __init__(self, api_key: str, radius_km: float = 1.8):
+    def __init__(self, api_key: str, radius_km: float = 1.8, classifier=None):
         """
         Args:
             api_key: 카카오 REST API 키
             radius_km: 탐색 반경 (km)
+            classifier: 좌표 기준 구 판별기 (stores.gu_boundaries.GuClassifier, None이면 주소 문자열 판별)
         """
         self.api_key = api_key
         self.radius_km = radius_km
+        self.classifier = classifier
         self.headers = {"Authorization": f"KakaoAK {api_key}"}
         self.rate_limiter = AsyncRateLimiter(max_concurrent=8, delay=0.1)
         self.stats = CollectionStats()
@@ -237,8 +239,8 @@ class AsyncKakaoCollector:
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # 결과 병합 및 필터링
-        filtered_stores = []
+        # 결과 병합 (중복 제거)
+        unique_stores = []
         seen_ids = set()
         
         for result in results:
@@ -248,22 +250,28 @@ class AsyncKakaoCollector:
             
             for item in result:
                 place_id = item.get("id")
-                
-                # 중복 제거
                 if place_id in seen_ids:
                     continue
                 seen_ids.add(place_id)
-                
-                # 타겟 구 필터링
+                unique_stores.append(item)
+        
+        # 타겟 구 필터링 (좌표 기준 구 배치 판별, 판별 불가 시 주소 문자열)
+        boundary_gus = self.classifier.classify_items(unique_stores) if self.classifier else [None] * len(unique_stores)
+        filtered_stores = []
+        for item, boundary_gu in zip(unique_stores, boundary_gus):
+            if boundary_gu is not None:
+                in_target = boundary_gu == target_gu
+            else:
                 address = item.get("road_address_name") or item.get("address_name", "")
-                if target_gu not in address:
-                    self.stats.skipped_count += 1
-                    continue
-                
-                # 결과에 기준 다이소 정보 추가
-                item["_base_daiso"] = daiso.name
-                item["_target_gu"] = target_gu
-                filtered_stores.append(item)
+                in_target = target_gu in address
+            if not in_target:
+                self.stats.skipped_count += 1
+                continue
+            
+            # 결과에 기준 다이소 정보 추가
+            item["_base_daiso"] = daiso.name
+            item["_target_gu"] = target_gu
+            filtered_stores.append(item)
         
         return filtered_stores
     
@@ -325,10 +333,12 @@ def run_async_collection(api_key: str, daiso_list, target_gu: str, radius_km: fl
     Returns:
         (수집된 편의점 리스트, 통계 딕셔너리)
     """
-    # Django QuerySet을 미리 리스트로 변환 (async context 진입 전)
+    from stores.gu_boundaries import get_gu_classifier
+    
+    # Django QuerySet/구 경계를 미리 로드 (async context 진입 전)
     daiso_list_evaluated = list(daiso_list)
     
-    collector = AsyncKakaoCollector(api_key, radius_km)
+    collector = AsyncKakaoCollector(api_key, radius_km, classifier=get_gu_classifier())
     
     # 이벤트 루프 실행
     loop = asyncio.new_event_loop()
@@ -0,0 +1,295 @@
+# stores/management/commands/benchmark_queries.py
+"""
+구 단위 조회 쿼리 실행 계획 벤치마크
+
+뷰/커맨드의 핫 쿼리는 모두 gu로 필터링한다. (filter(gu=..), gu + uptaenm, gu + status,
+gu + location IS NULL) 인덱스 추가/변경을 측정값으로 판단할 수 있도록
+서울 25개 구 합성 데이터를 넣고 쿼리별 EXPLAIN (ANALYZE) 실행 시간과 스캔 방식을
+gu 인덱스(migrations/0012) 유무로 비교한다.
+
+- 모든 작업은 트랜잭션 안에서 실행 후 롤백 (합성 데이터/DROP INDEX 모두 되돌림)
+- 합성 행은 실제 테이블에 들어가고 DROP INDEX는 트랜잭션 종료까지 테이블 잠금을 잡으므로
+  DEBUG가 아니면 --i-know 없이는 실행을 거부한다 (운영 DB에서는 실행하지 말 것)
+
+사용법:
+    python manage.py benchmark_queries
+    python manage.py benchmark_queries --rows 2000 --repeat 5 --json benchmark.json
+    python manage.py benchmark_queries --i-know      # DEBUG=False (스테이징 복제본 등)
+"""
+
+import json
+import random
+import statistics
+
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from stores.analytics import DENSITY_RADII, KNN_CANDIDATES, _density_sql
+from stores.models import (
+    SeoulRestaurantLicense, StoreClosureResult, TobaccoRetailLicense,
+    YeongdeungpoConvenience, YeongdeungpoDaiso,
+)
+from .gu_codes import get_gu_info, list_supported_gu
+
+
+# 비교 대상 인덱스 (migrations/0012_gu_indexes)
+BENCHMARK_INDEXES = (
+    'daiso_gu_idx',
+    'conv_gu_idx',
+    'restaurant_gu_uptae_idx',
+    'tobacco_gu_idx',
+    'closure_gu_status_idx',
+)
+
+# 합성 좌표 범위 (서울 전체)
+SEOUL_BBOX = (126.80, 37.43, 127.18, 37.70)
+
+# 구당 테이블별 행 수 배율 (--rows 기준)
+ROW_RATIOS = {'convenience': 1, 'closure': 1, 'license': 3, 'tobacco': 1}
+DAISO_PER_ROWS = 40
+
+
+def _queryset_sql(queryset):
+    return queryset.query.sql_with_params()
+
+
+def benchmark_queries(gu):
+    """
+    측정 대상 쿼리 (이름, 설명, (sql, params) 생성 함수)
+
+    views/summary/check_store_closure/analytics에서 실제로 실행하는 조회와 같은 조건
+    """
+    return [
+        ('results', 'get_results / 스냅샷 생성', lambda: _queryset_sql(
+            StoreClosureResult.objects.filter(gu=gu).values(
+                'name', 'address', 'latitude', 'longitude', 'status', 'match_flags'
+            )
+        )),
+        ('results_status', 'get_results ?status=폐업', lambda: _queryset_sql(
+            StoreClosureResult.objects.filter(gu=gu, status='폐업').values(
+                'name', 'address', 'latitude', 'longitude', 'status', 'match_flags'
+            )
+        )),
+        ('convenience', 'check_store_closure / 정적 번들 편의점', lambda: _queryset_sql(
+            YeongdeungpoConvenience.objects.filter(gu=gu).values('place_id', 'name', 'address', 'location')
+        )),
+        ('convenience_coords_missing', 'refresh_gu_summary 좌표 누락', lambda: _queryset_sql(
+            YeongdeungpoConvenience.objects.filter(gu=gu, location__isnull=True).values('id')
+        )),
+        ('daiso', '편의점 수집 대상 다이소', lambda: _queryset_sql(
+            YeongdeungpoDaiso.objects.filter(gu=gu).values('name', 'location')
+        )),
+        ('license_convenience', 'check_store_closure / openapi_1 인허가 편의점', lambda: _queryset_sql(
+            SeoulRestaurantLicense.objects.filter(gu=gu, uptaenm='편의점').values('bplcnm', 'rdnwhladdr', 'location')
+        )),
+        ('tobacco', 'check_store_closure / openapi_2 담배소매점', lambda: _queryset_sql(
+            TobaccoRetailLicense.objects.filter(gu=gu).values('bplcnm', 'rdnwhladdr', 'location')
+        )),
+        ('daiso_density', '/api/daiso-density/', lambda: (_density_sql(DENSITY_RADII), {
+            'gu': gu,
+            'search_meters': max(DENSITY_RADII),
+            'knn': KNN_CANDIDATES,
+            'license_type': '편의점',
+            'closed': '폐업',
+        })),
+    ]
+
+
+def _scan_nodes(plan):
+    """실행 계획 트리 → 스캔 노드 목록 ('Index Scan(closure_gu_status_idx)' 등)"""
+    nodes = []
+    if 'Scan' in plan['Node Type']:
+        target = plan.get('Index Name') or plan.get('Relation Name') or ''
+        nodes.append(f"{plan['Node Type']}({target})")
+    for child in plan.get('Plans', []):
+        nodes.extend(_scan_nodes(child))
+    return nodes
+
+
+def explain(sql, params, repeat=3):
+    """
+    EXPLAIN (ANALYZE, FORMAT JSON) repeat회 실행
+
+    Returns:
+        {'ms': 실행 시간 중앙값, 'scans': 스캔 노드 목록}
+    """
+    timings = []
+    plan = None
+    with connection.cursor() as cursor:
+        for _ in range(repeat):
+            cursor.execute(f'EXPLAIN (ANALYZE, FORMAT JSON) {sql}', params)
+            result = cursor.fetchone()[0]
+            if isinstance(result, str):
+                result = json.loads(result)
+            timings.append(result[0]['Execution Time'])
+            plan = result[0]['Plan']
+    return {'ms': round(statistics.median(timings), 3), 'scans': _scan_nodes(plan)}
+
+
+class Command(BaseCommand):
+    help = 'gu 인덱스 유무에 따른 조회 쿼리 EXPLAIN ANALYZE 비교 (합성 데이터, 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--gu',
+            type=str,
+            default='영등포구',
+            help='측정 대상 구 (기본: 영등포구). 지원 목록은 지역 레지스트리(import_regions) 참고'
+        )
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=500,
+            help='구당 편의점 합성 행 수 (인허가는 3배, 기본: 500)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='쿼리별 반복 실행 횟수 (중앙값 사용, 기본: 3)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='합성 데이터 난수 시드'
+        )
+        parser.add_argument(
+            '--json',
+            type=str,
+            default=None,
+            help='결과를 JSON으로 저장할 경로'
+        )
+        parser.add_argument(
+            '--i-know',
+            action='store_true',
+            help='DEBUG=False에서도 실행 (실제 테이블에 합성 행 삽입 + DROP INDEX 잠금, 운영 DB 금지)'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.ERROR('benchmark_queries는 PostgreSQL(EXPLAIN ANALYZE) 전용입니다.'))
+            return
+
+        if not settings.DEBUG and not options['i_know']:
+            self.stdout.write(self.style.ERROR(
+                f"benchmark_queries는 '{connection.settings_dict['NAME']}' 테이블에 합성 행을 넣고 "
+                "인덱스를 DROP합니다(롤백 전까지 테이블 잠금). DEBUG=False에서는 --i-know가 필요합니다."
+            ))
+            return
+
+        target_gu = options['gu']
+        try:
+            get_gu_info(target_gu)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+
+        rows = max(1, options['rows'])
+        repeat = max(1, options['repeat'])
+
+        with transaction.atomic():
+            seeded = self._seed(rows, random.Random(options['seed']))
+            self.stdout.write(f"🧪 합성 데이터: 25개 구 × {rows}행 기준 (총 {seeded}행)")
+
+            queries = benchmark_queries(target_gu)
+
+            self._analyze()
+            after = {name: explain(*build(), repeat=repeat) for name, _, build in queries}
+
+            with connection.cursor() as cursor:
+                for index in BENCHMARK_INDEXES:
+                    cursor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(index)}')
+            self._analyze()
+            before = {name: explain(*build(), repeat=repeat) for name, _, build in queries}
+
+            # 합성 데이터와 DROP INDEX 모두 되돌림
+            transaction.set_rollback(True)
+
+        report = []
+        self.stdout.write(self.style.SUCCESS(f"\n📊 {target_gu} 쿼리 실행 시간 (인덱스 없음 → 있음, 중앙값 ms)"))
+        for name, description, _ in queries:
+            entry = {
+                'query': name,
+                'description': description,
+                'before': before[name],
+                'after': after[name],
+            }
+            report.append(entry)
+            speedup = before[name]['ms'] / after[name]['ms'] if after[name]['ms'] else 0
+            self.stdout.write(
+                f"  {name:<28} {before[name]['ms']:>9.3f} → {after[name]['ms']:>9.3f} (x{speedup:.1f})  {description}"
+            )
+            self.stdout.write(f"      before: {', '.join(before[name]['scans'])}")
+            self.stdout.write(f"      after:  {', '.join(after[name]['scans'])}")
+
+        if options['json']:
+            with open(options['json'], 'w', encoding='utf-8') as f:
+                json.dump({
+                    'gu': target_gu,
+                    'rows_per_gu': rows,
+                    'repeat': repeat,
+                    'indexes': list(BENCHMARK_INDEXES),
+                    'queries': report,
+                }, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"💾 JSON 저장: {options['json']}"))
+
+    def _seed(self, rows, rng):
+        """25개 구 합성 데이터 bulk_create (고유키는 bench_ 접두어)"""
+        min_lng, min_lat, max_lng, max_lat = SEOUL_BBOX
+
+        def point():
+            return Point(rng.uniform(min_lng, max_lng), rng.uniform(min_lat, max_lat), srid=4326)
+
+        daisos, conveniences, closures, licenses, tobaccos = [], [], [], [], []
+        for gu in list_supported_gu():
+            code = get_gu_info(gu)['code']
+            for i in range(max(1, rows // DAISO_PER_ROWS)):
+                daisos.append(YeongdeungpoDaiso(
+                    name=f'벤치 다이소 {code}{i}', address=f'서울 {gu}', daiso_id=f'bench_{code}_{i}',
+                    gu=gu, location=point(),
+                ))
+            for i in range(rows * ROW_RATIOS['convenience']):
+                conveniences.append(YeongdeungpoConvenience(
+                    place_id=f'bench_{code}_{i}', base_daiso='', gu=gu, name=f'벤치 편의점 {i}',
+                    address=f'서울 {gu}', distance=0, location=point(),
+                ))
+            for i in range(rows * ROW_RATIOS['closure']):
+                location = point()
+                closures.append(StoreClosureResult(
+                    place_id=f'bench_{code}_{i}', name=f'벤치 편의점 {i}', address=f'서울 {gu}', gu=gu,
+                    latitude=location.y, longitude=location.x, location=location,
+                    status='폐업' if rng.random() < 0.1 else '정상', match_flags=rng.randrange(8),
+                ))
+            for i in range(rows * ROW_RATIOS['license']):
+                licenses.append(SeoulRestaurantLicense(
+                    mgtno=f'bench_{code}_{i}', bplcnm=f'벤치 인허가 {i}', gu=gu,
+                    uptaenm='편의점' if i % 3 == 0 else '기타 휴게음식점',
+                    trdstatenm='영업/정상' if rng.random() < 0.6 else '폐업', location=point(),
+                ))
+            for i in range(rows * ROW_RATIOS['tobacco']):
+                tobaccos.append(TobaccoRetailLicense(
+                    mgtno=f'bench_{code}_{i}', bplcnm=f'벤치 담배소매 {i}', gu=gu,
+                    trdstatenm='영업/정상' if rng.random() < 0.6 else '폐업', location=point(),
+                ))
+
+        total = 0
+        for model, objects in (
+            (YeongdeungpoDaiso, daisos),
+            (YeongdeungpoConvenience, conveniences),
+            (StoreClosureResult, closures),
+            (SeoulRestaurantLicense, licenses),
+            (TobaccoRetailLicense, tobaccos),
+        ):
+            model.objects.bulk_create(objects, batch_size=2000)
+            total += len(objects)
+        return total
+
+    def _analyze(self):
+        """플래너 통계 갱신 (합성 데이터/인덱스 변경 반영)"""
+        with connection.cursor() as cursor:
+            for model in (YeongdeungpoDaiso, YeongdeungpoConvenience, StoreClosureResult,
+                          SeoulRestaurantLicense, TobaccoRetailLicense):
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
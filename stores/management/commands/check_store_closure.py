@@ -23,7 +23,8 @@ import pandas as pd
 from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point
 from stores.models import SeoulRestaurantLicense, TobaccoRetailLicense, YeongdeungpoConvenience, StoreClosureResult
-from .gu_codes import list_supported_gu
+from stores.history import record_closure_history
+from stores.staging import StagedReload
 
 
 def normalize_name(name):
@@ -94,7 +95,7 @@ class Command(BaseCommand):
             '--gu',
             type=str,
             default='영등포구',
-            help=f'대상 구 (기본: 영등포구). 지원: {", ".join(list_supported_gu())}'
+            help='대상 구 (기본: 영등포구). 지원 목록은 지역 레지스트리(import_regions) 참고'
         )
         parser.add_argument(
             '--decimals',
@@ -117,7 +118,7 @@ class Command(BaseCommand):
             '--clear',
             action='store_true',
             default=False,
-            help='실행 전 해당 구의 기존 데이터 삭제'
+            help='해당 구의 기존 데이터를 이번 결과로 교체 (저장 완료 시 원자적 교체)'
         )
 
     def handle(self, *args, **options):
@@ -128,11 +129,6 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f"🔍 {target_gu} 폐업 매장 체크 프로그램"))
         self.stdout.write(self.style.SUCCESS("=" * 70))
 
-        # 기존 데이터 삭제
-        if options['clear']:
-            deleted_count, _ = StoreClosureResult.objects.filter(gu=target_gu).delete()
-            self.stdout.write(self.style.WARNING(f"\n🧹 기존 {target_gu} 데이터 {deleted_count}건 삭제 완료"))
-        
         # ========================================
         # 1단계: 카카오 API 편의점 데이터 로드 (기준 데이터) - 해당 구만
         # ========================================
@@ -274,27 +270,27 @@ class Command(BaseCommand):
         
         for store in kakao_data:
             is_matched = False
-            match_reasons = []
+            match_flags = 0
             
             # 이름 매칭
             if store['name_norm'] and store['name_norm'] in all_names:
                 is_matched = True
-                match_reasons.append("이름")
+                match_flags |= StoreClosureResult.MATCH_NAME
             
             # 주소 매칭
             if store['address_norm'] and store['address_norm'] in all_addresses:
                 is_matched = True
-                match_reasons.append("주소")
+                match_flags |= StoreClosureResult.MATCH_ADDRESS
             
             # 좌표 매칭
             coord = (store['lat_round'], store['lng_round'])
             if coord[0] is not None and coord[1] is not None and coord in all_coords:
                 is_matched = True
-                match_reasons.append("좌표")
+                match_flags |= StoreClosureResult.MATCH_COORD
             
             # 결과 저장
             status = "정상" if is_matched else "폐업"
-            match_reason = ", ".join(match_reasons) if match_reasons else "없음"
+            match_reason = StoreClosureResult.reason_label(match_flags)
             
             if is_matched:
                 normal_count += 1
@@ -308,7 +304,8 @@ class Command(BaseCommand):
                 '위도': store['lat'],
                 '경도': store['lng'],
                 '상태': status,
-                '매칭이유': match_reason
+                '매칭이유': match_reason,
+                'match_flags': match_flags,
             })
         
         # ========================================
@@ -331,6 +328,10 @@ class Command(BaseCommand):
             new_count = 0
             update_count = 0
             
+            # 기존 데이터 교체 옵션: 스테이징 테이블에 저장 후 해당 구 결과와 한 번에 교체
+            reload = StagedReload(StoreClosureResult, target_gu) if options['clear'] else None
+            model = reload.begin() if reload else StoreClosureResult
+            
             for r in results:
                 lat = r['위도']
                 lng = r['경도']
@@ -338,17 +339,17 @@ class Command(BaseCommand):
                 
                 # Race Condition 방지: transaction.atomic + select_for_update
                 with transaction.atomic():
-                    obj, created = StoreClosureResult.objects.select_for_update().update_or_create(
+                    obj, created = model.objects.select_for_update().update_or_create(
                         place_id=r['place_id'],
+                        gu=target_gu,  # place_id는 구별 고유키 (place_id, gu)
                         defaults={
                             'name': r['이름'],
                             'address': r['주소'],
-                            'gu': target_gu,  # 구 정보 저장
                             'latitude': lat,
                             'longitude': lng,
                             'location': location,
                             'status': r['상태'],
-                            'match_reason': r['매칭이유'],
+                            'match_flags': r['match_flags'],
                         }
                     )
                 if created:
@@ -357,6 +358,16 @@ class Command(BaseCommand):
                     update_count += 1
             
             self.stdout.write(self.style.SUCCESS(f"  ✅ DB 저장 완료: 신규 {new_count}건, 업데이트 {update_count}건"))
+            if reload:
+                swapped = reload.finish(new_count > 0)
+                if swapped is None:
+                    self.stdout.write(self.style.ERROR(f"  🧹 저장 0건 - 기존 {target_gu} 데이터 유지"))
+                else:
+                    self.stdout.write(self.style.WARNING(f"  🔄 {target_gu} 결과 {swapped}건으로 교체"))
+
+            # 상태/매칭 이유가 바뀐 매장만 이력 추가 (INSERT ... SELECT 1회)
+            changed_count = record_closure_history(target_gu)
+            self.stdout.write(f"  📜 상태 변경 이력: {changed_count}건 추가")
         
         # 폐업 매장 샘플 출력
         closed_stores = [r for r in results if r['상태'] == '폐업']
@@ -0,0 +1,124 @@
+# stores/management/commands/collect_worker.py
+"""
+수집 작업 워커 커맨드
+
+CollectionJob 대기열에서 작업을 SELECT ... FOR UPDATE SKIP LOCKED로 하나씩 가져가 실행한다.
+여러 프로세스/호스트에서 동시에 실행하면 구별 작업이 병렬로 처리된다.
+
+사용법:
+    python manage.py collect_worker                       # 계속 대기하며 처리
+    python manage.py collect_worker --once                # 대기열이 비면 종료
+    python manage.py collect_worker --enqueue 영등포구 강남구   # 작업 등록 후 처리
+
+    # 전국 배치: 활성 지역 전체를 과거 실행 시간 기준 4개 샤드로 등록 (등록만 하고 종료)
+    python manage.py collect_worker --enqueue-all --shards 4 --no-work
+    python manage.py collect_worker --shard 0            # 워커마다 자기 샤드부터 처리 (없으면 다른 샤드)
+"""
+
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from stores.jobs import WORKER_ID, enqueue_job, enqueue_regions, run_worker
+from .gu_codes import get_gu_info
+
+
+class Command(BaseCommand):
+    help = '수집 작업 워커 (CollectionJob 대기열 처리, SKIP LOCKED)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 처리하면 종료'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='대기열이 비었을 때 재확인 주기 (초, 기본: 2)'
+        )
+        parser.add_argument(
+            '--enqueue',
+            nargs='+',
+            metavar='GU',
+            help='작업 등록할 구 목록 (API 키는 환경변수 사용). 지원 목록은 지역 레지스트리(import_regions) 참고'
+        )
+        parser.add_argument(
+            '--enqueue-all',
+            action='store_true',
+            help='활성 지역 전체 등록 (과거 실행 시간 기준 LPT 샤드 배정)'
+        )
+        parser.add_argument(
+            '--shards',
+            type=int,
+            default=1,
+            help='--enqueue-all 샤드(워커) 수 (기본: 1)'
+        )
+        parser.add_argument(
+            '--shard',
+            type=int,
+            default=None,
+            help='이 워커가 우선 처리할 샤드 번호 (자기 샤드가 비면 다른 샤드 작업 처리)'
+        )
+        parser.add_argument(
+            '--no-work',
+            action='store_true',
+            help='작업 등록만 하고 처리하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        for gu in options.get('enqueue') or []:
+            try:
+                get_gu_info(gu)
+            except ValueError as e:
+                self.stdout.write(self.style.ERROR(str(e)))
+                continue
+            job = enqueue_job(gu)
+            if job is None:
+                self.stdout.write(self.style.WARNING(f'{gu}: 이미 대기/실행 중인 작업이 있어 건너뜀'))
+                continue
+            self.stdout.write(f'📥 작업 등록: #{job.pk} {gu}')
+
+        if options['enqueue_all']:
+            jobs, plan = enqueue_regions(shards=options['shards'])
+            for entry in plan:
+                self.stdout.write(
+                    f"🧩 샤드 {entry['shard']}: {len(entry['regions'])}개 지역, 예상 {entry['load']:.0f}초"
+                )
+            self.stdout.write(f'📥 작업 등록: {len(jobs)}개 지역')
+
+        if options['no_work']:
+            return
+
+        # SIGTERM/SIGINT: 진행 중인 작업은 마치고 종료
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            self.stdout.write(self.style.WARNING('\n종료 요청 - 현재 작업 완료 후 종료합니다.'))
+            stop_event.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        shard = options['shard']
+        shard_label = f', 샤드 {shard}' if shard is not None else ''
+        self.stdout.write(self.style.SUCCESS(f'🛠️ 수집 워커 시작 ({WORKER_ID}{shard_label})'))
+        processed = run_worker(
+            worker_id=WORKER_ID,
+            once=options['once'],
+            poll_interval=options['poll_interval'],
+            stop_event=stop_event,
+            on_job=self.report_job,
+            shard=shard,
+        )
+        self.stdout.write(self.style.SUCCESS(f'워커 종료 (처리 작업 {processed}개)'))
+
+    def report_job(self, job, finished):
+        if not finished:
+            self.stdout.write(self.style.WARNING(f'\n▶️ 작업 #{job.pk} {job.gu} 시작'))
+        elif job.status == job.STATUS_COMPLETED:
+            self.stdout.write(self.style.SUCCESS(f'✅ 작업 #{job.pk} {job.gu} 완료'))
+        else:
+            self.stdout.write(self.style.ERROR(f'❌ 작업 #{job.pk} {job.gu} 실패: {job.error}'))
@@ -3,9 +3,13 @@
 서울시 25개 구별 OpenAPI 서비스명 매핑
 - 휴게음식점 인허가: LOCALDATA_072405_XX
 - 담배소매업 인허가: LOCALDATA_114302_XX
+
+조회 함수는 지역 레지스트리(Region 테이블, stores/regions.py)를 읽는다.
+GU_CODES는 레지스트리 초기값(migrations/0018)이자 DB를 쓸 수 없을 때의 기본값이다.
+지역 추가는 이 dict가 아니라 python manage.py import_regions 로 한다.
 """
 
-# 서울시 구별 API 코드 매핑
+# 서울시 구별 API 코드 매핑 (레지스트리 초기값)
 # 참고: 서울시 OpenAPI 서비스명 suffix는 구별로 다름
 GU_CODES = {
     '강남구': {'code': 'GN', 'restaurant': 'LOCALDATA_072405_GN', 'tobacco': 'LOCALDATA_114302_GN'},
@@ -37,10 +41,13 @@ GU_CODES = {
 
 
 def get_gu_info(gu_name):
-    """구 이름으로 API 코드 정보 조회"""
-    if gu_name not in GU_CODES:
-        raise ValueError(f"지원하지 않는 구: {gu_name}. 지원 구 목록: {list(GU_CODES.keys())}")
-    return GU_CODES[gu_name]
+    """구(지역 키)로 API 코드 정보 조회 ({'code', 'restaurant', 'tobacco', 'sido', 'daiso_keyword'})"""
+    from stores.regions import get_registry
+
+    registry = get_registry()
+    if gu_name not in registry:
+        raise ValueError(f"지원하지 않는 구: {gu_name}. 지원 구 목록: {list(registry.keys())}")
+    return registry[gu_name]
 
 
 def get_restaurant_service(gu_name):
@@ -54,5 +61,7 @@ def get_tobacco_service(gu_name):
 
 
 def list_supported_gu():
-    """지원하는 구 목록 반환"""
-    return list(GU_CODES.keys())
+    """지원하는 구(활성 지역) 목록 반환"""
+    from stores.regions import get_registry
+
+    return list(get_registry().keys())
@@ -0,0 +1,125 @@
+# stores/management/commands/import_regions.py
+"""
+지역 레지스트리 적재 커맨드
+
+CSV의 시도/시군구를 Region 테이블에 upsert하고
+경계(WKT/GeoJSON)가 있으면 GuBoundary에, 파티션 테이블에는 새 지역 파티션을 만든다.
+Python dict(GU_CODES)를 고치지 않고 전국 시군구를 추가하기 위한 진입점이다.
+
+CSV 컬럼 (헤더 필수):
+    sido, sigungu, code, restaurant_service, tobacco_service   필수
+    key            생략 시 서울은 시군구 이름, 그 외는 '부산 중구'처럼 시도 약칭 + 시군구
+    daiso_keyword  생략 시 시군구 이름에서 '구/시/군' 제거
+    boundary       WKT 또는 GeoJSON geometry (WGS84)
+    enabled        0/false면 수집 대상에서 제외
+
+사용법:
+    python manage.py import_regions regions.csv
+    python manage.py import_regions regions.csv --dry-run
+"""
+
+import csv
+
+from django.contrib.gis.geos import GEOSException, GEOSGeometry, MultiPolygon
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from stores.gu_boundaries import reset_gu_classifier
+from stores.models import GuBoundary, Region
+from stores.partitioning import PARTITIONED_TABLES, create_gu_partitions, is_partitioned
+from stores.regions import DEFAULT_SIDO, SIDO_ALIASES, clear_region_cache, default_daiso_keyword
+
+
+REQUIRED_COLUMNS = ('sido', 'sigungu', 'code', 'restaurant_service', 'tobacco_service')
+
+
+def region_key(sido, sigungu):
+    """gu 컬럼 값 (서울은 기존 구 이름 그대로)"""
+    if sido == DEFAULT_SIDO:
+        return sigungu
+    return f"{SIDO_ALIASES.get(sido, sido)} {sigungu}"
+
+
+def parse_boundary(value):
+    """WKT/GeoJSON → MultiPolygon (Polygon은 한 개짜리 MultiPolygon으로, 없으면 None)"""
+    if not value:
+        return None
+    try:
+        geometry = GEOSGeometry(value, srid=4326)
+    except (GEOSException, ValueError) as e:
+        raise CommandError(f'경계 형식 오류: {e}')
+    if geometry.geom_type == 'Polygon':
+        geometry = MultiPolygon(geometry, srid=4326)
+    if geometry.geom_type != 'MultiPolygon':
+        raise CommandError(f'경계는 Polygon/MultiPolygon이어야 합니다: {geometry.geom_type}')
+    return geometry
+
+
+class Command(BaseCommand):
+    help = '지역 레지스트리 적재 (CSV → Region/GuBoundary, 파티션 생성)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, help='지역 CSV 경로 (UTF-8)')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='검증만 하고 저장하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        with open(options['path'], encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        missing = [column for column in REQUIRED_COLUMNS if rows and column not in rows[0]]
+        if not rows or missing:
+            raise CommandError(f'필수 컬럼 누락: {", ".join(missing or REQUIRED_COLUMNS)}')
+
+        regions = []
+        for line, row in enumerate(rows, 2):
+            values = {column: (row.get(column) or '').strip() for column in row}
+            if not all(values.get(column) for column in REQUIRED_COLUMNS):
+                raise CommandError(f'{line}행: 필수 값 누락')
+            regions.append({
+                'key': values.get('key') or region_key(values['sido'], values['sigungu']),
+                'sido': values['sido'],
+                'sigungu': values['sigungu'],
+                'code': values['code'].upper(),
+                'restaurant_service': values['restaurant_service'],
+                'tobacco_service': values['tobacco_service'],
+                'daiso_keyword': values.get('daiso_keyword') or default_daiso_keyword(values['sigungu']),
+                'enabled': values.get('enabled', '').lower() not in ('0', 'false', 'n'),
+                'boundary': parse_boundary(values.get('boundary')),
+            })
+
+        self.stdout.write(f'📄 {len(regions)}개 지역 ({sum(1 for r in regions if r["boundary"] is not None)}개 경계 포함)')
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('[DRY RUN] 저장 생략'))
+            return
+
+        created_count = 0
+        with transaction.atomic():
+            for region in regions:
+                boundary = region.pop('boundary')
+                key = region.pop('key')
+                _, created = Region.objects.update_or_create(key=key, defaults=region)
+                created_count += created
+                if boundary is not None:
+                    GuBoundary.objects.update_or_create(
+                        gu=key, defaults={'boundary': boundary, 'area_km2': self.area_km2(boundary)}
+                    )
+        clear_region_cache()
+        reset_gu_classifier()
+
+        # 새 지역 파티션 (DEFAULT 파티션에 들어가지 않도록 수집 전에 생성)
+        partitions = sum(
+            create_gu_partitions(table) for table in PARTITIONED_TABLES if is_partitioned(table)
+        ) if connection.vendor == 'postgresql' else 0
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 지역 {created_count}개 추가, {len(regions) - created_count}개 갱신, 파티션 {partitions}개 생성'
+        ))
+
+    @staticmethod
+    def area_km2(boundary):
+        # 면적은 UTM 52N 투영 후 계산 (국내 전역 근사)
+        return round(boundary.transform(32652, clone=True).area / 1_000_000, 2)
@@ -8,26 +8,11 @@
 import os
 import requests
 from django.core.management.base import BaseCommand
-from django.contrib.gis.geos import Point
-from pyproj import Transformer
 from stores.models import TobaccoRetailLicense
-from .gu_codes import get_tobacco_service, list_supported_gu
-
-
-# 좌표계 변환기: Korea 1985 / Central Belt (EPSG:5174) -> WGS84 (EPSG:4326)
-# 서울시 OpenAPI의 X, Y 좌표는 EPSG:5174 좌표계 사용
-transformer = Transformer.from_crs("EPSG:5174", "EPSG:4326", always_xy=True)
-
-
-def convert_tm_to_wgs84(x, y):
-    """TM 좌표를 WGS84 위도/경도로 변환"""
-    try:
-        x_float = float(x)
-        y_float = float(y)
-        lon, lat = transformer.transform(x_float, y_float)
-        return lat, lon  # latitude, longitude
-    except (ValueError, TypeError):
-        return None, None
+from stores.coordinates import tm_rows_to_wgs84
+from stores.license_fields import typed_license_values
+from stores.staging import StagedReload
+from .gu_codes import get_tobacco_service
 
 
 class Command(BaseCommand):
@@ -43,7 +28,7 @@ class Command(BaseCommand):
             '--gu',
             type=str,
             default='영등포구',
-            help=f'대상 구 (기본: 영등포구). 지원: {", ".join(list_supported_gu())}'
+            help='대상 구 (기본: 영등포구). 지원 목록은 지역 레지스트리(import_regions) 참고'
         )
         parser.add_argument(
             '--dry-run',
@@ -53,7 +38,12 @@ class Command(BaseCommand):
         parser.add_argument(
             '--clear',
             action='store_true',
-            help='기존 데이터 삭제 후 새로 저장',
+            help='기존 데이터를 새로 저장한 데이터로 교체 (저장 완료 시 원자적 교체)',
+        )
+        parser.add_argument(
+            '--api-key',
+            type=str,
+            help='서울시 OpenAPI 인증키 (기본: SEOUL_OPENAPI_KEY 환경변수)',
         )
         parser.add_argument(
             '--all',
@@ -65,6 +55,9 @@ class Command(BaseCommand):
         target_gu = options['gu']
         dry_run = options['dry_run']
         clear = options['clear']
+        
+        # 인증키 (우선순위: 인자 > 환경변수) - 수집 작업마다 다른 키를 쓸 수 있도록 실행 시점에 결정
+        self.API_KEY = options.get('api_key') or os.environ.get('SEOUL_OPENAPI_KEY', '')
         include_all = options['all']
         
         # 서비스명 동적 조회
@@ -77,10 +70,6 @@ class Command(BaseCommand):
         # 서비스명을 인스턴스 변수로 저장 (메서드에서 사용)
         self.service_name = service_name
         
-        if clear and not dry_run:
-            deleted_count = TobaccoRetailLicense.objects.filter(gu=target_gu).delete()[0]
-            self.stdout.write(self.style.WARNING(f'{target_gu} 기존 담배소매업 데이터 {deleted_count}건 삭제'))
-        
         self.stdout.write(self.style.SUCCESS(f'=== 서울시 {target_gu} 담배소매업 인허가 정보 수집 시작 ==='))
         self.stdout.write(f'서비스명: {service_name}')
         
@@ -125,8 +114,18 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING('\n[DRY RUN] DB 저장 생략'))
             self.print_sample_data(all_stores[:10])
         else:
-            saved_count, updated_count = self.save_to_db(all_stores, target_gu)
+            # 기존 데이터 교체 옵션: 스테이징 테이블에 저장 후 해당 구 데이터와 한 번에 교체
+            # (수집 중에도 기존 데이터가 유지됨)
+            reload = StagedReload(TobaccoRetailLicense, target_gu) if clear else None
+            model = reload.begin() if reload else TobaccoRetailLicense
+            saved_count, updated_count = self.save_to_db(all_stores, target_gu, model)
             self.stdout.write(self.style.SUCCESS(f'\nDB 저장 완료: 신규 {saved_count}건, 업데이트 {updated_count}건'))
+            if reload:
+                swapped = reload.finish(saved_count > 0)
+                if swapped is None:
+                    self.stdout.write(self.style.ERROR(f'저장 0건 - {target_gu} 기존 담배소매업 데이터 유지'))
+                else:
+                    self.stdout.write(self.style.WARNING(f'{target_gu} 담배소매업 데이터 {swapped}건으로 교체'))
         
         self.stdout.write(self.style.SUCCESS('=== 수집 완료 ==='))
 
@@ -162,13 +161,16 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f'데이터 조회 오류: {e}'))
             return []
 
-    def save_to_db(self, stores, target_gu):
-        """DB에 저장 (update_or_create 사용, Race Condition 방지)"""
+    def save_to_db(self, stores, target_gu, model=TobaccoRetailLicense):
+        """DB에 저장 (update_or_create 사용, Race Condition 방지, model: --clear 시 스테이징 모델)"""
         from django.db import transaction
         saved_count = 0
         updated_count = 0
         
-        for store in stores:
+        # TM 좌표(EPSG:5174) → WGS84 위도/경도 + 위치(EWKB) 페이지 단위 일괄 변환
+        coordinates = tm_rows_to_wgs84(stores)
+        
+        for store, (latitude, longitude, location) in zip(stores, coordinates):
             mgtno = store.get('MGTNO', '')
             if not mgtno:
                 continue
@@ -183,18 +185,8 @@ class Command(BaseCommand):
             if y_coord:
                 y_coord = y_coord.strip()
             
-            # TM 좌표를 WGS84(위도/경도)로 변환
-            latitude, longitude = None, None
-            location = None
-            
-            if x_coord and y_coord:
-                latitude, longitude = convert_tm_to_wgs84(x_coord, y_coord)
-                if latitude and longitude:
-                    location = Point(longitude, latitude, srid=4326)  # Point(x=lon, y=lat)
-            
             defaults = {
                 'opnsfteamcode': store.get('OPNSFTEAMCODE', ''),
-                'gu': target_gu,  # 구 정보 저장
                 'bplcnm': store.get('BPLCNM', ''),
                 'trdstategbn': store.get('TRDSTATEGBN', ''),
                 'trdstatenm': store.get('TRDSTATENM', ''),
@@ -225,11 +217,13 @@ class Command(BaseCommand):
                 'mwsrnm': store.get('MWSRNM', ''),
             }
             
+            # 일자/숫자 문자열은 타입 값으로 변환 (stores/license_fields.py)
             # Race Condition 방지: transaction.atomic + select_for_update
             with transaction.atomic():
-                obj, created = TobaccoRetailLicense.objects.select_for_update().update_or_create(
+                obj, created = model.objects.select_for_update().update_or_create(
                     mgtno=mgtno,
-                    defaults=defaults
+                    gu=target_gu,  # 관리번호는 구별 고유키 (mgtno, gu)
+                    defaults=typed_license_values(defaults)
                 )
             
             if created:
@@ -5,6 +5,7 @@
 사용법:
     python manage.py run_all --gu 영등포구
     python manage.py run_all --gu 강남구
+    python manage.py run_all --gu 영등포구 --export-static   # 완료 후 정적 지도 번들 생성
 
 실행 순서:
 1. 기존 데이터 전체 삭제
@@ -17,7 +18,12 @@
 
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-from .gu_codes import list_supported_gu, get_gu_info
+from stores.data_cache import bump_data_version
+from stores.analytics import refresh_hex_cells
+from stores.snapshot import write_snapshot
+from stores.static_export import export_static_bundle
+from stores.summary import refresh_gu_summary
+from .gu_codes import get_gu_info
 
 
 class Command(BaseCommand):
@@ -28,7 +34,7 @@ class Command(BaseCommand):
             '--gu',
             type=str,
             default='영등포구',
-            help=f'대상 구 (기본: 영등포구). 지원: {", ".join(list_supported_gu())}'
+            help='대상 구 (기본: 영등포구). 지원 목록은 지역 레지스트리(import_regions) 참고'
         )
         parser.add_argument(
             '--skip-daiso',
@@ -50,6 +56,17 @@ class Command(BaseCommand):
             action='store_true',
             help='폐업 검증 단계 스킵'
         )
+        parser.add_argument(
+            '--export-static',
+            action='store_true',
+            help='완료 후 구별 정적 지도 번들 생성 (HTML + 해시 데이터 파일)'
+        )
+        parser.add_argument(
+            '--export-dir',
+            type=str,
+            default=None,
+            help='정적 번들 출력 경로 (기본: settings.STATIC_EXPORT_DIR)'
+        )
 
     def handle(self, *args, **options):
         target_gu = options['gu']
@@ -65,6 +82,14 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f"🚀 {target_gu} 전체 파이프라인 시작"))
         self.stdout.write(self.style.SUCCESS("=" * 70))
         
+        try:
+            self.run_pipeline(target_gu, options)
+        finally:
+            # 데이터가 바뀌었으므로 구별 데이터 버전 갱신 (웹 뷰 캐시 무효화)
+            bump_data_version(target_gu)
+
+    def run_pipeline(self, target_gu, options):
+        """5단계 파이프라인 실행 (실패 시 해당 단계에서 중단)"""
         # Step 1: 다이소 수집
         if not options['skip_daiso']:
             self.stdout.write(self.style.WARNING(f"\n📦 [1/5] {target_gu} 다이소 수집..."))
@@ -123,6 +148,23 @@ class Command(BaseCommand):
         else:
             self.stdout.write(self.style.WARNING("\n⏭️ [5/5] 폐업 검증 스킵"))
         
+        # 구별 요약 통계 갱신 (대시보드/구별 비교 화면용)
+        summary = refresh_gu_summary(target_gu)
+        self.stdout.write(f"\n📊 요약: 편의점 {summary.convenience_count}개, 정상 {summary.normal_count}개, 폐업 {summary.closed_count}개")
+        
+        # 웹 조회용 결과 스냅샷 (mmap)
+        snapshot_count = write_snapshot(target_gu)
+        self.stdout.write(f"💾 결과 스냅샷 저장: {snapshot_count}건")
+        
+        # 육각 격자 폐업 밀도 (밀도 지도용)
+        hex_count = refresh_hex_cells(target_gu)
+        self.stdout.write(f"🔷 육각 격자 집계: {hex_count}개 셀")
+        
+        # 정적 지도 번들 (읽기 전용 열람용)
+        if options['export_static']:
+            manifest = export_static_bundle(target_gu, options['export_dir'])
+            self.stdout.write(f"🗂️ 정적 번들 생성: {', '.join(manifest['pages'])} + 데이터 {len(manifest['files'])}개")
+        
         # 완료
         self.stdout.write(self.style.SUCCESS("\n" + "=" * 70))
         self.stdout.write(self.style.SUCCESS(f"🎉 {target_gu} 전체 파이프라인 완료!"))
@@ -13,8 +13,11 @@ import time
 from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point
 from django.conf import settings
+from stores.gu_boundaries import get_gu_classifier
 from stores.models import YeongdeungpoDaiso
-from .gu_codes import list_supported_gu
+from stores.staging import StagedReload
+from stores.regions import sido_keywords
+from .gu_codes import get_gu_info
 
 
 class Command(BaseCommand):
@@ -25,12 +28,12 @@ class Command(BaseCommand):
             '--gu',
             type=str,
             default='영등포구',
-            help=f'대상 구 (기본: 영등포구). 지원: {", ".join(list_supported_gu())}'
+            help='대상 구 (기본: 영등포구). 지원 목록은 지역 레지스트리(import_regions) 참고'
         )
         parser.add_argument(
             '--clear',
             action='store_true',
-            help='기존 데이터를 삭제하고 새로 수집'
+            help='기존 데이터를 새로 수집한 데이터로 교체 (수집 완료 시 원자적 교체)'
         )
         parser.add_argument(
             '--api-key',
@@ -38,6 +41,16 @@ class Command(BaseCommand):
             help='카카오 API REST KEY (좌표 보완용)'
         )
 
+    def is_target_gu(self, address, target_gu, address_keywords, boundary_gu=None):
+        """
+        타겟 구 매장인지 확인 (좌표 기준 구 우선, 판별 불가 시 주소의 시도 + 시군구 이름)
+        """
+        if boundary_gu is not None:
+            return boundary_gu == target_gu
+        if not address:
+            return False
+        return any(k in address for k in address_keywords) and target_gu.split()[-1] in address
+
     def fetch_from_daiso_api(self, keyword):
         """다이소 공식 API에서 매장 목록 조회"""
         url = "https://fapi.daisomall.co.kr/ms/msg/selStr"
@@ -124,11 +137,14 @@ class Command(BaseCommand):
         
         target_gu = options['gu']
         
-        # 구 이름 끝의 '구'만 제거하여 키워드 생성 (예: 영등포구 → 영등포, 구로구 → 구로)
-        # 단, "중구"처럼 결과가 한 글자인 경우 검색어가 너무 짧아 원래 이름("중구") 사용
-        keyword = target_gu[:-1] if target_gu.endswith('구') else target_gu
-        if len(keyword) < 2:
-            keyword = target_gu
+        # 검색어/시도는 지역 레지스트리 값 사용 (기본: 영등포구 → 영등포, "중구"처럼 한 글자가 되면 원래 이름)
+        try:
+            region = get_gu_info(target_gu)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+        keyword = region['daiso_keyword']
+        address_keywords = sido_keywords(region['sido'])
         
         # 카카오 API 키 설정
         KAKAO_API_KEY = (
@@ -137,11 +153,6 @@ class Command(BaseCommand):
             os.environ.get('KAKAO_API_KEY', '')
         )
         
-        # 기존 데이터 삭제 옵션 (해당 구의 데이터만 삭제)
-        if options.get('clear'):
-            deleted_count = YeongdeungpoDaiso.objects.filter(gu=target_gu).delete()[0]
-            self.stdout.write(self.style.WARNING(f"🗑️ {target_gu} 기존 데이터 {deleted_count}개 삭제"))
-        
         self.stdout.write(self.style.SUCCESS("=" * 60))
         self.stdout.write(self.style.SUCCESS(f"📦 {target_gu} 다이소 수집 V2 시작 (공식 API + 카카오 보완)"))
         self.stdout.write(self.style.SUCCESS("=" * 60))
@@ -156,14 +167,27 @@ class Command(BaseCommand):
         
         self.stdout.write(f"  → API에서 {len(stores)}개 매장 발견")
         
-        # 서울 지역 매장만 필터링 (부산 강서구 등 다른 지역 제외)
+        # 대상 구 매장만 필터링: 좌표로 구 경계 판별 (배치 1회), 좌표가 없거나 경계 밖이면 주소의 시도 + 구 이름
+        # (검색어가 다른 구 매장 이름/주소에 걸리거나 서울 강서구 수집 시 부산 강서구가 섞이는 경우 제외)
+        classifier = get_gu_classifier()
+        boundary_gus = classifier.classify_items(stores, lng_key='strLitd', lat_key='strLttd')
         original_count = len(stores)
-        stores = [s for s in stores if '서울' in s.get('strAddr', '')]
+        stores = [
+            store for store, boundary_gu in zip(stores, boundary_gus)
+            if self.is_target_gu(store.get('strAddr', ''), target_gu, address_keywords, boundary_gu)
+        ]
         filtered_count = original_count - len(stores)
         
         if filtered_count > 0:
-            self.stdout.write(self.style.WARNING(f"  ⚠️ 서울 외 지역 {filtered_count}개 매장 필터링됨"))
-        self.stdout.write(f"  서울 지역 {len(stores)}개 매장 대상")
+            self.stdout.write(self.style.WARNING(f"  ⚠️ {target_gu} 외 지역 {filtered_count}개 매장 필터링됨"))
+        self.stdout.write(f"  {target_gu} {len(stores)}개 매장 대상")
+        
+        # 기존 데이터 교체 옵션: 스테이징 테이블에 수집 후 성공 시 해당 구 데이터와 교체
+        # (수집 중에도 지도에는 기존 데이터가 유지됨)
+        reload = StagedReload(YeongdeungpoDaiso, target_gu) if options.get('clear') else None
+        Daiso = reload.begin() if reload else YeongdeungpoDaiso
+        if reload:
+            self.stdout.write(self.style.WARNING(f"🔄 {target_gu} 스테이징 재수집 (완료 시 기존 데이터 교체)"))
         
         collected_count = 0
         sertify_count = 0
@@ -188,6 +212,11 @@ class Command(BaseCommand):
                     if coords and coords['lat'] != 0:
                         lat = coords['lat']
                         lng = coords['lng']
+                        # 보완한 좌표가 다른 구 경계 안이면 제외 (주소로만 통과한 매장)
+                        boundary_gu = classifier.gu_of(lng, lat)
+                        if boundary_gu is not None and boundary_gu != target_gu:
+                            self.stdout.write(self.style.WARNING(f"  ⚠️ 좌표 기준 {boundary_gu} 매장 - 제외"))
+                            continue
                         self.stdout.write(self.style.SUCCESS(f"  ✅ 좌표 보완 성공: ({lat}, {lng})"))
                         sertify_count += 1
                     else:
@@ -205,7 +234,7 @@ class Command(BaseCommand):
                 point = Point(lng, lat)
                 
                 with transaction.atomic():
-                    obj, created = YeongdeungpoDaiso.objects.select_for_update().update_or_create(
+                    obj, created = Daiso.objects.select_for_update().update_or_create(
                         daiso_id=store_code,  # 다이소 매장코드를 ID로 사용
                         defaults={
                             'name': f"다이소 {name}",
@@ -225,6 +254,13 @@ class Command(BaseCommand):
             
             time.sleep(0.2)  # API 호출 제한 방지
         
+        if reload:
+            swapped = reload.finish(collected_count > 0)
+            if swapped is None:
+                self.stdout.write(self.style.ERROR(f"🗑️ 수집 0건 - {target_gu} 기존 데이터 유지"))
+            else:
+                self.stdout.write(self.style.WARNING(f"🔄 {target_gu} 데이터 {swapped}개로 교체"))
+        
         # 결과 출력
         self.stdout.write("\n" + "=" * 60)
         self.stdout.write(self.style.SUCCESS("📊 수집 결과"))
@@ -15,6 +15,8 @@ from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point
 from django.conf import settings
 from stores.models import YeongdeungpoDaiso, YeongdeungpoConvenience
+from stores.gu_boundaries import annotate_boundary_gu, get_gu_classifier
+from stores.staging import StagedReload
 
 
 class Command(BaseCommand):
@@ -35,7 +37,7 @@ class Command(BaseCommand):
         parser.add_argument(
             '--clear',
             action='store_true',
-            help='기존 편의점 데이터 삭제 후 재수집'
+            help='기존 편의점 데이터를 재수집 데이터로 교체 (수집 완료 시 원자적 교체)'
         )
         parser.add_argument(
             '--radius',
@@ -50,10 +52,12 @@ class Command(BaseCommand):
             help='비동기 병렬 수집 모드 (4분면 동시 호출, 75% 성능 개선)'
         )
 
-    def is_target_gu(self, address, target_gu):
+    def is_target_gu(self, address, target_gu, boundary_gu=None):
         """
-        주소가 타겟 구인지 확인 (단순화된 필터)
+        타겟 구인지 확인 (좌표 기준 구 우선, 판별 불가 시 주소 문자열)
         """
+        if boundary_gu is not None:
+            return boundary_gu == target_gu
         if not address:
             return False
         return target_gu in address
@@ -80,11 +84,6 @@ class Command(BaseCommand):
         target_gu = options['gu']
         radius_km = options['radius']
         
-        # 기존 데이터 삭제 옵션 (해당 구의 데이터만 삭제)
-        if options['clear']:
-            deleted_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).delete()[0]
-            self.stdout.write(self.style.WARNING(f"{target_gu} 기존 편의점 데이터 {deleted_count}개 삭제"))
-        
         # 해당 구 다이소 전체 조회
         daiso_list = YeongdeungpoDaiso.objects.filter(gu=target_gu)
         total_daiso_count = daiso_list.count()
@@ -97,6 +96,13 @@ class Command(BaseCommand):
         
         use_async = options.get('use_async', False)
         
+        # 기존 데이터 교체 옵션: 스테이징 테이블에 수집 후 성공 시 해당 구 데이터와 교체
+        # (수집 중에도 지도에는 기존 편의점이 유지됨)
+        self.reload = StagedReload(YeongdeungpoConvenience, target_gu) if options['clear'] else None
+        self.store_model = self.reload.begin() if self.reload else YeongdeungpoConvenience
+        if self.reload:
+            self.stdout.write(self.style.WARNING(f"{target_gu} 스테이징 재수집 (완료 시 기존 편의점 데이터 교체)"))
+        
         self.stdout.write(self.style.SUCCESS(
             f"총 {total_daiso_count}개의 {target_gu} 다이소에 대해 편의점 수집을 시작합니다."
         ))
@@ -115,6 +121,7 @@ class Command(BaseCommand):
 
         total_collected = 0
         total_skipped = 0
+        classifier = get_gu_classifier()  # 구 경계 (좌표 기준 구 판별)
         
         for idx, daiso in enumerate(daiso_list, 1):
             if not daiso.location:
@@ -174,12 +181,15 @@ class Command(BaseCommand):
                         if not documents:
                             break
 
-                        for item in documents:
+                        # 페이지 단위 좌표 → 구 배치 판별
+                        boundary_gus = classifier.classify_items(documents)
+
+                        for item, boundary_gu in zip(documents, boundary_gus):
                             try:
                                 # [핵심] 타겟 구 필터링
                                 address = item.get('road_address_name') or item.get('address_name', '')
                                 
-                                if not self.is_target_gu(address, target_gu):
+                                if not self.is_target_gu(address, target_gu, boundary_gu):
                                     skipped_count += 1
                                     continue
                                 
@@ -191,8 +201,9 @@ class Command(BaseCommand):
                                 # place_id 기준 중복 방지 (Race Condition 방지: transaction.atomic 사용)
                                 from django.db import transaction
                                 with transaction.atomic():
-                                    YeongdeungpoConvenience.objects.select_for_update().update_or_create(
+                                    self.store_model.objects.select_for_update().update_or_create(
                                         place_id=item.get('id'),
+                                        gu=target_gu,  # place_id는 구별 고유키 (place_id, gu)
                                         defaults={
                                             'name': item.get('place_name'),
                                             'address': address,
@@ -200,7 +211,6 @@ class Command(BaseCommand):
                                             'location': point,
                                             'distance': dist,
                                             'base_daiso': daiso.name,
-                                            'gu': target_gu,  # 구 정보 저장
                                         }
                                     )
                                 stored_count += 1
@@ -222,12 +232,15 @@ class Command(BaseCommand):
             total_skipped += skipped_count
             time.sleep(0.3)
 
+        self._finish_reload(target_gu, total_collected > 0)
+
         # 최종 통계
         convenience_count = YeongdeungpoConvenience.objects.count()
         
-        # 타겟 구 외 데이터 확인
-        wrong_gu_count = sum(1 for c in YeongdeungpoConvenience.objects.all() 
-                           if not self.is_target_gu(c.address, target_gu))
+        # 타겟 구 외 데이터 확인 (저장된 좌표가 다른 구 경계 안에 있는 행, SQL ST_Contains)
+        wrong_gu_count = annotate_boundary_gu(
+            YeongdeungpoConvenience.objects.filter(gu=target_gu)
+        ).exclude(boundary_gu=target_gu).exclude(boundary_gu__isnull=True).count()
         
         self.stdout.write(self.style.SUCCESS(f"""
 --- 수집 완료 ---
@@ -244,6 +257,8 @@ class Command(BaseCommand):
                 f"⚠️ {target_gu} 아닌 편의점 {wrong_gu_count}개가 DB에 있습니다."
             ))
 
+        self._assign_nearest_daiso(target_gu)
+
     def _handle_async(self, api_key, daiso_list, target_gu, radius_km, total_daiso_count):
         """
         비동기 모드 편의점 수집 핸들러
@@ -280,8 +295,9 @@ class Command(BaseCommand):
                 address = item.get('road_address_name') or item.get('address_name', '')
                 
                 with transaction.atomic():
-                    YeongdeungpoConvenience.objects.update_or_create(
+                    self.store_model.objects.update_or_create(
                         place_id=item.get('id'),
+                        gu=target_gu,
                         defaults={
                             'name': item.get('place_name'),
                             'address': address,
@@ -289,7 +305,6 @@ class Command(BaseCommand):
                             'location': point,
                             'distance': int(item.get('distance', 0)),
                             'base_daiso': item.get('_base_daiso', ''),
-                            'gu': target_gu,
                         }
                     )
                 stored_count += 1
@@ -298,6 +313,8 @@ class Command(BaseCommand):
         
         elapsed = time_module.time() - start_time
         
+        self._finish_reload(target_gu, stored_count > 0)
+        
         # 최종 통계
         convenience_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).count()
         
@@ -316,3 +333,27 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING(
                 f"⚠️ 에러 {len(stats['errors'])}건: {stats['errors'][:3]}"
             ))
+
+        self._assign_nearest_daiso(target_gu)
+
+    def _finish_reload(self, target_gu, succeeded):
+        """--clear 스테이징 재수집 마무리 (성공 시 교체, 0건이면 기존 데이터 유지)"""
+        if not self.reload:
+            return
+        swapped = self.reload.finish(succeeded)
+        if swapped is None:
+            self.stdout.write(self.style.ERROR(f"수집 0건 - {target_gu} 기존 편의점 데이터 유지"))
+        else:
+            self.stdout.write(self.style.WARNING(f"{target_gu} 편의점 데이터 {swapped}개로 교체"))
+
+    def _assign_nearest_daiso(self, target_gu):
+        """
+        수집 후 최근접 다이소 재할당
+
+        place_id upsert 특성상 base_daiso/distance는 마지막으로 저장한 다이소 기준이므로
+        KNN 쿼리 1회로 실제 최근접 다이소와 거리(m)로 교체한다.
+        """
+        from stores.analytics import assign_nearest_daiso
+
+        updated = assign_nearest_daiso(target_gu)
+        self.stdout.write(self.style.SUCCESS(f"📍 최근접 다이소 재할당: {updated}개 갱신"))
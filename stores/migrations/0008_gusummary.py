@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0007_add_gu_field'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gu', models.CharField(max_length=20, unique=True, verbose_name='구')),
+                ('daiso_count', models.IntegerField(default=0, verbose_name='다이소 수')),
+                ('convenience_count', models.IntegerField(default=0, verbose_name='편의점 수')),
+                ('restaurant_count', models.IntegerField(default=0, verbose_name='휴게음식점 인허가 수')),
+                ('tobacco_count', models.IntegerField(default=0, verbose_name='담배소매업 인허가 수')),
+                ('closure_total', models.IntegerField(default=0, verbose_name='검증 대상 수')),
+                ('normal_count', models.IntegerField(default=0, verbose_name='정상 영업 수')),
+                ('closed_count', models.IntegerField(default=0, verbose_name='폐업 추정 수')),
+                ('name_match_count', models.IntegerField(default=0, verbose_name='이름 매칭 수')),
+                ('address_match_count', models.IntegerField(default=0, verbose_name='주소 매칭 수')),
+                ('coord_match_count', models.IntegerField(default=0, verbose_name='좌표 매칭 수')),
+                ('coords_missing', models.IntegerField(default=0, verbose_name='좌표 누락 편의점 수')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='갱신 일시')),
+            ],
+            options={
+                'verbose_name': '구별 요약 통계',
+                'verbose_name_plural': '구별 요약 통계 목록',
+                'db_table': 'gu_summary',
+                'ordering': ['gu'],
+            },
+        ),
+    ]
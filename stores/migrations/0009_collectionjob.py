@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0008_gusummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gu', models.CharField(max_length=20, verbose_name='대상 구')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '수집 중'), ('completed', '완료'), ('failed', '실패')], default='queued', max_length=10, verbose_name='상태')),
+                ('progress', models.IntegerField(default=0, verbose_name='진행률')),
+                ('message', models.CharField(blank=True, default='', max_length=300, verbose_name='메시지')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='오류')),
+                ('metrics', models.JSONField(blank=True, default=dict, verbose_name='상세 metrics')),
+                ('api_keys', models.JSONField(blank=True, default=dict, verbose_name='API 키')),
+                ('worker', models.CharField(blank=True, default='', max_length=100, verbose_name='처리 워커')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록 일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작 일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 일시')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 상태 갱신')),
+            ],
+            options={
+                'verbose_name': '수집 작업',
+                'verbose_name_plural': '수집 작업 목록',
+                'db_table': 'collection_job',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='collection_job_queue_idx')],
+            },
+        ),
+    ]
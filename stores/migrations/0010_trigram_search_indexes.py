@@ -0,0 +1,57 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0009_collectionjob'),
+    ]
+
+    operations = [
+        # gin_trgm_ops 연산자 클래스 (pg_trgm 확장)
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='seoulrestaurantlicense',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['bplcnm'], name='restaurant_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='seoulrestaurantlicense',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['rdnwhladdr'], name='restaurant_rdnaddr_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='seoulrestaurantlicense',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sitewhladdr'], name='restaurant_siteaddr_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='storeclosureresult',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='closure_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='storeclosureresult',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['address'], name='closure_address_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='tobaccoretaillicense',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['bplcnm'], name='tobacco_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='tobaccoretaillicense',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['rdnwhladdr'], name='tobacco_rdnaddr_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='tobaccoretaillicense',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sitewhladdr'], name='tobacco_siteaddr_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='yeongdeungpoconvenience',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='conv_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='yeongdeungpoconvenience',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['address'], name='conv_address_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0010_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HexCell',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gu', models.CharField(max_length=20, verbose_name='구')),
+                ('resolution', models.IntegerField(verbose_name='셀 크기(m)')),
+                ('i', models.IntegerField(verbose_name='격자 열')),
+                ('j', models.IntegerField(verbose_name='격자 행')),
+                ('geom', django.contrib.gis.db.models.fields.PolygonField(srid=4326, verbose_name='셀 영역')),
+                ('closure_total', models.IntegerField(default=0, verbose_name='검증 대상 수')),
+                ('normal_count', models.IntegerField(default=0, verbose_name='정상 영업 수')),
+                ('closed_count', models.IntegerField(default=0, verbose_name='폐업 추정 수')),
+                ('closure_rate', models.FloatField(default=0, verbose_name='폐업률(%)')),
+                ('license_count', models.IntegerField(default=0, verbose_name='인허가 편의점 수')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='갱신 일시')),
+            ],
+            options={
+                'verbose_name': '육각 격자 셀',
+                'verbose_name_plural': '육각 격자 셀 목록',
+                'db_table': 'hex_cell',
+                'indexes': [models.Index(fields=['resolution', 'gu'], name='hex_cell_resolution_idx')],
+                'constraints': [models.UniqueConstraint(fields=('gu', 'resolution', 'i', 'j'), name='hex_cell_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations
+
+from stores.partitioning import rebuild_table
+
+
+# 마이그레이션 시점의 대상 테이블/구 파티션 (지역 레지스트리 Region은 0018에서 생성되므로 고정 목록 사용)
+PARTITIONED_TABLES = (
+    'yeongdeungpo_convenience',
+    'yeongdeungpo_convenience_license',
+    'yeongdeungpo_tobacco_retail_license',
+    'store_closure_result',
+)
+
+GU_PARTITIONS = {
+    '강남구': 'gn',
+    '강동구': 'gd',
+    '강북구': 'gb',
+    '강서구': 'gs',
+    '관악구': 'ga',
+    '광진구': 'gj',
+    '구로구': 'gr',
+    '금천구': 'gc',
+    '노원구': 'nw',
+    '도봉구': 'db',
+    '동대문구': 'dd',
+    '동작구': 'dj',
+    '마포구': 'mp',
+    '서대문구': 'sm',
+    '서초구': 'sc',
+    '성동구': 'sd',
+    '성북구': 'sb',
+    '송파구': 'sp',
+    '양천구': 'yc',
+    '영등포구': 'yd',
+    '용산구': 'ys',
+    '은평구': 'ep',
+    '종로구': 'jn',
+    '중구': 'jg',
+    '중랑구': 'jr',
+}
+
+
+def partition_tables(apps, schema_editor):
+    # 파티셔닝은 PostgreSQL 전용
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in PARTITIONED_TABLES:
+        rebuild_table(schema_editor, table, partitioned=True, partitions=GU_PARTITIONS)
+
+
+def unpartition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in PARTITIONED_TABLES:
+        rebuild_table(schema_editor, table, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0012_gu_indexes'),
+    ]
+
+    operations = [
+        # 편의점/인허가/폐업 결과 테이블 → gu LIST 파티션 (stores/partitioning.py)
+        migrations.RunPython(partition_tables, unpartition_tables),
+    ]
@@ -0,0 +1,195 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+from stores.license_fields import TYPED_LICENSE_FIELDS
+
+
+BATCH_SIZE = 2000
+
+
+def normalize_license_strings(apps, schema_editor):
+    """
+    기존 문자열 값을 캐스팅 가능한 표준 형식으로 정리 (형식 오류/빈 값은 NULL)
+
+    이후 AlterField가 ALTER COLUMN ... TYPE ... USING 컬럼::타입으로 변환한다.
+    """
+    for model_name in ('SeoulRestaurantLicense', 'TobaccoRetailLicense'):
+        model = apps.get_model('stores', model_name)
+        names = {field.name for field in model._meta.get_fields()}
+        fields = [field for field in TYPED_LICENSE_FIELDS if field in names]
+
+        batch = []
+        for obj in model.objects.only('id', 'gu', *fields).iterator(chunk_size=BATCH_SIZE):
+            for field in fields:
+                value = TYPED_LICENSE_FIELDS[field](getattr(obj, field))
+                setattr(obj, field, value.isoformat() if hasattr(value, 'isoformat') else
+                        (str(value) if value is not None else None))
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0013_partition_by_gu'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_license_strings, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='apvcancelymd',
+            field=models.DateField(blank=True, null=True, verbose_name='인허가취소일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='apvpermymd',
+            field=models.DateField(blank=True, null=True, verbose_name='인허가일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='clgenddt',
+            field=models.DateField(blank=True, null=True, verbose_name='휴업종료일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='clgstdt',
+            field=models.DateField(blank=True, null=True, verbose_name='휴업시작일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='dcbymd',
+            field=models.DateField(blank=True, null=True, verbose_name='폐업일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='faciltotscp',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='시설총규모'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='lastmodts',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='최종수정일시'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='maneipcnt',
+            field=models.IntegerField(blank=True, null=True, verbose_name='남성종사자수'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='ropnymd',
+            field=models.DateField(blank=True, null=True, verbose_name='재개업일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='sitearea',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='소재지면적'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='totepnum',
+            field=models.IntegerField(blank=True, null=True, verbose_name='총인원'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='updatedt',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='데이터갱신일자'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='wmeipcnt',
+            field=models.IntegerField(blank=True, null=True, verbose_name='여성종사자수'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='x',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=15, null=True, verbose_name='좌표X (TM)'),
+        ),
+        migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='y',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=15, null=True, verbose_name='좌표Y (TM)'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='apvcancelymd',
+            field=models.DateField(blank=True, null=True, verbose_name='인허가취소일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='apvpermymd',
+            field=models.DateField(blank=True, null=True, verbose_name='인허가일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='asgnymd',
+            field=models.DateField(blank=True, null=True, verbose_name='지정일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='clgenddt',
+            field=models.DateField(blank=True, null=True, verbose_name='휴업종료일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='clgstdt',
+            field=models.DateField(blank=True, null=True, verbose_name='휴업시작일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='dcbymd',
+            field=models.DateField(blank=True, null=True, verbose_name='폐업일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='lastmodts',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='최종수정일시'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='ropnymd',
+            field=models.DateField(blank=True, null=True, verbose_name='재개업일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='sitearea',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='소재지면적'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='updatedt',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='데이터갱신일자'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='x',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=15, null=True, verbose_name='좌표X (TM)'),
+        ),
+        migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='y',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=15, null=True, verbose_name='좌표Y (TM)'),
+        ),
+        migrations.AddIndex(
+            model_name='seoulrestaurantlicense',
+            index=models.Index(fields=['dcbymd'], name='restaurant_closed_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seoulrestaurantlicense',
+            index=models.Index(fields=['apvpermymd'], name='restaurant_permit_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tobaccoretaillicense',
+            index=models.Index(fields=['dcbymd'], name='tobacco_closed_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tobaccoretaillicense',
+            index=models.Index(fields=['apvpermymd'], name='tobacco_permit_date_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0014_typed_license_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoreClosureHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('place_id', models.CharField(max_length=50, verbose_name='카카오 Place ID')),
+                ('gu', models.CharField(max_length=20, verbose_name='구')),
+                ('status', models.CharField(choices=[('정상', '정상 영업'), ('폐업', '폐업 추정')], max_length=10, verbose_name='상태')),
+                ('previous_status', models.CharField(blank=True, choices=[('정상', '정상 영업'), ('폐업', '폐업 추정')], max_length=10, null=True, verbose_name='이전 상태')),
+                ('match_reason', models.CharField(max_length=100, verbose_name='매칭 이유')),
+                ('changed_at', models.DateTimeField(verbose_name='변경 일시')),
+            ],
+            options={
+                'verbose_name': '폐업 검증 상태 이력',
+                'verbose_name_plural': '폐업 검증 상태 이력 목록',
+                'db_table': 'store_closure_history',
+                'indexes': [models.Index(fields=['gu', 'changed_at'], name='closure_history_gu_time_idx'), models.Index(fields=['place_id', '-changed_at'], name='closure_history_place_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+# StoreClosureResult.MATCH_LABELS (마이그레이션 시점 고정)
+MATCH_LABELS = ((1, '이름'), (2, '주소'), (4, '좌표'))
+NO_MATCH_LABEL = '없음'
+MODELS = ('StoreClosureResult', 'StoreClosureHistory')
+
+
+def reasons_to_flags(apps, schema_editor):
+    # '이름, 주소, 좌표' 문자열 → 비트 (근거별 UPDATE 1회)
+    for model_name in MODELS:
+        model = apps.get_model('stores', model_name)
+        for bit, label in MATCH_LABELS:
+            model.objects.filter(match_reason__contains=label).update(match_flags=F('match_flags') + bit)
+
+
+def flags_to_reasons(apps, schema_editor):
+    for model_name in MODELS:
+        model = apps.get_model('stores', model_name)
+        for flags in range(sum(bit for bit, _ in MATCH_LABELS) + 1):
+            labels = [label for bit, label in MATCH_LABELS if flags & bit]
+            model.objects.filter(match_flags=flags).update(match_reason=', '.join(labels) or NO_MATCH_LABEL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0015_storeclosurehistory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storeclosurehistory',
+            name='match_flags',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='매칭 근거'),
+        ),
+        migrations.AddField(
+            model_name='storeclosureresult',
+            name='match_flags',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='매칭 근거'),
+        ),
+        migrations.RunPython(reasons_to_flags, flags_to_reasons),
+        migrations.RemoveField(
+            model_name='storeclosurehistory',
+            name='match_reason',
+        ),
+        migrations.RemoveField(
+            model_name='storeclosureresult',
+            name='match_reason',
+        ),
+        migrations.AddIndex(
+            model_name='storeclosureresult',
+            index=models.Index(fields=['gu', 'match_flags'], name='closure_gu_flags_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+def load_boundaries(apps, schema_editor):
+    # 구 경계 폴리곤 초기 적재 (gu_boundary_data)
+    from stores.gu_boundaries import load_gu_boundaries
+
+    load_gu_boundaries(apps.get_model('stores', 'GuBoundary'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0016_match_flags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuBoundary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gu', models.CharField(max_length=20, unique=True, verbose_name='구')),
+                ('area_km2', models.FloatField(default=0, verbose_name='면적(km²)')),
+                ('boundary', django.contrib.gis.db.models.fields.PolygonField(srid=4326, verbose_name='경계')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신 일시')),
+            ],
+            options={
+                'verbose_name': '구 경계',
+                'verbose_name_plural': '구 경계 목록',
+                'db_table': 'gu_boundary',
+            },
+        ),
+        migrations.RunPython(load_boundaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+def seed(apps, schema_editor):
+    # 기존 GU_CODES(서울 25개 구)를 레지스트리 초기값으로 적재
+    from stores.regions import seed_regions
+
+    seed_regions(apps.get_model('stores', 'Region'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0017_gu_boundary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectionjob',
+            name='expected_seconds',
+            field=models.FloatField(default=0, verbose_name='예상 소요 시간(초)'),
+        ),
+        migrations.AddField(
+            model_name='collectionjob',
+            name='shard',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='샤드'),
+        ),
+        migrations.CreateModel(
+            name='Region',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=20, unique=True, verbose_name='지역 키')),
+                ('sido', models.CharField(max_length=20, verbose_name='시도')),
+                ('sigungu', models.CharField(max_length=20, verbose_name='시군구')),
+                ('code', models.CharField(max_length=10, unique=True, verbose_name='지역 코드')),
+                ('restaurant_service', models.CharField(max_length=50, verbose_name='휴게음식점 LOCALDATA 서비스명')),
+                ('tobacco_service', models.CharField(max_length=50, verbose_name='담배소매업 LOCALDATA 서비스명')),
+                ('daiso_keyword', models.CharField(blank=True, default='', max_length=20, verbose_name='다이소 검색어')),
+                ('enabled', models.BooleanField(default=True, verbose_name='수집 대상')),
+                ('cost_seconds', models.FloatField(default=0, verbose_name='평균 소요 시간(초)')),
+                ('run_count', models.IntegerField(default=0, verbose_name='완료 횟수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신 일시')),
+            ],
+            options={
+                'verbose_name': '수집 지역',
+                'verbose_name_plural': '수집 지역 목록',
+                'db_table': 'region',
+                'constraints': [models.UniqueConstraint(fields=('sido', 'sigungu'), name='region_sido_sigungu_unique')],
+            },
+        ),
+        migrations.RunPython(seed, migrations.RunPython.noop),
+    ]
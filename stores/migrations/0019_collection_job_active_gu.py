@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+def close_duplicate_active_jobs(apps, schema_editor):
+    # 제약 추가 전 구별 대기/실행 중 작업이 여러 개면 가장 최근 작업만 남기고 실패 처리
+    CollectionJob = apps.get_model('stores', 'CollectionJob')
+    seen = set()
+    duplicates = []
+    active = CollectionJob.objects.filter(status__in=['queued', 'running']).order_by('gu', '-created_at', '-pk')
+    for job in active.only('pk', 'gu'):
+        if job.gu in seen:
+            duplicates.append(job.pk)
+        seen.add(job.gu)
+    CollectionJob.objects.filter(pk__in=duplicates).update(
+        status='failed', error='중복 작업 정리', api_keys={},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0018_region_registry'),
+    ]
+
+    operations = [
+        migrations.RunPython(close_duplicate_active_jobs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='collectionjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['queued', 'running'])), fields=('gu',), name='collection_job_active_gu_unique'),
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+# (모델, 고유키 필드, 테이블, 제약 이름)
+UNIQUE_PER_GU = (
+    ('seoulrestaurantlicense', 'mgtno', 'yeongdeungpo_convenience_license', 'restaurant_mgtno_gu_unique'),
+    ('storeclosureresult', 'place_id', 'store_closure_result', 'closure_place_gu_unique'),
+    ('tobaccoretaillicense', 'mgtno', 'yeongdeungpo_tobacco_retail_license', 'tobacco_mgtno_gu_unique'),
+    ('yeongdeungpoconvenience', 'place_id', 'yeongdeungpo_convenience', 'conv_place_gu_unique'),
+)
+
+
+class NonPostgres(migrations.operations.base.Operation):
+    """PostgreSQL 외 DB에서만 스키마를 변경하는 래퍼 (상태 변경은 그대로 위임)"""
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    def state_forwards(self, app_label, state):
+        self.operation.state_forwards(app_label, state)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            self.operation.database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            self.operation.database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f'{self.operation.describe()} (PostgreSQL 외)'
+
+
+def _rename_unique(schema_editor, table, column, old_name, new_name):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'u' "
+            "AND pg_get_constraintdef(oid) = %s",
+            [table, f'UNIQUE ({column}, gu)'],
+        )
+        row = cursor.fetchone()
+        if row and (old_name is None or row[0] == old_name):
+            qn = schema_editor.quote_name
+            cursor.execute(f"ALTER TABLE {qn(table)} RENAME CONSTRAINT {qn(row[0])} TO {qn(new_name)}")
+
+
+def name_partition_constraints(apps, schema_editor):
+    # PostgreSQL은 0013 파티셔닝에서 이미 UNIQUE (고유키, gu)로 바뀜 → 모델 상태의 제약 이름만 맞춤
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, column, table, name in UNIQUE_PER_GU:
+        _rename_unique(schema_editor, table, column, None, name)
+
+
+def restore_constraint_names(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, column, table, name in UNIQUE_PER_GU:
+        _rename_unique(schema_editor, table, column, name, f'{table}_{column}_key')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0019_collection_job_active_gu'),
+    ]
+
+    operations = [
+        NonPostgres(migrations.AlterField(
+            model_name='seoulrestaurantlicense',
+            name='mgtno',
+            field=models.CharField(max_length=100, verbose_name='관리번호'),
+        )),
+        NonPostgres(migrations.AlterField(
+            model_name='storeclosureresult',
+            name='place_id',
+            field=models.CharField(max_length=50, verbose_name='카카오 Place ID'),
+        )),
+        NonPostgres(migrations.AlterField(
+            model_name='tobaccoretaillicense',
+            name='mgtno',
+            field=models.CharField(max_length=100, verbose_name='관리번호'),
+        )),
+        NonPostgres(migrations.AlterField(
+            model_name='yeongdeungpoconvenience',
+            name='place_id',
+            field=models.CharField(max_length=50),
+        )),
+        NonPostgres(migrations.AddConstraint(
+            model_name='seoulrestaurantlicense',
+            constraint=models.UniqueConstraint(fields=('mgtno', 'gu'), name='restaurant_mgtno_gu_unique'),
+        )),
+        NonPostgres(migrations.AddConstraint(
+            model_name='storeclosureresult',
+            constraint=models.UniqueConstraint(fields=('place_id', 'gu'), name='closure_place_gu_unique'),
+        )),
+        NonPostgres(migrations.AddConstraint(
+            model_name='tobaccoretaillicense',
+            constraint=models.UniqueConstraint(fields=('mgtno', 'gu'), name='tobacco_mgtno_gu_unique'),
+        )),
+        NonPostgres(migrations.AddConstraint(
+            model_name='yeongdeungpoconvenience',
+            constraint=models.UniqueConstraint(fields=('place_id', 'gu'), name='conv_place_gu_unique'),
+        )),
+        migrations.RunPython(name_partition_constraints, restore_constraint_names),
+    ]
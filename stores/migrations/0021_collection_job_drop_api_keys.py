@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0020_unique_per_gu'),
+    ]
+
+    operations = [
+        # 평문 API 키 컬럼 삭제 (키는 stores/jobs.py 단기 캐시로만 전달)
+        migrations.RemoveField(
+            model_name='collectionjob',
+            name='api_keys',
+        ),
+    ]
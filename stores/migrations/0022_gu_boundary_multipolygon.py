@@ -0,0 +1,101 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class NonPostgres(migrations.operations.base.Operation):
+    """PostgreSQL 외 DB에서만 스키마를 변경하는 래퍼 (상태 변경은 그대로 위임)"""
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    def state_forwards(self, app_label, state):
+        self.operation.state_forwards(app_label, state)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            self.operation.database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            self.operation.database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f'{self.operation.describe()} (PostgreSQL 외)'
+
+
+# PostgreSQL 외 DB는 테이블을 재생성하며 컬럼 타입을 바꾸므로, 기존 행을 잠시 보관했다가 다시 넣는다
+_stashed = []
+
+
+def _stash(apps):
+    GuBoundary = apps.get_model('stores', 'GuBoundary')
+    _stashed[:] = [
+        (row.gu, row.area_km2, row.boundary.wkb.tobytes())
+        for row in GuBoundary.objects.all()
+    ]
+    GuBoundary.objects.all().delete()
+
+
+def _restore(apps, multi):
+    from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
+
+    GuBoundary = apps.get_model('stores', 'GuBoundary')
+    for gu, area_km2, wkb in _stashed:
+        geometry = GEOSGeometry(wkb, srid=4326)
+        if multi and geometry.geom_type == 'Polygon':
+            geometry = MultiPolygon(geometry, srid=4326)
+        elif not multi and geometry.geom_type == 'MultiPolygon':
+            geometry = geometry[0]
+        GuBoundary.objects.create(gu=gu, area_km2=area_km2, boundary=geometry)
+    _stashed.clear()
+
+
+def stash_polygons(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        _stash(apps)
+
+
+def restore_polygons(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        _restore(apps, multi=False)
+
+
+def to_multipolygon(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        _restore(apps, multi=True)
+        return
+    schema_editor.execute(
+        'ALTER TABLE gu_boundary ALTER COLUMN boundary TYPE geometry(MultiPolygon, 4326) '
+        'USING ST_Multi(boundary)'
+    )
+
+
+def to_polygon(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        _stash(apps)
+        return
+    # 되돌릴 때는 첫 폴리곤만 남김 (ALTER ... USING에는 서브쿼리를 쓸 수 없음)
+    schema_editor.execute(
+        'ALTER TABLE gu_boundary ALTER COLUMN boundary TYPE geometry(Polygon, 4326) '
+        'USING ST_GeometryN(boundary, 1)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0021_collection_job_drop_api_keys'),
+    ]
+
+    operations = [
+        # 섬·비지(飛地)가 있는 시군구도 모든 폴리곤을 보관
+        migrations.RunPython(stash_polygons, restore_polygons),
+        NonPostgres(migrations.AlterField(
+            model_name='guboundary',
+            name='boundary',
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(srid=4326, verbose_name='경계'),
+        )),
+        migrations.RunPython(to_multipolygon, to_polygon),
+    ]
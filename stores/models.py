@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GinIndex
 
 # 1. 다이소 지점들 자체를 저장할 모델 (서울 다이소 목록 저장용)
 class DaisoStore(models.Model):
@@ -46,6 +47,9 @@ class YeongdeungpoDaiso(models.Model):
         db_table = 'yeongdeungpo_daiso'
         verbose_name = '서울 다이소 (구별)'
         verbose_name_plural = '서울 다이소 목록 (구별)'
+        indexes = [
+            models.Index(fields=['gu'], name='daiso_gu_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] {self.name}"
@@ -54,7 +58,7 @@ class YeongdeungpoDaiso(models.Model):
 # 4. 서울 편의점 모델 (구별 저장 지원)
 class YeongdeungpoConvenience(models.Model):
     """서울 구별 다이소 주변 편의점 저장"""
-    place_id = models.CharField(max_length=50, unique=True)  # 카카오 고유 ID
+    place_id = models.CharField(max_length=50)  # 카카오 고유 ID (구별 유일, Meta.constraints)
     base_daiso = models.CharField(max_length=100)  # 기준이 된 다이소 지점명
     gu = models.CharField(max_length=20, default='영등포구', verbose_name='구')  # 구 정보
     
@@ -70,6 +74,16 @@ class YeongdeungpoConvenience(models.Model):
         db_table = 'yeongdeungpo_convenience'
         verbose_name = '서울 편의점 (구별)'
         verbose_name_plural = '서울 편의점 목록 (구별)'
+        indexes = [
+            models.Index(fields=['gu'], name='conv_gu_idx'),
+            # 매장 검색 (/api/search/, 관리자 검색) - pg_trgm 부분 일치/유사도 인덱스
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='conv_name_trgm_idx'),
+            GinIndex(fields=['address'], opclasses=['gin_trgm_ops'], name='conv_address_trgm_idx'),
+        ]
+        constraints = [
+            # gu 파티션 테이블의 UNIQUE는 파티션 키를 포함해야 함 (stores/partitioning.py)
+            models.UniqueConstraint(fields=['place_id', 'gu'], name='conv_place_gu_unique'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] {self.name} (near {self.base_daiso})"
@@ -78,7 +92,7 @@ class YeongdeungpoConvenience(models.Model):
 # 5. 서울시 Open API 휴게음식점 인허가 정보 (편의점 등)
 class SeoulRestaurantLicense(models.Model):
     """서울시 Open API에서 가져온 휴게음식점 인허가 정보 (구별 저장)"""
-    mgtno = models.CharField(max_length=100, unique=True, verbose_name='관리번호')  # 관리번호 (고유키)
+    mgtno = models.CharField(max_length=100, verbose_name='관리번호')  # 관리번호 (구별 고유키, Meta.constraints)
     opnsfteamcode = models.CharField(max_length=20, null=True, blank=True, verbose_name='개방자치단체코드')
     gu = models.CharField(max_length=20, default='영등포구', verbose_name='구')  # 구 정보
     
@@ -94,12 +108,12 @@ class SeoulRestaurantLicense(models.Model):
     dtlstatenm = models.CharField(max_length=50, null=True, blank=True, verbose_name='상세영업상태명')
     
     # 인허가/폐업/휴업 일자
-    apvpermymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='인허가일자')
-    apvcancelymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='인허가취소일자')
-    dcbymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='폐업일자')
-    clgstdt = models.CharField(max_length=20, null=True, blank=True, verbose_name='휴업시작일자')
-    clgenddt = models.CharField(max_length=20, null=True, blank=True, verbose_name='휴업종료일자')
-    ropnymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='재개업일자')
+    apvpermymd = models.DateField(null=True, blank=True, verbose_name='인허가일자')
+    apvcancelymd = models.DateField(null=True, blank=True, verbose_name='인허가취소일자')
+    dcbymd = models.DateField(null=True, blank=True, verbose_name='폐업일자')
+    clgstdt = models.DateField(null=True, blank=True, verbose_name='휴업시작일자')
+    clgenddt = models.DateField(null=True, blank=True, verbose_name='휴업종료일자')
+    ropnymd = models.DateField(null=True, blank=True, verbose_name='재개업일자')
     
     # 주소 정보
     sitewhladdr = models.CharField(max_length=300, null=True, blank=True, verbose_name='지번주소')
@@ -111,9 +125,9 @@ class SeoulRestaurantLicense(models.Model):
     sitetel = models.CharField(max_length=50, null=True, blank=True, verbose_name='전화번호')
     homepage = models.CharField(max_length=300, null=True, blank=True, verbose_name='홈페이지')
     
-    # 좌표 정보 (원본 TM 좌표)
-    x = models.CharField(max_length=50, null=True, blank=True, verbose_name='좌표X (TM)')
-    y = models.CharField(max_length=50, null=True, blank=True, verbose_name='좌표Y (TM)')
+    # 좌표 정보 (원본 TM 좌표, EPSG:5174)
+    x = models.DecimalField(max_digits=15, decimal_places=6, null=True, blank=True, verbose_name='좌표X (TM)')
+    y = models.DecimalField(max_digits=15, decimal_places=6, null=True, blank=True, verbose_name='좌표Y (TM)')
     
     # 변환된 WGS84 좌표 (위도/경도)
     latitude = models.FloatField(null=True, blank=True, verbose_name='위도')
@@ -121,22 +135,22 @@ class SeoulRestaurantLicense(models.Model):
     location = gis_models.PointField(srid=4326, null=True, blank=True, verbose_name='위치')
     
     # 면적 및 규모
-    sitearea = models.CharField(max_length=50, null=True, blank=True, verbose_name='소재지면적')
-    faciltotscp = models.CharField(max_length=50, null=True, blank=True, verbose_name='시설총규모')
+    sitearea = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, verbose_name='소재지면적')
+    faciltotscp = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, verbose_name='시설총규모')
     
     # 종업원 수
-    totepnum = models.CharField(max_length=20, null=True, blank=True, verbose_name='총인원')
-    maneipcnt = models.CharField(max_length=20, null=True, blank=True, verbose_name='남성종사자수')
-    wmeipcnt = models.CharField(max_length=20, null=True, blank=True, verbose_name='여성종사자수')
+    totepnum = models.IntegerField(null=True, blank=True, verbose_name='총인원')
+    maneipcnt = models.IntegerField(null=True, blank=True, verbose_name='남성종사자수')
+    wmeipcnt = models.IntegerField(null=True, blank=True, verbose_name='여성종사자수')
     
     # 기타 정보
     bdngownsenm = models.CharField(max_length=50, null=True, blank=True, verbose_name='건물소유구분명')
     multusnupsoyn = models.CharField(max_length=10, null=True, blank=True, verbose_name='다중이용업소여부')
     
     # 데이터 갱신 정보
-    lastmodts = models.CharField(max_length=30, null=True, blank=True, verbose_name='최종수정일자')
+    lastmodts = models.DateTimeField(null=True, blank=True, verbose_name='최종수정일시')
     updategbn = models.CharField(max_length=10, null=True, blank=True, verbose_name='데이터갱신구분')
-    updatedt = models.CharField(max_length=30, null=True, blank=True, verbose_name='데이터갱신일자')
+    updatedt = models.DateTimeField(null=True, blank=True, verbose_name='데이터갱신일자')
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -145,6 +159,20 @@ class SeoulRestaurantLicense(models.Model):
         db_table = 'yeongdeungpo_convenience_license'
         verbose_name = '서울 편의점 인허가 (구별)'
         verbose_name_plural = '서울 편의점 인허가 목록 (구별)'
+        indexes = [
+            # 구별 편의점 인허가 (filter(gu=.., uptaenm='편의점'))
+            models.Index(fields=['gu', 'uptaenm'], name='restaurant_gu_uptae_idx'),
+            # 기간 조회 (최근 N일 폐업/인허가)
+            models.Index(fields=['dcbymd'], name='restaurant_closed_date_idx'),
+            models.Index(fields=['apvpermymd'], name='restaurant_permit_date_idx'),
+            GinIndex(fields=['bplcnm'], opclasses=['gin_trgm_ops'], name='restaurant_name_trgm_idx'),
+            GinIndex(fields=['rdnwhladdr'], opclasses=['gin_trgm_ops'], name='restaurant_rdnaddr_trgm_idx'),
+            GinIndex(fields=['sitewhladdr'], opclasses=['gin_trgm_ops'], name='restaurant_siteaddr_trgm_idx'),
+        ]
+        constraints = [
+            # gu 파티션 테이블의 UNIQUE는 파티션 키를 포함해야 함 (stores/partitioning.py)
+            models.UniqueConstraint(fields=['mgtno', 'gu'], name='restaurant_mgtno_gu_unique'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] [{self.uptaenm}] {self.bplcnm} ({self.trdstatenm})"
@@ -153,7 +181,7 @@ class SeoulRestaurantLicense(models.Model):
 # 6. 서울시 Open API 담배소매업 인허가 정보
 class TobaccoRetailLicense(models.Model):
     """서울시 Open API에서 가져온 담배소매업 인허가 정보 (구별 저장)"""
-    mgtno = models.CharField(max_length=100, unique=True, verbose_name='관리번호')  # 관리번호 (고유키)
+    mgtno = models.CharField(max_length=100, verbose_name='관리번호')  # 관리번호 (구별 고유키, Meta.constraints)
     opnsfteamcode = models.CharField(max_length=20, null=True, blank=True, verbose_name='개방자치단체코드')
     gu = models.CharField(max_length=20, default='영등포구', verbose_name='구')  # 구 정보
     
@@ -168,12 +196,12 @@ class TobaccoRetailLicense(models.Model):
     dtlstatenm = models.CharField(max_length=50, null=True, blank=True, verbose_name='상세영업상태명')
     
     # 인허가/폐업/휴업 일자
-    apvpermymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='인허가일자')
-    apvcancelymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='인허가취소일자')
-    dcbymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='폐업일자')
-    clgstdt = models.CharField(max_length=20, null=True, blank=True, verbose_name='휴업시작일자')
-    clgenddt = models.CharField(max_length=20, null=True, blank=True, verbose_name='휴업종료일자')
-    ropnymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='재개업일자')
+    apvpermymd = models.DateField(null=True, blank=True, verbose_name='인허가일자')
+    apvcancelymd = models.DateField(null=True, blank=True, verbose_name='인허가취소일자')
+    dcbymd = models.DateField(null=True, blank=True, verbose_name='폐업일자')
+    clgstdt = models.DateField(null=True, blank=True, verbose_name='휴업시작일자')
+    clgenddt = models.DateField(null=True, blank=True, verbose_name='휴업종료일자')
+    ropnymd = models.DateField(null=True, blank=True, verbose_name='재개업일자')
     
     # 주소 정보
     sitewhladdr = models.CharField(max_length=300, null=True, blank=True, verbose_name='지번주소')
@@ -185,11 +213,11 @@ class TobaccoRetailLicense(models.Model):
     sitetel = models.CharField(max_length=50, null=True, blank=True, verbose_name='전화번호')
     
     # 면적
-    sitearea = models.CharField(max_length=50, null=True, blank=True, verbose_name='소재지면적')
+    sitearea = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, verbose_name='소재지면적')
     
-    # 좌표 정보 (원본 TM 좌표)
-    x = models.CharField(max_length=50, null=True, blank=True, verbose_name='좌표X (TM)')
-    y = models.CharField(max_length=50, null=True, blank=True, verbose_name='좌표Y (TM)')
+    # 좌표 정보 (원본 TM 좌표, EPSG:5174)
+    x = models.DecimalField(max_digits=15, decimal_places=6, null=True, blank=True, verbose_name='좌표X (TM)')
+    y = models.DecimalField(max_digits=15, decimal_places=6, null=True, blank=True, verbose_name='좌표Y (TM)')
     
     # 변환된 WGS84 좌표 (위도/경도)
     latitude = models.FloatField(null=True, blank=True, verbose_name='위도')
@@ -197,12 +225,12 @@ class TobaccoRetailLicense(models.Model):
     location = gis_models.PointField(srid=4326, null=True, blank=True, verbose_name='위치')
     
     # 데이터 갱신 정보
-    lastmodts = models.CharField(max_length=30, null=True, blank=True, verbose_name='최종수정일자')
+    lastmodts = models.DateTimeField(null=True, blank=True, verbose_name='최종수정일시')
     updategbn = models.CharField(max_length=10, null=True, blank=True, verbose_name='데이터갱신구분')
-    updatedt = models.CharField(max_length=30, null=True, blank=True, verbose_name='데이터갱신일자')
+    updatedt = models.DateTimeField(null=True, blank=True, verbose_name='데이터갱신일자')
     
     # 담배소매업 고유 필드
-    asgnymd = models.CharField(max_length=20, null=True, blank=True, verbose_name='지정일자')
+    asgnymd = models.DateField(null=True, blank=True, verbose_name='지정일자')
     mwsrnm = models.CharField(max_length=100, null=True, blank=True, verbose_name='민원종류명')
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -212,6 +240,19 @@ class TobaccoRetailLicense(models.Model):
         db_table = 'yeongdeungpo_tobacco_retail_license'
         verbose_name = '서울 담배소매업 인허가 (구별)'
         verbose_name_plural = '서울 담배소매업 인허가 목록 (구별)'
+        indexes = [
+            models.Index(fields=['gu'], name='tobacco_gu_idx'),
+            # 기간 조회 (최근 N일 폐업/인허가)
+            models.Index(fields=['dcbymd'], name='tobacco_closed_date_idx'),
+            models.Index(fields=['apvpermymd'], name='tobacco_permit_date_idx'),
+            GinIndex(fields=['bplcnm'], opclasses=['gin_trgm_ops'], name='tobacco_name_trgm_idx'),
+            GinIndex(fields=['rdnwhladdr'], opclasses=['gin_trgm_ops'], name='tobacco_rdnaddr_trgm_idx'),
+            GinIndex(fields=['sitewhladdr'], opclasses=['gin_trgm_ops'], name='tobacco_siteaddr_trgm_idx'),
+        ]
+        constraints = [
+            # gu 파티션 테이블의 UNIQUE는 파티션 키를 포함해야 함 (stores/partitioning.py)
+            models.UniqueConstraint(fields=['mgtno', 'gu'], name='tobacco_mgtno_gu_unique'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] [담배소매업] {self.bplcnm} ({self.trdstatenm})"
@@ -226,7 +267,14 @@ class StoreClosureResult(models.Model):
         ('폐업', '폐업 추정'),
     ]
     
-    place_id = models.CharField(max_length=50, unique=True, verbose_name='카카오 Place ID')
+    # 매칭 근거 비트 (match_flags)
+    MATCH_NAME = 1
+    MATCH_ADDRESS = 2
+    MATCH_COORD = 4
+    MATCH_LABELS = ((MATCH_NAME, '이름'), (MATCH_ADDRESS, '주소'), (MATCH_COORD, '좌표'))
+    NO_MATCH_LABEL = '없음'
+    
+    place_id = models.CharField(max_length=50, verbose_name='카카오 Place ID')  # 구별 유일 (Meta.constraints)
     name = models.CharField(max_length=200, verbose_name='매장명')
     address = models.CharField(max_length=300, verbose_name='주소')
     gu = models.CharField(max_length=20, default='영등포구', verbose_name='구')  # 구 정보
@@ -235,7 +283,7 @@ class StoreClosureResult(models.Model):
     location = gis_models.PointField(srid=4326, null=True, blank=True, verbose_name='위치')
     
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, verbose_name='상태')
-    match_reason = models.CharField(max_length=100, verbose_name='매칭 이유')
+    match_flags = models.PositiveSmallIntegerField(default=0, verbose_name='매칭 근거')  # MATCH_* 비트 조합
     
     checked_at = models.DateTimeField(auto_now=True, verbose_name='체크 일시')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='최초 생성일')
@@ -245,6 +293,240 @@ class StoreClosureResult(models.Model):
         verbose_name = '폐업 매장 체크 결과 (구별)'
         verbose_name_plural = '폐업 매장 체크 결과 목록 (구별)'
         ordering = ['-checked_at']
+        indexes = [
+            # 구별 결과/상태 필터 (filter(gu=..), filter(gu=.., status=..)) - gu 단독 조회도 선두 컬럼으로 사용
+            models.Index(fields=['gu', 'status'], name='closure_gu_status_idx'),
+            # 매칭 근거별 집계 (match_flags__in=flags_with(..))
+            models.Index(fields=['gu', 'match_flags'], name='closure_gu_flags_idx'),
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='closure_name_trgm_idx'),
+            GinIndex(fields=['address'], opclasses=['gin_trgm_ops'], name='closure_address_trgm_idx'),
+        ]
+        constraints = [
+            # gu 파티션 테이블의 UNIQUE는 파티션 키를 포함해야 함 (stores/partitioning.py)
+            models.UniqueConstraint(fields=['place_id', 'gu'], name='closure_place_gu_unique'),
+        ]
+
+    def __str__(self):
+        return f"[{self.gu}] [{self.status}] {self.name}"
+
+    @classmethod
+    def reason_label(cls, flags):
+        """비트 조합 → 표시용 문자열 ('이름, 주소' / '없음')"""
+        labels = [label for bit, label in cls.MATCH_LABELS if flags & bit]
+        return ', '.join(labels) if labels else cls.NO_MATCH_LABEL
+
+    @classmethod
+    def reason_flags(cls, label):
+        """문자열 → 비트 조합 ('이름, 주소' / '이름+주소' → 3, 알 수 없으면 0)"""
+        return sum(bit for bit, name in cls.MATCH_LABELS if name in (label or ''))
+
+    @classmethod
+    def flags_with(cls, bit):
+        """bit가 포함된 모든 비트 조합 (match_flags__in 조건용)"""
+        full = sum(bit for bit, _ in cls.MATCH_LABELS)
+        return [flags for flags in range(full + 1) if flags & bit]
+
+    @property
+    def match_reason(self):
+        return self.reason_label(self.match_flags)
+
+    @match_reason.setter
+    def match_reason(self, label):
+        self.match_flags = self.reason_flags(label)
+
+# 8. 구별 대시보드 요약 통계
+class GuSummary(models.Model):
+    """구별 수집/검증 요약 통계 (파이프라인 완료 시 1회 갱신, 대시보드/구별 비교용)"""
+    gu = models.CharField(max_length=20, unique=True, verbose_name='구')
+    
+    # 단계별 수집 건수
+    daiso_count = models.IntegerField(default=0, verbose_name='다이소 수')
+    convenience_count = models.IntegerField(default=0, verbose_name='편의점 수')
+    restaurant_count = models.IntegerField(default=0, verbose_name='휴게음식점 인허가 수')
+    tobacco_count = models.IntegerField(default=0, verbose_name='담배소매업 인허가 수')
+    
+    # 폐업 검증 결과 (상태별)
+    closure_total = models.IntegerField(default=0, verbose_name='검증 대상 수')
+    normal_count = models.IntegerField(default=0, verbose_name='정상 영업 수')
+    closed_count = models.IntegerField(default=0, verbose_name='폐업 추정 수')
+    
+    # 매칭 근거별
+    name_match_count = models.IntegerField(default=0, verbose_name='이름 매칭 수')
+    address_match_count = models.IntegerField(default=0, verbose_name='주소 매칭 수')
+    coord_match_count = models.IntegerField(default=0, verbose_name='좌표 매칭 수')
+    
+    # 데이터 품질
+    coords_missing = models.IntegerField(default=0, verbose_name='좌표 누락 편의점 수')
+    
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name='갱신 일시')
+
+    class Meta:
+        db_table = 'gu_summary'
+        verbose_name = '구별 요약 통계'
+        verbose_name_plural = '구별 요약 통계 목록'
+        ordering = ['gu']
+
+    def __str__(self):
+        return f"[{self.gu}] 정상 {self.normal_count} / 폐업 {self.closed_count}"
+
+# 9. 수집 작업 큐
+class CollectionJob(models.Model):
+    """수집 파이프라인 실행 작업 (웹은 등록/조회만, collect_worker가 SKIP LOCKED로 가져가 실행)"""
+    
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, '대기'),
+        (STATUS_RUNNING, '수집 중'),
+        (STATUS_COMPLETED, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+    
+    gu = models.CharField(max_length=20, verbose_name='대상 구')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED, verbose_name='상태')
+    
+    # 진행 상태 (check_status / 개발자 모니터링 대시보드용)
+    progress = models.IntegerField(default=0, verbose_name='진행률')
+    message = models.CharField(max_length=300, blank=True, default='', verbose_name='메시지')
+    error = models.TextField(null=True, blank=True, verbose_name='오류')
+    metrics = models.JSONField(default=dict, blank=True, verbose_name='상세 metrics')
+    
+    worker = models.CharField(max_length=100, blank=True, default='', verbose_name='처리 워커')
+    # 샤드 배정 (stores/regions.py plan_shards, NULL이면 아무 워커나 처리)
+    shard = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name='샤드')
+    expected_seconds = models.FloatField(default=0, verbose_name='예상 소요 시간(초)')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록 일시')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='시작 일시')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='종료 일시')
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 상태 갱신')
+
+    class Meta:
+        db_table = 'collection_job'
+        verbose_name = '수집 작업'
+        verbose_name_plural = '수집 작업 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='collection_job_queue_idx'),
+        ]
+        constraints = [
+            # 구별 대기/실행 중 작업은 1개 (동시 등록 요청도 DB에서 중복 차단)
+            models.UniqueConstraint(
+                fields=['gu'],
+                condition=models.Q(status__in=['queued', 'running']),
+                name='collection_job_active_gu_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"[{self.gu}] #{self.pk} {self.status} ({self.progress}%)"
+
+
+# 10. 육각 격자 폐업 밀도 (분석)
+class HexCell(models.Model):
+    """구별 육각 격자 셀 집계 (파이프라인 완료 시 stores/analytics.py에서 일괄 갱신, 밀도 지도용)"""
+    gu = models.CharField(max_length=20, verbose_name='구')
+    resolution = models.IntegerField(verbose_name='셀 크기(m)')  # ST_HexagonGrid 변 길이 (EPSG:5179 미터)
+    i = models.IntegerField(verbose_name='격자 열')
+    j = models.IntegerField(verbose_name='격자 행')
+    geom = gis_models.PolygonField(srid=4326, verbose_name='셀 영역')
+
+    # 폐업 검증 결과 (상태별)
+    closure_total = models.IntegerField(default=0, verbose_name='검증 대상 수')
+    normal_count = models.IntegerField(default=0, verbose_name='정상 영업 수')
+    closed_count = models.IntegerField(default=0, verbose_name='폐업 추정 수')
+    closure_rate = models.FloatField(default=0, verbose_name='폐업률(%)')
+
+    # 인허가 편의점 (휴게음식점 인허가 중 편의점)
+    license_count = models.IntegerField(default=0, verbose_name='인허가 편의점 수')
+
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name='갱신 일시')
+
+    class Meta:
+        db_table = 'hex_cell'
+        verbose_name = '육각 격자 셀'
+        verbose_name_plural = '육각 격자 셀 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['gu', 'resolution', 'i', 'j'], name='hex_cell_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['resolution', 'gu'], name='hex_cell_resolution_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.gu}] {self.resolution}m ({self.i}, {self.j}) 폐업 {self.closed_count}/{self.closure_total}"
+
+
+# 11. 폐업 검증 상태 변경 이력
+class StoreClosureHistory(models.Model):
+    """매장별 상태/매칭 이유가 바뀔 때만 쌓이는 이력 (append-only, 검증 완료 시 stores/history.py에서 일괄 기록)"""
+    place_id = models.CharField(max_length=50, verbose_name='카카오 Place ID')
+    gu = models.CharField(max_length=20, verbose_name='구')
+    status = models.CharField(max_length=10, choices=StoreClosureResult.STATUS_CHOICES, verbose_name='상태')
+    previous_status = models.CharField(
+        max_length=10, choices=StoreClosureResult.STATUS_CHOICES, null=True, blank=True, verbose_name='이전 상태'
+    )  # 최초 관측이면 NULL
+    match_flags = models.PositiveSmallIntegerField(default=0, verbose_name='매칭 근거')  # StoreClosureResult.MATCH_* 비트
+    changed_at = models.DateTimeField(verbose_name='변경 일시')
+
+    class Meta:
+        db_table = 'store_closure_history'
+        verbose_name = '폐업 검증 상태 이력'
+        verbose_name_plural = '폐업 검증 상태 이력 목록'
+        indexes = [
+            # 구별 기간 조회 (신규 폐업/추이)
+            models.Index(fields=['gu', 'changed_at'], name='closure_history_gu_time_idx'),
+            # 매장별 최신 이력 (변경 감지)
+            models.Index(fields=['place_id', '-changed_at'], name='closure_history_place_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.gu}] {self.place_id} {self.previous_status or '-'} → {self.status} ({self.changed_at:%Y-%m-%d})"
+
+
+# 12. 구 경계 폴리곤 (좌표 기반 구 판별)
+class GuBoundary(models.Model):
+    """서울 구 경계 (stores/gu_boundary_data.py 적재, 판별은 stores/gu_boundaries.py)"""
+    gu = models.CharField(max_length=20, unique=True, verbose_name='구')
+    area_km2 = models.FloatField(default=0, verbose_name='면적(km²)')
+    boundary = gis_models.MultiPolygonField(srid=4326, verbose_name='경계')  # GiST 공간 인덱스 (ST_Contains), 섬·비지 포함
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신 일시')
+
+    class Meta:
+        db_table = 'gu_boundary'
+        verbose_name = '구 경계'
+        verbose_name_plural = '구 경계 목록'
+
+    def __str__(self):
+        return f"{self.gu} ({self.area_km2}km²)"
+
+
+# 13. 수집 대상 지역 레지스트리 (시도/시군구)
+class Region(models.Model):
+    """수집 지역 (gu_codes 조회 함수가 읽는 레지스트리, stores/regions.py)"""
+    key = models.CharField(max_length=20, unique=True, verbose_name='지역 키')  # 각 테이블 gu 컬럼 값
+    sido = models.CharField(max_length=20, verbose_name='시도')
+    sigungu = models.CharField(max_length=20, verbose_name='시군구')
+    code = models.CharField(max_length=10, unique=True, verbose_name='지역 코드')  # 파티션/정적 번들 이름
+    restaurant_service = models.CharField(max_length=50, verbose_name='휴게음식점 LOCALDATA 서비스명')
+    tobacco_service = models.CharField(max_length=50, verbose_name='담배소매업 LOCALDATA 서비스명')
+    daiso_keyword = models.CharField(max_length=20, blank=True, default='', verbose_name='다이소 검색어')
+    enabled = models.BooleanField(default=True, verbose_name='수집 대상')
+
+    # 실행 비용 이력 (샤드 배정 가중치)
+    cost_seconds = models.FloatField(default=0, verbose_name='평균 소요 시간(초)')
+    run_count = models.IntegerField(default=0, verbose_name='완료 횟수')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신 일시')
+
+    class Meta:
+        db_table = 'region'
+        verbose_name = '수집 지역'
+        verbose_name_plural = '수집 지역 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['sido', 'sigungu'], name='region_sido_sigungu_unique'),
+        ]
 
     def __str__(self):
-        return f"[{self.gu}] [{self.status}] {self.name}"
\ No newline at end of file
+        return f"{self.sido} {self.sigungu} ({self.code})"
@@ -0,0 +1,220 @@
+# stores/partitioning.py
+"""
+구(gu) 기준 LIST 파티셔닝
+
+편의점/인허가/폐업 결과 테이블은 모든 구를 한 힙에 담고 있어
+--clear 시 DELETE ... WHERE gu= 대량 삭제 → 테이블 팽창(bloat)과 VACUUM 부담이 생긴다.
+테이블을 gu LIST 파티션으로 바꾸면
+- 구 삭제는 해당 파티션 TRUNCATE (dead tuple 없음)
+- gu 조건 조회는 파티션 1개만 스캔 (partition pruning)
+- 전국 확장 시 구/시군구 단위로 파티션만 추가
+
+파티션 구성 (migrations/0013):
+    {테이블}_{구 코드}    지원 구마다 1개, 예: store_closure_result_yd
+                          (0013은 서울 25개 구 고정 목록, 이후 지역은 import_regions가 추가)
+    {테이블}_default      그 외 구 (DEFAULT 파티션)
+
+제약 변경:
+    파티션 테이블의 PK/UNIQUE는 파티션 키를 포함해야 하므로
+    PRIMARY KEY (id) → (id, gu), UNIQUE (place_id) → (place_id, gu)로 바뀐다.
+    id는 시퀀스 기본값으로 계속 전역 유일하다.
+    place_id/mgtno는 모델에도 (고유키, gu) UniqueConstraint로 선언되어 있고 (migrations/0020)
+    수집기 upsert도 (고유키, gu) 기준이므로 구별 작업이 동시에 실행돼도 충돌하지 않는다.
+
+PostgreSQL이 아니거나 파티션이 없는 구는 기존처럼 DELETE로 처리한다.
+
+사용법:
+    from stores.partitioning import clear_gu
+
+    deleted = clear_gu(StoreClosureResult, '영등포구')
+"""
+
+import re
+
+from django.db import connection
+
+
+# 파티셔닝 대상 테이블
+PARTITIONED_TABLES = (
+    'yeongdeungpo_convenience',
+    'yeongdeungpo_convenience_license',
+    'yeongdeungpo_tobacco_retail_license',
+    'store_closure_result',
+)
+
+PARTITION_KEY = 'gu'
+DEFAULT_PARTITION_SUFFIX = 'default'
+
+# 재구성 중 원본 테이블 임시 이름
+_REBUILD_SUFFIX = '_rebuild_old'
+
+
+def partition_name(table, gu):
+    """구 파티션 이름 (지원하지 않는 구는 None → DEFAULT 파티션)"""
+    from .regions import get_registry
+
+    info = get_registry().get(gu)
+    if info is None:
+        return None
+    return f"{table}_{info['code'].lower()}"
+
+
+def is_partitioned(table, using=connection):
+    """테이블이 파티션 테이블인지 여부 (PostgreSQL 외에는 항상 False)"""
+    if using.vendor != 'postgresql':
+        return False
+    with using.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [table]
+        )
+        return cursor.fetchone() is not None
+
+
+def _table_exists(cursor, table):
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [table])
+    return cursor.fetchone()[0]
+
+
+def create_gu_partitions(table, using=connection, partitions=None):
+    """
+    지원 구 파티션 + DEFAULT 파티션 생성 (이미 있으면 건너뜀)
+
+    DEFAULT 파티션에 해당 구 행이 남아 있으면 PostgreSQL이 생성을 거부하므로
+    지역을 레지스트리에 추가한 경우 그 지역을 수집하기 전에 호출한다. (import_regions가 호출)
+
+    Args:
+        partitions: {구: 지역 코드} (None이면 지역 레지스트리, 마이그레이션은 고정 목록 전달)
+
+    Returns:
+        새로 만든 파티션 수
+    """
+    if partitions is None:
+        from .regions import get_registry
+
+        partitions = {gu: info['code'] for gu, info in get_registry().items()}
+
+    qn = using.ops.quote_name
+    created = 0
+    with using.cursor() as cursor:
+        for gu, code in partitions.items():
+            name = f"{table}_{code.lower()}"
+            if _table_exists(cursor, name):
+                continue
+            cursor.execute(
+                f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES IN (%s)", [gu]
+            )
+            created += 1
+
+        default = f'{table}_{DEFAULT_PARTITION_SUFFIX}'
+        if not _table_exists(cursor, default):
+            cursor.execute(f"CREATE TABLE {qn(default)} PARTITION OF {qn(table)} DEFAULT")
+            created += 1
+    return created
+
+
+def clear_gu(model, gu):
+    """
+    구 데이터 전체 삭제 (--clear)
+
+    파티션이 있으면 TRUNCATE, 없으면 DELETE ... WHERE gu=
+
+    Returns:
+        삭제된 행 수
+    """
+    table = model._meta.db_table
+    name = partition_name(table, gu)
+    if name is None or not is_partitioned(table):
+        return model.objects.filter(gu=gu).delete()[0]
+
+    count = model.objects.filter(gu=gu).count()
+    with connection.cursor() as cursor:
+        cursor.execute(f"TRUNCATE {connection.ops.quote_name(name)}")
+    return count
+
+
+def _with_partition_key(definition, partitioned):
+    """UNIQUE/PK 컬럼 목록에 gu 추가(파티셔닝) 또는 제거(복원)"""
+    match = re.search(r'\(([^()]*)\)\s*$', definition)
+    columns = [column.strip() for column in match.group(1).split(',')]
+    if partitioned and PARTITION_KEY not in columns:
+        columns.append(PARTITION_KEY)
+    elif not partitioned and PARTITION_KEY in columns and len(columns) > 1:
+        columns.remove(PARTITION_KEY)
+    return f"{definition[:match.start()]}({', '.join(columns)})"
+
+
+def rebuild_table(schema_editor, table, partitioned, partitions=None):
+    """
+    테이블을 gu LIST 파티션 테이블로(또는 일반 테이블로) 재구성
+
+    partitions: {구: 지역 코드} (create_gu_partitions 참고)
+
+    1. PK/UNIQUE 제약과 인덱스 정의를 카탈로그에서 읽고 원본에서 제거
+    2. 원본 이름 변경 → 같은 컬럼 구성의 새 테이블 생성 (+ 파티션)
+    3. 데이터 복사 후 id 시퀀스/제약/인덱스 재생성 (부모 인덱스는 파티션에 전파)
+    4. 원본 삭제
+    """
+    using = schema_editor.connection
+    qn = using.ops.quote_name
+    old = f'{table}{_REBUILD_SUFFIX}'
+    sequence = f'{table}_id_seq'
+
+    with using.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('p', 'u') ORDER BY contype",
+            [table],
+        )
+        constraints = cursor.fetchall()
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s",
+            [table],
+        )
+        constraint_names = {name for name, _ in constraints}
+        indexes = [(name, definition) for name, definition in cursor.fetchall() if name not in constraint_names]
+
+        # id 기본값 분리 (IDENTITY는 파티션 테이블에서 지원되지 않으므로 시퀀스 기본값 사용)
+        cursor.execute(
+            "SELECT attidentity FROM pg_attribute WHERE attrelid = %s::regclass AND attname = 'id'", [table]
+        )
+        if cursor.fetchone()[0]:
+            cursor.execute(f"ALTER TABLE {qn(table)} ALTER COLUMN id DROP IDENTITY")
+        else:
+            cursor.execute(f"ALTER TABLE {qn(table)} ALTER COLUMN id DROP DEFAULT")
+            cursor.execute(f"DROP SEQUENCE IF EXISTS {qn(sequence)}")
+
+        for name, _ in constraints:
+            cursor.execute(f"ALTER TABLE {qn(table)} DROP CONSTRAINT {qn(name)}")
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {qn(name)}")
+
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old)}")
+        partition_clause = f" PARTITION BY LIST ({qn(PARTITION_KEY)})" if partitioned else ''
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(old)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            f"{partition_clause}"
+        )
+    if partitioned:
+        create_gu_partitions(table, using, partitions)
+
+    with using.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(old)}")
+
+        cursor.execute(f"CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(table)}.id")
+        cursor.execute(
+            f"SELECT setval(%s, COALESCE((SELECT MAX(id) FROM {qn(table)}), 0) + 1, false)", [sequence]
+        )
+        cursor.execute(f"ALTER TABLE {qn(table)} ALTER COLUMN id SET DEFAULT nextval(%s::regclass)", [sequence])
+
+        for name, definition in constraints:
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {_with_partition_key(definition, partitioned)}"
+            )
+        for name, definition in indexes:
+            # 파티션 부모 인덱스 정의는 ON ONLY로 나오므로 자식 파티션까지 생성되도록 제거
+            definition = definition.replace(' ON ONLY ', ' ON ')
+            if definition.startswith('CREATE UNIQUE INDEX'):
+                definition = _with_partition_key(definition, partitioned)
+            cursor.execute(definition)
+
+        cursor.execute(f"DROP TABLE {qn(old)} CASCADE")
@@ -0,0 +1,210 @@
+# stores/regions.py
+"""
+수집 대상 지역 레지스트리 (Region) + 샤드 계획
+
+gu_codes.GU_CODES는 서울 25개 구만 Python dict로 고정하고 있어
+전국(시군구 ~250개)으로 확장하려면 코드를 고쳐야 했다.
+지역(시도/시군구), LOCALDATA 서비스명, 다이소 검색어를 Region 테이블에 두고
+gu_codes의 조회 함수(get_gu_info/list_supported_gu)가 이 레지스트리를 읽는다.
+- 지역 추가: python manage.py import_regions regions.csv (경계 폴리곤/파티션까지 생성)
+- GU_CODES는 초기 적재(migrations/0018)와 DB를 쓸 수 없을 때의 기본값으로만 사용
+- 경계는 GuBoundary(gu = Region.key)에 저장
+
+Region.key는 모든 테이블의 gu 컬럼 값이다.
+서울은 기존대로 '영등포구', 다른 시도는 이름이 겹치므로('중구') '부산 중구'처럼 시도를 붙인다.
+
+샤드 계획 (LPT: Longest Processing Time first):
+    지역별 과거 실행 시간(cost_seconds, 지수 이동 평균)이 큰 순서로
+    현재 부하가 가장 작은 샤드에 배정 → 워커별 총 소요 시간(makespan)을 고르게 맞춘다.
+    실행 이력이 없는 지역은 이력 있는 지역의 평균 비용으로 계산한다.
+
+사용법:
+    from stores.regions import get_registry, plan_shards, region_costs
+
+    info = get_registry()['영등포구']      # {'code', 'restaurant', 'tobacco', 'sido', 'daiso_keyword'}
+    shards = plan_shards(region_costs(), 4)
+"""
+
+import heapq
+import time
+
+from django.db import DatabaseError, transaction
+
+
+DEFAULT_SIDO = '서울특별시'
+
+# 레지스트리 캐시 유지 시간 (초) - 워커가 재시작 없이 새 지역을 인식
+REGISTRY_TTL = 60
+
+# 실행 시간 지수 이동 평균 가중치 (최근 실행 비중)
+COST_ALPHA = 0.3
+
+# 이력이 하나도 없을 때의 지역별 기본 비용 (초)
+DEFAULT_COST_SECONDS = 60.0
+
+# 주소 표기 약칭 (다이소 매장 주소 필터)
+SIDO_ALIASES = {
+    '서울특별시': '서울', '부산광역시': '부산', '대구광역시': '대구', '인천광역시': '인천',
+    '광주광역시': '광주', '대전광역시': '대전', '울산광역시': '울산', '세종특별자치시': '세종',
+    '경기도': '경기', '강원특별자치도': '강원', '충청북도': '충북', '충청남도': '충남',
+    '전북특별자치도': '전북', '전라남도': '전남', '경상북도': '경북', '경상남도': '경남',
+    '제주특별자치도': '제주',
+}
+
+_registry = None
+_loaded_at = 0.0
+
+
+def default_daiso_keyword(sigungu):
+    """
+    다이소 검색어 기본값: 끝의 '구/시/군'만 제거 (영등포구 → 영등포)
+
+    결과가 한 글자면("중구" → "중") 너무 짧으므로 원래 이름 사용
+    """
+    keyword = sigungu[:-1] if sigungu[-1:] in ('구', '시', '군') else sigungu
+    return keyword if len(keyword) >= 2 else sigungu
+
+
+def sido_keywords(sido):
+    """주소 문자열에서 시도를 찾을 때 쓰는 표기 (정식 명칭, 약칭)"""
+    return tuple(dict.fromkeys((sido, SIDO_ALIASES.get(sido, sido[:2]))))
+
+
+def _info(region):
+    return {
+        'code': region.code,
+        'restaurant': region.restaurant_service,
+        'tobacco': region.tobacco_service,
+        'sido': region.sido,
+        'daiso_keyword': region.daiso_keyword or default_daiso_keyword(region.sigungu),
+    }
+
+
+def _static_registry():
+    from .management.commands.gu_codes import GU_CODES
+
+    return {
+        gu: {**info, 'sido': DEFAULT_SIDO, 'daiso_keyword': default_daiso_keyword(gu)}
+        for gu, info in GU_CODES.items()
+    }
+
+
+def get_registry():
+    """
+    활성 지역 {key: info} (REGISTRY_TTL 동안 캐시)
+
+    Region 테이블이 비었거나 아직 없으면(migrate 전) GU_CODES 기본값
+    """
+    global _registry, _loaded_at
+    if _registry is not None and time.monotonic() - _loaded_at < REGISTRY_TTL:
+        return _registry
+
+    from .models import Region
+
+    try:
+        # 마이그레이션 도중(테이블 생성 전) 호출돼도 바깥 트랜잭션이 깨지지 않도록 savepoint
+        with transaction.atomic():
+            regions = list(Region.objects.order_by('sido', 'key'))
+    except DatabaseError:
+        regions = []
+    if regions:
+        _registry = {region.key: _info(region) for region in regions if region.enabled}
+    else:
+        _registry = _static_registry()
+    _loaded_at = time.monotonic()
+    return _registry
+
+
+def clear_region_cache():
+    global _registry
+    _registry = None
+
+
+def seed_regions(model=None):
+    """
+    GU_CODES(서울 25개 구)를 Region에 적재 (이미 있으면 서비스명/코드만 갱신)
+
+    Args:
+        model: 마이그레이션에서는 apps.get_model('stores', 'Region')
+
+    Returns:
+        적재된 지역 수
+    """
+    from .management.commands.gu_codes import GU_CODES
+
+    if model is None:
+        from .models import Region as model
+
+    for gu, info in GU_CODES.items():
+        model.objects.update_or_create(
+            key=gu,
+            defaults={
+                'sido': DEFAULT_SIDO,
+                'sigungu': gu,
+                'code': info['code'],
+                'restaurant_service': info['restaurant'],
+                'tobacco_service': info['tobacco'],
+                'daiso_keyword': default_daiso_keyword(gu),
+            },
+        )
+    clear_region_cache()
+    return len(GU_CODES)
+
+
+def region_costs(keys=None):
+    """
+    지역별 예상 실행 시간 (초)
+
+    Returns:
+        {key: cost_seconds} (이력 없는 지역은 이력 있는 지역 평균, 전부 없으면 DEFAULT_COST_SECONDS)
+    """
+    from .models import Region
+
+    regions = Region.objects.filter(enabled=True)
+    if keys is not None:
+        regions = regions.filter(key__in=keys)
+    costs = dict(regions.values_list('key', 'cost_seconds'))
+    for key in keys or ():
+        costs.setdefault(key, 0)
+
+    known = [cost for cost in costs.values() if cost > 0]
+    default = sum(known) / len(known) if known else DEFAULT_COST_SECONDS
+    return {key: cost if cost > 0 else default for key, cost in costs.items()}
+
+
+def plan_shards(costs, shards):
+    """
+    LPT 샤드 배정
+
+    Args:
+        costs: {key: 예상 실행 시간}
+        shards: 샤드(워커) 수
+
+    Returns:
+        [{'shard': n, 'regions': [key, ...], 'load': 예상 합계}, ...]
+        regions는 비용 큰 순서 (샤드 안에서도 오래 걸리는 지역부터 실행)
+    """
+    shards = max(1, shards)
+    plan = [{'shard': shard, 'regions': [], 'load': 0.0} for shard in range(shards)]
+    heap = [(0.0, shard) for shard in range(shards)]
+    for key, cost in sorted(costs.items(), key=lambda item: (-item[1], item[0])):
+        load, shard = heapq.heappop(heap)
+        plan[shard]['regions'].append(key)
+        plan[shard]['load'] = load + cost
+        heapq.heappush(heap, (load + cost, shard))
+    return plan
+
+
+def record_run_cost(key, seconds):
+    """수집 완료 시 실행 시간 반영 (첫 실행은 그대로, 이후 지수 이동 평균)"""
+    from django.db.models import Case, F, When
+
+    from .models import Region
+
+    Region.objects.filter(key=key).update(
+        cost_seconds=Case(
+            When(run_count=0, then=seconds),
+            default=F('cost_seconds') * (1 - COST_ALPHA) + seconds * COST_ALPHA,
+        ),
+        run_count=F('run_count') + 1,
+    )
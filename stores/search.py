@@ -0,0 +1,133 @@
+# stores/search.py
+"""
+매장/인허가 통합 검색 (pg_trgm)
+
+관리자 search_fields는 테이블마다 인덱스 없이 ILIKE '%...%' 전체 스캔을 한다.
+이름/주소 컬럼에 gin_trgm_ops GIN 인덱스를 두고 (migrations/0010)
+- 단어 유사도(trigram_word_similar → %> 연산자, 긴 주소 안의 일부 단어 일치)
+- 전체 유사도(trigram_similar → % 연산자, 오타/띄어쓰기 차이 허용)
+로 후보를 찾은 뒤 유사도 순으로 정렬한다. 두 연산자 모두 GIN 인덱스를 사용한다.
+(icontains는 UPPER(컬럼) LIKE로 변환되어 인덱스를 쓰지 못하므로 사용하지 않음)
+PostgreSQL 외(SpatiaLite 프로필)에서는 icontains 부분 일치로 대체한다.
+
+검색 대상 (SEARCH_SOURCES):
+    convenience  YeongdeungpoConvenience (카카오 편의점)
+    closure      StoreClosureResult (폐업 검증 결과)
+    restaurant   SeoulRestaurantLicense (휴게음식점 인허가)
+    tobacco      TobaccoRetailLicense (담배소매업 인허가)
+
+사용법:
+    from .search import search_stores
+
+    results = search_stores('GS25 여의도', gu='영등포구', bbox=(126.91, 37.51, 126.94, 37.53))
+"""
+
+from django.contrib.gis.geos import Polygon
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.functions import Greatest
+
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+# 이보다 짧은 검색어는 trigram이 만들어지지 않아 인덱스를 쓸 수 없음
+MIN_QUERY_LENGTH = 2
+
+
+# 검색 대상별 (모델, 이름 필드, 주소 필드들, 상태 필드)
+SEARCH_SOURCES = {
+    'convenience': ('YeongdeungpoConvenience', 'name', ('address',), None),
+    'closure': ('StoreClosureResult', 'name', ('address',), 'status'),
+    'restaurant': ('SeoulRestaurantLicense', 'bplcnm', ('rdnwhladdr', 'sitewhladdr'), 'trdstatenm'),
+    'tobacco': ('TobaccoRetailLicense', 'bplcnm', ('rdnwhladdr', 'sitewhladdr'), 'trdstatenm'),
+}
+
+
+def _search_source(source, query, gu=None, bbox=None, limit=DEFAULT_LIMIT):
+    """검색 대상 1개 조회 (유사도 내림차순 limit건)"""
+    from django.apps import apps
+
+    model_name, name_field, address_fields, status_field = SEARCH_SOURCES[source]
+    model = apps.get_model('stores', model_name)
+    fields = (name_field,) + address_fields
+
+    if connection.vendor == 'postgresql':
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f'{field}__trigram_word_similar': query}) | Q(**{f'{field}__trigram_similar': query})
+        similarity = Greatest(*(
+            expression
+            for field in fields
+            for expression in (TrigramSimilarity(field, query), TrigramWordSimilarity(query, field))
+        ))
+    else:
+        # pg_trgm이 없는 DB(SpatiaLite 프로필): 부분 일치, 이름 일치 1.0 / 주소만 일치 0.5
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f'{field}__icontains': query})
+        similarity = Case(
+            When(**{f'{name_field}__icontains': query}, then=Value(1.0)),
+            default=Value(0.5),
+            output_field=FloatField(),
+        )
+
+    queryset = model.objects.filter(condition)
+    if gu:
+        queryset = queryset.filter(gu=gu)
+    if bbox is not None:
+        queryset = queryset.filter(location__within=Polygon.from_bbox(bbox))
+
+    values = [name_field, 'gu', 'location', *address_fields]
+    if status_field:
+        values.append(status_field)
+    rows = queryset.annotate(similarity=similarity).order_by('-similarity').values(*values, 'similarity')[:limit]
+
+    return [
+        {
+            'source': source,
+            'name': row[name_field],
+            'address': next((row[field] for field in address_fields if row[field]), ''),
+            'gu': row['gu'],
+            'lat': row['location'].y if row['location'] else None,
+            'lng': row['location'].x if row['location'] else None,
+            'status': row[status_field] if status_field else None,
+            'similarity': round(row['similarity'], 3),
+        }
+        for row in rows
+    ]
+
+
+def search_stores(query, gu=None, bbox=None, sources=None, limit=DEFAULT_LIMIT):
+    """
+    이름/주소 통합 검색
+
+    Args:
+        query: 검색어 (MIN_QUERY_LENGTH자 이상)
+        gu: 구 필터
+        bbox: (min_lng, min_lat, max_lng, max_lat) 영역 필터
+        sources: 검색 대상 목록 (기본: 전체)
+        limit: 최대 결과 수
+
+    Returns:
+        유사도 내림차순 결과 목록 (대상별로 limit건씩 조회 후 병합)
+
+    Raises:
+        ValueError: 검색어가 짧거나 지원하지 않는 검색 대상
+    """
+    query = (query or '').strip()
+    if len(query) < MIN_QUERY_LENGTH:
+        raise ValueError(f'검색어는 {MIN_QUERY_LENGTH}글자 이상이어야 합니다.')
+
+    sources = sources or list(SEARCH_SOURCES)
+    unknown = [source for source in sources if source not in SEARCH_SOURCES]
+    if unknown:
+        raise ValueError(f'지원하지 않는 검색 대상: {", ".join(unknown)}')
+
+    limit = max(1, min(limit, MAX_LIMIT))
+    results = []
+    for source in sources:
+        results.extend(_search_source(source, query, gu, bbox, limit))
+
+    results.sort(key=lambda row: row['similarity'], reverse=True)
+    return results[:limit]
@@ -0,0 +1,193 @@
+# stores/snapshot.py
+"""
+구별 폐업 검증 결과 바이너리 스냅샷 (memory-mapped)
+
+파이프라인 완료 시 StoreClosureResult를 구별로 한 번 덤프해 두고,
+웹 워커는 np.load(mmap_mode='r')로 매핑하여 DB 조회/ORM 객체 생성 없이 결과를 읽는다.
+여러 워커 프로세스가 OS 페이지 캐시의 같은 사본을 공유한다.
+
+디렉터리 구조 ({RESULTS_SNAPSHOT_DIR}/{구 해시}/):
+    current                 현재 스냅샷 디렉터리 이름 (원자적 교체용 포인터)
+    v{timestamp}/
+        meta.json           건수, status/match_reason 코드표
+        lat.npy, lng.npy    float64 좌표
+        status.npy          uint8 상태 코드
+        reason.npy          uint16 매칭 이유 코드
+        name.npy            uint8 UTF-8 문자열 테이블 (이어붙인 바이트)
+        name_offsets.npy    uint32 오프셋 (n + 1)
+        address.npy, address_offsets.npy
+
+사용법:
+    from stores.snapshot import write_snapshot, load_snapshot
+
+    write_snapshot('영등포구')                        # 파이프라인 완료 시
+    snapshot = load_snapshot('영등포구')              # 웹 (없으면 None)
+    rows = snapshot.rows(snapshot.select(bbox=(126.89, 37.51, 126.92, 37.53), status='폐업'))
+"""
+
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+from django.conf import settings
+
+from .data_cache import _gu_key, get_file_payload
+
+
+POINTER_FILE = 'current'
+# 읽는 중인 워커가 있을 수 있으므로 이전 버전 일부 유지
+KEEP_VERSIONS = 2
+STRING_FIELDS = ('name', 'address')
+
+
+def _snapshot_root(gu):
+    return os.path.join(settings.RESULTS_SNAPSHOT_DIR, _gu_key(gu))
+
+
+def _encode_strings(values):
+    """문자열 리스트 → (UTF-8 바이트 배열, 오프셋 배열)"""
+    encoded = [(value or '').encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def write_snapshot(gu):
+    """
+    구별 결과 스냅샷 생성 후 current 포인터 원자적 교체
+
+    Returns:
+        저장된 건수
+    """
+    from .models import StoreClosureResult
+
+    rows = [
+        row for row in StoreClosureResult.objects.filter(gu=gu).values_list(
+            'name', 'address', 'latitude', 'longitude', 'status', 'match_flags'
+        )
+        if row[2] and row[3]
+    ]
+
+    status_table = {}
+    reason_table = {}
+    root = _snapshot_root(gu)
+    version = f'v{time.time_ns()}'
+    path = os.path.join(root, version)
+    os.makedirs(path)
+
+    arrays = {
+        'lat': np.array([row[2] for row in rows], dtype=np.float64),
+        'lng': np.array([row[3] for row in rows], dtype=np.float64),
+        'status': np.array([status_table.setdefault(row[4], len(status_table)) for row in rows], dtype=np.uint8),
+        'reason': np.array([
+            reason_table.setdefault(StoreClosureResult.reason_label(row[5]), len(reason_table)) for row in rows
+        ], dtype=np.uint16),
+    }
+    for index, field in enumerate(STRING_FIELDS):
+        arrays[field], arrays[f'{field}_offsets'] = _encode_strings(row[index] for row in rows)
+
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f'{name}.npy'), array)
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'gu': gu,
+            'count': len(rows),
+            'status_table': list(status_table),
+            'reason_table': list(reason_table),
+        }, f, ensure_ascii=False)
+
+    # 포인터 교체 (rename은 원자적이므로 읽는 쪽은 항상 완성된 스냅샷만 봄)
+    pointer_tmp = os.path.join(root, f'{POINTER_FILE}.{version}.tmp')
+    with open(pointer_tmp, 'w') as f:
+        f.write(version)
+    os.replace(pointer_tmp, os.path.join(root, POINTER_FILE))
+
+    # 오래된 버전 정리
+    versions = sorted(name for name in os.listdir(root) if name.startswith('v'))
+    for old in versions[:-KEEP_VERSIONS]:
+        shutil.rmtree(os.path.join(root, old), ignore_errors=True)
+
+    return len(rows)
+
+
+class ResultsSnapshot:
+    """memory-mapped 구별 결과 스냅샷 (읽기 전용)"""
+
+    def __init__(self, path):
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        self.gu = meta['gu']
+        self.count = meta['count']
+        self.status_table = meta['status_table']
+        self.reason_table = meta['reason_table']
+
+        def load(name):
+            return np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+
+        self.lat = load('lat')
+        self.lng = load('lng')
+        self.status = load('status')
+        self.reason = load('reason')
+        self._strings = {
+            field: (load(field), load(f'{field}_offsets'))
+            for field in STRING_FIELDS
+        }
+
+    def select(self, bbox=None, status=None):
+        """
+        조건에 맞는 행 인덱스
+
+        Args:
+            bbox: (min_lng, min_lat, max_lng, max_lat)
+            status: '정상' / '폐업'
+        """
+        mask = np.ones(self.count, dtype=bool)
+        if bbox is not None:
+            min_lng, min_lat, max_lng, max_lat = bbox
+            mask &= (self.lng >= min_lng) & (self.lng <= max_lng)
+            mask &= (self.lat >= min_lat) & (self.lat <= max_lat)
+        if status is not None:
+            if status not in self.status_table:
+                return np.empty(0, dtype=np.intp)
+            mask &= self.status == self.status_table.index(status)
+        return np.flatnonzero(mask)
+
+    def _string(self, field, index):
+        blob, offsets = self._strings[field]
+        return blob[offsets[index]:offsets[index + 1]].tobytes().decode('utf-8')
+
+    def rows(self, indices=None):
+        """get_results 행 형식으로 변환"""
+        if indices is None:
+            indices = range(self.count)
+        return [
+            {
+                'name': self._string('name', i),
+                'address': self._string('address', i),
+                'lat': float(self.lat[i]),
+                'lng': float(self.lng[i]),
+                'status': self.status_table[self.status[i]],
+                'match_reason': self.reason_table[self.reason[i]],
+            }
+            for i in indices
+        ]
+
+
+def load_snapshot(gu):
+    """
+    구별 스냅샷 로드 (없으면 None)
+
+    current 포인터 파일이 바뀔 때만 새로 매핑하고, 그 외에는 프로세스 내 인스턴스를 재사용한다.
+    """
+    def build(pointer_path):
+        with open(pointer_path) as f:
+            version = f.read().strip()
+        return ResultsSnapshot(os.path.join(os.path.dirname(pointer_path), version))
+
+    try:
+        return get_file_payload(os.path.join(_snapshot_root(gu), POINTER_FILE), build)
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
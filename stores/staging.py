@@ -0,0 +1,257 @@
+# stores/staging.py
+"""
+--clear 재수집용 스테이징 테이블 + 원자적 교체 (shadow table swap)
+
+기존 --clear는 구 데이터를 먼저 지우고 수 분 동안 다시 채우므로
+그 사이 지도에는 빈 구(또는 일부만 수집된 구)가 보였다.
+스테이징 재수집은
+1. 라이브 테이블과 같은 구성의 스테이징 테이블을 만들고
+2. 수집기는 스테이징 모델(같은 필드의 비관리 모델)에 기록하며
+3. 수집이 성공하면 한 트랜잭션에서 라이브 구 데이터와 교체한다.
+수집 중 읽기 요청은 계속 이전 데이터를 보고, 실패하면 스테이징만 버린다.
+
+교체 방식:
+    gu 파티션이 있는 테이블   기존 파티션 DETACH → DROP, 스테이징을 같은 이름으로 ATTACH
+                              (대량 DELETE 없음, CHECK 제약으로 ATTACH 검증 스캔 생략)
+    그 외 테이블 (다이소 등)  DELETE ... WHERE gu= + INSERT ... SELECT (한 트랜잭션)
+    PostgreSQL 외             기존처럼 즉시 삭제 후 라이브 테이블에 직접 기록
+
+구 이동 매장 (다른 구 라이브 데이터에 같은 고유키가 있는 경우):
+    관련된 구들의 advisory lock을 구 이름 순으로 잡아 교체를 직렬화하고,
+    그 구가 재수집 중(스테이징 테이블 존재)이 아닐 때만 다른 구의 행을 삭제한다.
+    재수집 중인 구는 그 구의 교체 때 다시 판단하므로 수집 중인 인접 구 데이터를 지우지 않는다.
+
+모델 _meta.db_table을 바꾸지 않으므로 같은 프로세스의 웹 요청(임베디드 워커)에는 영향이 없다.
+
+사용법:
+    from stores.staging import StagedReload
+
+    reload = StagedReload(StoreClosureResult, '영등포구')
+    Target = reload.begin()            # 스테이징 모델 (PostgreSQL 외에는 원본 모델)
+    Target.objects.update_or_create(...)
+    reload.commit()                    # 라이브 데이터와 교체
+    reload.finish(saved_count > 0)     # 또는: 성공 시 교체, 0건이면 폐기
+
+    with StagedReload(StoreClosureResult, '영등포구') as Target:   # 예외 시 abort
+        ...
+"""
+
+import hashlib
+
+from django.db import connection, models, transaction
+
+from .partitioning import PARTITION_KEY, _table_exists, clear_gu, is_partitioned, partition_name
+
+
+STAGING_SUFFIX = '_staging'
+
+# 스테이징 테이블 이름 → 스테이징 모델 (모델 재등록 경고 방지)
+_staging_models = {}
+
+
+def staging_table_name(table, gu):
+    """구 스테이징 테이블 이름 (예: store_closure_result_yd_staging)"""
+    name = partition_name(table, gu)
+    if name is None:
+        name = f"{table}_{hashlib.md5(gu.encode('utf-8')).hexdigest()[:8]}"
+    return f'{name}{STAGING_SUFFIX}'
+
+
+def staging_model(model, table):
+    """model과 같은 필드로 table에 기록하는 비관리(managed=False) 모델"""
+    if table in _staging_models:
+        return _staging_models[table]
+
+    meta = type('Meta', (), {
+        'app_label': model._meta.app_label,
+        'db_table': table,
+        'managed': False,
+    })
+    attrs = {'__module__': model.__module__, 'Meta': meta}
+    for field in model._meta.concrete_fields:
+        attrs[field.name] = field.clone()
+
+    name = f'{model.__name__}Staging{len(_staging_models)}'
+    staging = type(name, (models.Model,), attrs)
+    _staging_models[table] = staging
+    return staging
+
+
+class StagedReload:
+    """구 단위 스테이징 재수집 (begin → 기록 → commit / abort)"""
+
+    def __init__(self, model, gu, using=connection):
+        self.model = model
+        self.gu = gu
+        self.using = using
+        self.table = model._meta.db_table
+        self.staging_table = staging_table_name(self.table, gu)
+        self.partition = None
+        self.partition_exists = False
+        self.staged = False
+
+    @property
+    def supported(self):
+        return self.using.vendor == 'postgresql'
+
+    def _unique_columns(self):
+        """
+        구가 바뀐 매장이 다른 구에 중복으로 남지 않도록 교체 시 함께 정리할 컬럼
+
+        Returns:
+            [(컬럼, 전역 unique 여부), ...]
+            전역 unique(다이소 daiso_id)는 INSERT 충돌을 피하려면 항상 정리해야 하고,
+            (고유키, gu) UniqueConstraint의 고유키는 이전 구가 재수집 중이면 미룰 수 있다.
+        """
+        meta = self.model._meta
+        columns = [(field.column, True) for field in meta.concrete_fields if field.unique and not field.primary_key]
+        for constraint in meta.constraints:
+            if (isinstance(constraint, models.UniqueConstraint) and constraint.condition is None
+                    and PARTITION_KEY in constraint.fields and len(constraint.fields) == 2):
+                columns += [
+                    (meta.get_field(name).column, False) for name in constraint.fields if name != PARTITION_KEY
+                ]
+        return columns
+
+    def _moved_from(self, cursor, staging):
+        """스테이징 고유키가 라이브 데이터에서 다른 구에 있는 구 목록"""
+        qn = self.using.ops.quote_name
+        gus = set()
+        for column, _ in self._unique_columns():
+            cursor.execute(
+                f"SELECT DISTINCT {qn(PARTITION_KEY)} FROM {qn(self.table)} WHERE {qn(PARTITION_KEY)} <> %s "
+                f"AND {qn(column)} IN (SELECT {qn(column)} FROM {staging})",
+                [self.gu],
+            )
+            gus.update(row[0] for row in cursor.fetchall())
+        return gus
+
+    def _lock_gus(self, cursor, gus):
+        """구별 교체 advisory lock (트랜잭션 종료 시 해제, 교착 방지를 위해 이름 순)"""
+        for gu in sorted(gus):
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [f'staged_reload:{self.table}:{gu}'])
+
+    def _remove_moved(self, cursor, staging):
+        """
+        다른 구로 수집된 매장을 이전 구 라이브 데이터에서 삭제
+
+        이전 구가 재수집 중이면 건너뜀 (그 구의 교체가 최신 수집 결과로 정리)
+        단, 전역 unique 컬럼은 남겨 두면 교체 INSERT가 실패하므로 항상 삭제
+        """
+        qn = self.using.ops.quote_name
+        moved_from = self._moved_from(cursor, staging)
+        self._lock_gus(cursor, moved_from | {self.gu})
+        for gu in sorted(moved_from):
+            reloading = _table_exists(cursor, staging_table_name(self.table, gu))
+            for column, global_unique in self._unique_columns():
+                if reloading and not global_unique:
+                    continue
+                cursor.execute(
+                    f"DELETE FROM {qn(self.table)} WHERE {qn(PARTITION_KEY)} = %s "
+                    f"AND {qn(column)} IN (SELECT {qn(column)} FROM {staging})",
+                    [gu],
+                )
+
+    def begin(self):
+        """
+        스테이징 테이블 생성 (이전 실패로 남은 스테이징은 삭제)
+
+        Returns:
+            기록 대상 모델 (스테이징 모델, PostgreSQL 외에는 원본 모델)
+        """
+        if not self.supported:
+            clear_gu(self.model, self.gu)
+            return self.model
+
+        qn = self.using.ops.quote_name
+        if is_partitioned(self.table, self.using):
+            self.partition = partition_name(self.table, self.gu)
+
+        with self.using.cursor() as cursor:
+            self.partition_exists = bool(self.partition) and _table_exists(cursor, self.partition)
+            cursor.execute(f"DROP TABLE IF EXISTS {qn(self.staging_table)}")
+            # 기본값(id 시퀀스)·NOT NULL·인덱스까지 복사 → upsert 조회와 ATTACH 시 인덱스 재사용
+            cursor.execute(
+                f"CREATE TABLE {qn(self.staging_table)} (LIKE {qn(self.table)} "
+                f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES)"
+            )
+            # IDENTITY 컬럼(파티션 안 된 테이블의 id)은 LIKE로 기본값이 복사되지 않음
+            # → 라이브 테이블 시퀀스를 기본값으로 연결 (교체 시 다른 구 id와 충돌 방지)
+            pk = self.model._meta.pk.column
+            cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", [self.table, pk])
+            sequence = cursor.fetchone()[0]
+            if sequence:
+                cursor.execute(
+                    f"ALTER TABLE {qn(self.staging_table)} ALTER COLUMN {qn(pk)} SET DEFAULT nextval(%s::regclass)",
+                    [sequence],
+                )
+        self.staged = True
+        return staging_model(self.model, self.staging_table)
+
+    def commit(self):
+        """
+        스테이징 데이터를 라이브 구 데이터와 교체 (한 트랜잭션)
+
+        Returns:
+            교체 후 구 행 수 (PostgreSQL 외에는 직접 기록된 행 수)
+        """
+        if not self.staged:
+            return self.model.objects.filter(gu=self.gu).count()
+
+        qn = self.using.ops.quote_name
+        table, staging = qn(self.table), qn(self.staging_table)
+        with transaction.atomic(using=self.using.alias), self.using.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {staging}")
+            count = cursor.fetchone()[0]
+
+            self._remove_moved(cursor, staging)
+
+            if self.partition:
+                partition = qn(self.partition)
+                check = qn(f'{self.staging_table}_gu_check')
+                cursor.execute(
+                    f"ALTER TABLE {staging} ADD CONSTRAINT {check} CHECK ({qn(PARTITION_KEY)} = %s)", [self.gu]
+                )
+                if self.partition_exists:
+                    cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+                    cursor.execute(f"DROP TABLE {partition}")
+                cursor.execute(f"ALTER TABLE {staging} RENAME TO {partition}")
+                cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES IN (%s)", [self.gu])
+                cursor.execute(f"ALTER TABLE {partition} DROP CONSTRAINT {check}")
+            else:
+                cursor.execute(f"DELETE FROM {table} WHERE {qn(PARTITION_KEY)} = %s", [self.gu])
+                cursor.execute(f"INSERT INTO {table} SELECT * FROM {staging}")
+                cursor.execute(f"DROP TABLE {staging}")
+
+        self.staged = False
+        return count
+
+    def abort(self):
+        """스테이징 폐기 (라이브 데이터는 그대로)"""
+        if not self.staged:
+            return
+        with self.using.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.using.ops.quote_name(self.staging_table)}")
+        self.staged = False
+
+    def finish(self, succeeded):
+        """
+        수집 결과에 따라 교체 또는 폐기 (수집 0건이면 라이브 데이터를 비우지 않도록 폐기)
+
+        Returns:
+            교체된 행 수 (폐기 시 None)
+        """
+        if succeeded:
+            return self.commit()
+        self.abort()
+        return None
+
+    def __enter__(self):
+        return self.begin()
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
@@ -0,0 +1,181 @@
+# stores/static_export.py
+"""
+구별 정적 지도 번들 내보내기
+
+읽기 전용 열람은 Django/PostGIS를 거칠 필요가 없으므로, 파이프라인이 끝나면
+구별로 미리 렌더링한 HTML과 해시 이름의 데이터 파일을 만들어 nginx 등 정적 호스팅으로 제공한다.
+
+출력 구조 ({STATIC_EXPORT_DIR}/{구 코드}/):
+    store_closure_map.html          폐업 검증 지도 (데이터·육각 격자 내장, 단독 실행 가능)
+    map.html                        편의점 지도 (데이터 내장)
+    manifest.json                   구, 생성 시각, 데이터 파일 이름
+    data/results.{hash}.json        get_results 컬럼형 응답과 동일
+    data/closure.{hash}.geojson     폐업 검증 결과 GeoJSON
+    data/convenience.{hash}.geojson 편의점 GeoJSON
+
+- 데이터 파일은 내용 해시가 이름에 들어가므로 장기 캐시(immutable) 가능
+- 모든 파일 옆에 .gz / .br 사전 압축본을 둔다 (nginx gzip_static / brotli_static)
+- 파일은 임시 파일에 쓴 뒤 os.replace로 교체하여 반쯤 쓰인 파일이 노출되지 않음
+
+사용법:
+    python manage.py run_all --gu 영등포구 --export-static
+
+    from stores.static_export import export_static_bundle
+    manifest = export_static_bundle('영등포구')
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from django.conf import settings
+from django.template.loader import render_to_string
+
+from .columnar import FORMAT_COLUMNAR, dumps_stores
+from .compression import IDENTITY, compress_variants
+
+
+DATA_DIR = 'data'
+MANIFEST_FILE = 'manifest.json'
+
+# 사전 압축본 확장자
+ENCODING_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+
+def _bundle_dir(gu, output_dir=None):
+    from .management.commands.gu_codes import get_gu_info
+
+    root = output_dir or settings.STATIC_EXPORT_DIR
+    return os.path.join(root, get_gu_info(gu)['code'].lower())
+
+
+def _write_file(path, body):
+    """원본 + 사전 압축본 원자적 쓰기"""
+    variants = compress_variants(body)
+    for encoding, content in variants.items():
+        target = path if encoding == IDENTITY else path + ENCODING_SUFFIXES[encoding]
+        tmp = f'{target}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, target)
+    # 이번에 만들지 않은 압축본(작은 파일)은 이전 내용이므로 삭제
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        if encoding not in variants and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _write_hashed(bundle_dir, stem, ext, body):
+    """data/{stem}.{내용 해시}.{ext}로 저장 후 번들 기준 상대 경로 반환"""
+    encoded = body.encode('utf-8')
+    digest = hashlib.sha256(encoded).hexdigest()[:12]
+    name = f'{DATA_DIR}/{stem}.{digest}.{ext}'
+    path = os.path.join(bundle_dir, name)
+    if not os.path.exists(path):
+        _write_file(path, encoded)
+    return name
+
+
+def _geojson(rows):
+    """행 배열 → GeoJSON FeatureCollection (좌표 외 필드는 properties)"""
+    return json.dumps({
+        'type': 'FeatureCollection',
+        'features': [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [row['lng'], row['lat']]},
+                'properties': {key: value for key, value in row.items() if key not in ('lat', 'lng')},
+            }
+            for row in rows
+        ],
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+def _convenience_rows(gu):
+    """구별 편의점 (map.html 형식)"""
+    from .models import YeongdeungpoConvenience
+
+    return [
+        {
+            'name': store['name'],
+            'lat': store['location'].y,
+            'lng': store['location'].x,
+            'category': '편의점',
+        }
+        for store in YeongdeungpoConvenience.objects.filter(gu=gu).values('name', 'location')
+        if store['location']
+    ]
+
+
+def _remove_stale_data(bundle_dir, keep):
+    """manifest에 없는 이전 데이터 파일 정리"""
+    data_dir = os.path.join(bundle_dir, DATA_DIR)
+    keep = {os.path.basename(name) for name in keep}
+    for name in os.listdir(data_dir):
+        base = name
+        for suffix in ENCODING_SUFFIXES.values():
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base not in keep:
+            os.remove(os.path.join(data_dir, name))
+
+
+def export_static_bundle(gu, output_dir=None):
+    """
+    구별 정적 번들 생성
+
+    Args:
+        gu: 구 이름
+        output_dir: 출력 루트 (기본 settings.STATIC_EXPORT_DIR)
+
+    Returns:
+        manifest dict
+    """
+    from .analytics import HEX_RESOLUTIONS, hex_cells_geojson
+    from .views import _build_closure_map_payload, _build_results_json, _results_rows
+
+    bundle_dir = _bundle_dir(gu, output_dir)
+    os.makedirs(os.path.join(bundle_dir, DATA_DIR), exist_ok=True)
+
+    closure_rows = _results_rows(gu)
+    convenience_rows = _convenience_rows(gu)
+
+    files = {
+        'results': _write_hashed(bundle_dir, 'results', 'json', _build_results_json(gu, FORMAT_COLUMNAR)),
+        'closure': _write_hashed(bundle_dir, 'closure', 'geojson', _geojson(closure_rows)),
+        'convenience': _write_hashed(bundle_dir, 'convenience', 'geojson', _geojson(convenience_rows)),
+    }
+
+    # 미리 렌더링한 페이지 (데이터 내장, 서버 요청 없이 열람 가능)
+    pages = {
+        'store_closure_map.html': render_to_string('store_closure_map.html', {
+            **_build_closure_map_payload(FORMAT_COLUMNAR, gu=gu),
+            # 육각 격자 레이어는 /api/hex-density/ 대신 크기별 구 격자를 내장
+            'hex_layers_json': json.dumps(
+                {str(resolution): hex_cells_geojson(resolution, gu) for resolution in HEX_RESOLUTIONS},
+                ensure_ascii=False, separators=(',', ':'),
+            ),
+            'kakao_js_key': settings.KAKAO_JS_KEY,
+        }),
+        'map.html': render_to_string('map.html', {
+            'stores_json': dumps_stores(convenience_rows, FORMAT_COLUMNAR, dict_fields=('category',)),
+            'kakao_js_key': settings.KAKAO_JS_KEY,
+        }),
+    }
+    for name, html in pages.items():
+        _write_file(os.path.join(bundle_dir, name), html.encode('utf-8'))
+
+    manifest = {
+        'gu': gu,
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'store_count': len(closure_rows),
+        'convenience_count': len(convenience_rows),
+        'pages': list(pages),
+        'files': files,
+    }
+    _write_file(
+        os.path.join(bundle_dir, MANIFEST_FILE),
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'),
+    )
+    _remove_stale_data(bundle_dir, files.values())
+    return manifest
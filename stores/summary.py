@@ -0,0 +1,66 @@
+# stores/summary.py
+"""
+구별 요약 통계 (GuSummary) 갱신
+
+파이프라인 완료 시 1회 호출하여 구별 건수/상태/매칭 근거/데이터 품질 지표를
+테이블별 집계 쿼리 1회씩으로 계산하고 GuSummary에 저장한다.
+대시보드와 구별 비교 화면은 개별 count() 대신 이 테이블만 읽는다.
+
+사용법:
+    from stores.summary import refresh_gu_summary
+
+    summary = refresh_gu_summary('영등포구')
+"""
+
+from django.db.models import Count, Q
+
+from .models import (
+    GuSummary,
+    SeoulRestaurantLicense,
+    StoreClosureResult,
+    TobaccoRetailLicense,
+    YeongdeungpoConvenience,
+    YeongdeungpoDaiso,
+)
+
+
+def refresh_gu_summary(gu):
+    """
+    구별 요약 통계 재계산 후 저장
+
+    Returns:
+        갱신된 GuSummary 인스턴스
+    """
+    convenience = YeongdeungpoConvenience.objects.filter(gu=gu).aggregate(
+        total=Count('id'),
+        coords_missing=Count('id', filter=Q(location__isnull=True)),
+    )
+
+    # 상태별/매칭 근거별 카운트를 한 번의 스캔으로 집계
+    closure = StoreClosureResult.objects.filter(gu=gu).aggregate(
+        total=Count('id'),
+        normal=Count('id', filter=Q(status='정상')),
+        closed=Count('id', filter=Q(status='폐업')),
+        # 매칭 근거는 비트 조합이므로 해당 비트가 포함된 정수 값 IN 조건
+        name_match=Count('id', filter=Q(match_flags__in=StoreClosureResult.flags_with(StoreClosureResult.MATCH_NAME))),
+        address_match=Count('id', filter=Q(match_flags__in=StoreClosureResult.flags_with(StoreClosureResult.MATCH_ADDRESS))),
+        coord_match=Count('id', filter=Q(match_flags__in=StoreClosureResult.flags_with(StoreClosureResult.MATCH_COORD))),
+    )
+
+    summary, _ = GuSummary.objects.update_or_create(
+        gu=gu,
+        defaults={
+            'daiso_count': YeongdeungpoDaiso.objects.filter(gu=gu).count(),
+            'convenience_count': convenience['total'],
+            'restaurant_count': SeoulRestaurantLicense.objects.filter(gu=gu).count(),
+            'tobacco_count': TobaccoRetailLicense.objects.filter(gu=gu).count(),
+            'closure_total': closure['total'],
+            'normal_count': closure['normal'],
+            'closed_count': closure['closed'],
+            'name_match_count': closure['name_match'],
+            'address_match_count': closure['address_match'],
+            'coord_match_count': closure['coord_match'],
+            'coords_missing': convenience['coords_missing'],
+        }
+    )
+    return summary
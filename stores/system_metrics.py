@@ -0,0 +1,189 @@
+# stores/system_metrics.py
+"""
+시스템 리소스 백그라운드 샘플러
+
+dev_status 요청마다 psutil.cpu_percent(interval=0.1)로 블로킹하지 않도록
+백그라운드 스레드가 고정 주기로 CPU/메모리/네트워크/프로세스/스레드 지표를 수집해
+링 버퍼(deque)에 보관한다. 요청 처리 시에는 최신 샘플과 시계열만 읽는다.
+
+- cpu_percent(interval=None): 직전 호출 이후 구간의 사용률 → 샘플 주기가 곧 측정 구간
+- 네트워크는 누적값과 함께 직전 샘플 대비 전송률(KB/s)을 계산
+
+사용법:
+    from .system_metrics import system_sampler
+
+    system_sampler.start()              # 최초 1회 (중복 호출 무시)
+    latest = system_sampler.latest()
+    history = system_sampler.history(seconds=300)
+"""
+
+import threading
+import time
+from collections import deque
+
+
+# psutil 미설치 시 반환할 기본값 (dev_status 응답의 system 항목 형태)
+EMPTY_METRICS = {
+    'cpu': {'percent': 0, 'cores': 0},
+    'memory': {'used_mb': 0, 'total_mb': 0, 'percent': 0},
+    'disk': {'used_gb': 0, 'total_gb': 0, 'percent': 0},
+    'network': {'sent_mb': 0, 'recv_mb': 0, 'sent_kbps': 0, 'recv_kbps': 0},
+    'process': {'memory_mb': 0, 'cpu_percent': 0},
+    'threads': {'active': 0},
+    'error': 'psutil not installed'
+}
+
+
+class SystemMetricsSampler:
+    """
+    고정 주기 시스템 리소스 샘플러
+
+    샘플은 최근 history_size개만 보관한다. (기본 2초 × 900 = 30분)
+    """
+
+    def __init__(self, interval: float = 2.0, history_size: int = 900):
+        """
+        Args:
+            interval: 샘플링 주기 (초)
+            history_size: 링 버퍼에 보관할 최대 샘플 수
+        """
+        self.interval = interval
+        self._samples = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._process = None
+        self._last_net = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """샘플러 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.running:
+                return
+            try:
+                import psutil
+            except ImportError:
+                return
+            self._process = psutil.Process()
+            # cpu_percent(interval=None) 기준점 설정 후 첫 샘플 기록
+            psutil.cpu_percent(interval=None)
+            self._process.cpu_percent(interval=None)
+            self._samples.append(self.sample())
+
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='system-metrics-sampler')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """샘플러 스레드 종료"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                sample = self.sample()
+            except Exception as e:
+                sample = {'timestamp': time.time(), 'error': str(e)}
+            self._samples.append(sample)
+
+    def sample(self) -> dict:
+        """현재 시스템 리소스 1회 측정 (블로킹 없음)"""
+        try:
+            import psutil
+        except ImportError:
+            return {**EMPTY_METRICS, 'timestamp': time.time()}
+
+        now = time.time()
+        process = self._process or psutil.Process()
+
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+
+        # 네트워크 누적값 + 직전 샘플 대비 전송률
+        net = psutil.net_io_counters()
+        sent_kbps = recv_kbps = 0
+        if self._last_net:
+            last_time, last_sent, last_recv = self._last_net
+            elapsed = now - last_time
+            if elapsed > 0:
+                sent_kbps = round((net.bytes_sent - last_sent) / 1024 / elapsed, 1)
+                recv_kbps = round((net.bytes_recv - last_recv) / 1024 / elapsed, 1)
+        self._last_net = (now, net.bytes_sent, net.bytes_recv)
+
+        return {
+            'timestamp': now,
+            'cpu': {
+                'percent': psutil.cpu_percent(interval=None),
+                'cores': psutil.cpu_count(),
+            },
+            'memory': {
+                'used_mb': round(memory.used / (1024 * 1024), 1),
+                'total_mb': round(memory.total / (1024 * 1024), 1),
+                'percent': memory.percent,
+            },
+            'disk': {
+                'used_gb': round(disk.used / (1024 * 1024 * 1024), 1),
+                'total_gb': round(disk.total / (1024 * 1024 * 1024), 1),
+                'percent': disk.percent,
+            },
+            'network': {
+                'sent_mb': round(net.bytes_sent / (1024 * 1024), 1),
+                'recv_mb': round(net.bytes_recv / (1024 * 1024), 1),
+                'sent_kbps': sent_kbps,
+                'recv_kbps': recv_kbps,
+            },
+            'process': {
+                'memory_mb': round(process.memory_info().rss / (1024 * 1024), 1),
+                'cpu_percent': process.cpu_percent(interval=None),
+            },
+            'threads': {
+                'active': threading.active_count(),
+            }
+        }
+
+    def latest(self) -> dict:
+        """가장 최근 샘플 (샘플러가 시작되지 않았으면 기본값)"""
+        try:
+            return self._samples[-1]
+        except IndexError:
+            return {**EMPTY_METRICS, 'timestamp': time.time()}
+
+    def history(self, seconds: float = None) -> list:
+        """
+        차트용 시계열 (최근 seconds초, None이면 전체 버퍼)
+
+        Returns:
+            [{'t': epoch, 'cpu': %, 'memory': %, 'process_cpu': %,
+              'process_memory_mb': MB, 'sent_kbps': KB/s, 'recv_kbps': KB/s, 'threads': n}, ...]
+        """
+        samples = list(self._samples)
+        if seconds is not None:
+            since = time.time() - seconds
+            samples = [s for s in samples if s['timestamp'] >= since]
+
+        return [
+            {
+                't': round(s['timestamp'], 1),
+                'cpu': s['cpu']['percent'],
+                'memory': s['memory']['percent'],
+                'process_cpu': s['process']['cpu_percent'],
+                'process_memory_mb': s['process']['memory_mb'],
+                'sent_kbps': s['network']['sent_kbps'],
+                'recv_kbps': s['network']['recv_kbps'],
+                'threads': s['threads']['active'],
+            }
+            for s in samples
+            if 'cpu' in s
+        ]
+
+
+# 웹 프로세스 전역 샘플러 (dev_status 최초 호출 시 시작)
+system_sampler = SystemMetricsSampler()
@@ -11,19 +11,61 @@
 7. 성능 벤치마크 테스트
 """
 
-from django.test import TestCase, Client
-from django.contrib.gis.geos import Point
-from django.db import IntegrityError
+from django.test import TestCase, Client, override_settings
+from django.contrib.gis.geos import Point, Polygon
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
 from stores.models import (
     YeongdeungpoConvenience, 
     YeongdeungpoDaiso,
     SeoulRestaurantLicense,
     TobaccoRetailLicense,
-    StoreClosureResult
+    StoreClosureResult,
+    CollectionJob,
+    HexCell,
+    StoreClosureHistory,
+    GuBoundary,
+    Region
 )
+from stores.analytics import (
+    HEX_RESOLUTIONS, assign_nearest_daiso, daiso_density, daiso_density_json, refresh_hex_cells,
+)
+from stores.data_cache import bump_data_version, get_file_payload
+from stores.compression import compress_variants, negotiate_encoding
+from stores.coordinates import parse_coordinates, tm_rows_to_wgs84
+from stores.events import EventBus
+from stores.system_metrics import SystemMetricsSampler
+from stores.license_fields import parse_date, parse_datetime, parse_decimal, parse_int, typed_license_values
+from stores.gu_boundaries import GuClassifier, annotate_boundary_gu, load_gu_boundaries
+from stores.history import newly_changed, record_closure_history, status_trend
+from stores.partitioning import clear_gu, is_partitioned
+from stores.regions import clear_region_cache, get_registry, plan_shards, record_run_cost
+from stores.staging import StagedReload
+from stores.jobs import JobReporter, claim_next_job, enqueue_job, enqueue_regions, run_worker
+from stores.key_validation import (
+    _remember,
+    clear_validation_cache,
+    validate_api_keys,
+    validate_kakao_rest_api_key,
+)
+from stores.snapshot import load_snapshot, write_snapshot
+from stores.static_export import export_static_bundle
+from stores.summary import refresh_gu_summary
+from stores.views import _build_matched_stores_payload
+from io import StringIO
+import asyncio
+import os
 import json
 import time
-from unittest.mock import patch
+import unittest
+from unittest.mock import patch, MagicMock
+
+
+# PostGIS 전용 기능(파티션, pg_trgm, KNN/geography, EXPLAIN JSON) 테스트
+# SpatiaLite 프로필(config/settings_spatialite.py)에서는 건너뜀
+requires_postgis = unittest.skipUnless(connection.vendor == 'postgresql', 'PostGIS 전용 기능')
 
 
 # ========================================
@@ -152,6 +194,27 @@ class DuplicatePreventionTests(TestCase):
             )
         print("    ✅ 휴게음식점 중복 저장 방지 확인 (IntegrityError 발생)")
 
+    def test_place_id_unique_per_gu(self):
+        """place_id는 구별 고유키 (동시에 수집되는 인접 구에서 upsert 충돌 없음)"""
+        print("\n[TEST] 구별 place_id 고유키 테스트 시작")
+        for gu in ("영등포구", "마포구"):
+            StoreClosureResult.objects.update_or_create(
+                place_id="border_001", gu=gu,
+                defaults={'name': "경계 편의점", 'address': gu, 'status': "정상"},
+            )
+        # 두 구 작업이 같은 place_id를 저장해도 각 구 upsert는 1건만 조회 (MultipleObjectsReturned 없음)
+        obj, created = StoreClosureResult.objects.update_or_create(
+            place_id="border_001", gu="영등포구", defaults={'status': "폐업"},
+        )
+        self.assertFalse(created)
+        self.assertEqual(StoreClosureResult.objects.filter(place_id="border_001").count(), 2)
+
+        with self.assertRaises(IntegrityError):
+            StoreClosureResult.objects.create(
+                place_id="border_001", gu="마포구", name="중복", address="마포구", status="정상"
+            )
+        print("    ✅ (place_id, gu) 고유 제약 확인")
+
 
 # ========================================
 # 3. 좌표 데이터 유효성 테스트
@@ -619,29 +682,1730 @@ class ExceptionHandlingTests(TestCase):
 
     def test_duplicate_execution_prevented(self):
         print("\n[TEST] 중복 실행 방지(API) 테스트 시작")
-        # stores.views.collection_status를 모킹하여 'running': True 상태로 만듦
-        with patch('stores.views.collection_status', {
-            'running': True,
-            'progress': 50,
-            'message': '수집 중...',
-            'completed': False,
-            'error': None
-        }):
-            response = self.client.post(
-                '/api/start-collection/',
-                data=json.dumps({
-                    'kakao_api_key': 'test_key',
-                    'kakao_js_key': 'test_js_key',
-                    'seoul_api_key': 'test_seoul_key',
-                    'target_gu': '영등포구'
-                }),
-                content_type='application/json'
+        # 같은 구의 작업이 실행 중인 상태로 만듦
+        CollectionJob.objects.create(
+            gu='영등포구',
+            status=CollectionJob.STATUS_RUNNING,
+            progress=50,
+            message='수집 중...',
+            heartbeat_at=timezone.now()
+        )
+        response = self.client.post(
+            '/api/start-collection/',
+            data=json.dumps({
+                'kakao_api_key': 'test_key',
+                'kakao_js_key': 'test_js_key',
+                'seoul_api_key': 'test_seoul_key',
+                'target_gu': '영등포구'
+            }),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        
+        # 실패해야 함
+        self.assertFalse(data['success'])
+        self.assertIn('이미 수집이 진행 중입니다', data['error'])
+        print("    ✅ 중복 실행 시도 차단 및 에러 메시지 확인")
+
+
+# ========================================
+# 9. 응답 캐시 / 조건부 요청 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ResponseCacheTests(TestCase):
+    """데이터 버전 기반 응답 캐시 및 ETag/304 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        cache.clear()
+        StoreClosureResult.objects.create(
+            place_id="cache_001",
+            name="캐시 테스트 편의점",
+            address="서울시 영등포구 테스트로 1",
+            gu="영등포구",
+            latitude=37.5171,
+            longitude=126.9066,
+            status="정상",
+            match_reason="이름"
+        )
+
+    def test_results_etag_and_304(self):
+        print("\n[TEST] 결과 API ETag / 304 응답 테스트 시작")
+        response = self.client.get('/api/get-results/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        # 같은 ETag로 재요청 → 304 (DB 조회 없음)
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/get-results/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        # 인코딩별 사본이 같은 ETag를 쓰므로 약한 ETag, 다른 인코딩으로 받은 ETag로도 304
+        gzip_response = self.client.get('/api/get-results/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertTrue(gzip_response['ETag'].startswith('W/"'))
+        response = self.client.get('/api/get-results/', HTTP_IF_NONE_MATCH=gzip_response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        print("    ✅ If-None-Match 재요청 시 304 반환 확인")
+
+    def test_repeat_view_uses_cache(self):
+        print("\n[TEST] 지도 뷰 반복 요청 캐시 테스트 시작")
+        first = self.client.get('/store-closure/')
+        self.assertEqual(first.status_code, 200)
+
+        # 두 번째 요청은 캐시된 페이로드 사용 (DB 조회 없음)
+        with self.assertNumQueries(0):
+            second = self.client.get('/store-closure/')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first['ETag'], second['ETag'])
+        print("    ✅ 반복 요청 시 DB 조회 0회 확인")
+
+    def test_bump_invalidates_cache(self):
+        print("\n[TEST] 데이터 버전 갱신 시 캐시 무효화 테스트 시작")
+        first = self.client.get('/api/get-results/?gu=영등포구')
+        self.assertEqual(len(first.json()['stores']), 1)
+
+        StoreClosureResult.objects.create(
+            place_id="cache_002",
+            name="신규 편의점",
+            address="서울시 영등포구 테스트로 2",
+            gu="영등포구",
+            latitude=37.5172,
+            longitude=126.9067,
+            status="폐업",
+            match_reason="없음"
+        )
+        bump_data_version('영등포구')
+
+        second = self.client.get('/api/get-results/?gu=영등포구', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(first['ETag'], second['ETag'])
+        self.assertEqual(len(second.json()['stores']), 2)
+        print("    ✅ 버전 갱신 후 새 데이터 반환 확인")
+
+
+# ========================================
+# 10. 구별 요약 통계 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class GuSummaryTests(TestCase):
+    """GuSummary 갱신 및 구별 비교 API 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        cache.clear()
+        for i, (status, reason) in enumerate([('정상', '이름, 주소'), ('정상', '좌표'), ('폐업', '없음')]):
+            StoreClosureResult.objects.create(
+                place_id=f"summary_{i}",
+                name=f"요약 테스트 {i}",
+                address=f"서울시 영등포구 테스트로 {i}",
+                gu="영등포구",
+                latitude=37.5171,
+                longitude=126.9066,
+                status=status,
+                match_reason=reason
             )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            
-            # 실패해야 함
-            self.assertFalse(data['success'])
-            self.assertIn('이미 수집이 진행 중입니다', data['error'])
-            print("    ✅ 중복 실행 시도 차단 및 에러 메시지 확인")
+
+    def test_refresh_gu_summary(self):
+        print("\n[TEST] 구별 요약 통계 갱신 테스트 시작")
+        summary = refresh_gu_summary('영등포구')
+        self.assertEqual(summary.closure_total, 3)
+        self.assertEqual(summary.normal_count, 2)
+        self.assertEqual(summary.closed_count, 1)
+        self.assertEqual(summary.name_match_count, 1)
+        self.assertEqual(summary.address_match_count, 1)
+        self.assertEqual(summary.coord_match_count, 1)
+        print(f"    - {summary}")
+        print("    ✅ 상태/매칭 근거별 집계 정상")
+
+    def test_gu_summary_endpoint(self):
+        print("\n[TEST] 구별 비교 API 테스트 시작")
+        refresh_gu_summary('영등포구')
+        bump_data_version('영등포구')
+        response = self.client.get('/api/gu-summary/')
+        self.assertEqual(response.status_code, 200)
+        summaries = response.json()['summaries']
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]['gu'], '영등포구')
+        self.assertAlmostEqual(summaries[0]['closure_rate'], 33.3)
+        print("    ✅ 구별 요약 API 응답 정상")
+
+
+# ========================================
+# 11. 실시간 이벤트 스트림 (SSE) 테스트
+# ========================================
+
+class EventStreamTests(TestCase):
+    """EventBus 이어받기 및 /api/events/ 스트림 테스트"""
+
+    def test_event_bus_resume(self):
+        print("\n[TEST] 이벤트 버스 이어받기 테스트 시작")
+        bus = EventBus(max_events=3)
+        first_id = bus.publish('log', {'message': 'a'})
+        for i in range(3):
+            bus.publish('log', {'message': str(i)})
+
+        # 버퍼에 남아 있는 구간은 이어받기 가능, 밀려난 구간은 불가
+        self.assertTrue(bus.can_resume(first_id))
+        self.assertFalse(bus.can_resume(first_id - 1))
+        self.assertFalse(bus.can_resume(bus.last_id + 10))
+        self.assertEqual(len(bus.wait(first_id, timeout=0)), 3)
+
+        # 새 이벤트가 없으면 타임아웃 후 빈 리스트
+        self.assertEqual(bus.wait(bus.last_id, timeout=0.01), [])
+
+        # SSE id는 버스(프로세스) epoch 포함 → 다른 워커 프로세스의 id는 이어받기 대상 아님
+        self.assertEqual(bus.parse_event_id(bus.format_event_id(first_id)), first_id)
+        other = EventBus()
+        self.assertIsNone(bus.parse_event_id(other.format_event_id(first_id)))
+        self.assertIsNone(bus.parse_event_id(str(first_id)))
+        print("    ✅ Last-Event-ID 이후 이벤트만 전달 확인")
+
+    def test_events_endpoint_resyncs_foreign_event_id(self):
+        print("\n[TEST] 다른 워커 이벤트 id 재연결 테스트 시작")
+        from stores.events import event_bus
+
+        event_bus.publish('log', {'message': 'resume'})
+        own_id = event_bus.format_event_id(event_bus.last_id)
+        foreign_id = EventBus().format_event_id(event_bus.last_id)
+
+        # 같은 프로세스 id → 스냅샷 없이 이어받기
+        response = self.client.get('/api/events/', HTTP_LAST_EVENT_ID=own_id)
+        stream = iter(response.streaming_content)
+        next(stream)
+        with patch('stores.views.event_bus.wait', return_value=[]):
+            self.assertEqual(next(stream).decode(), ': keepalive\n\n')
+        response.close()
+
+        # 다른 프로세스(uvicorn 워커) id → 번호가 같아도 스냅샷부터 다시 전송
+        response = self.client.get('/api/events/', HTTP_LAST_EVENT_ID=foreign_id)
+        stream = iter(response.streaming_content)
+        next(stream)
+        chunk = next(stream).decode()
+        self.assertIn('event: snapshot', chunk)
+        self.assertIn(f'id: {event_bus.epoch}-', chunk)
+        response.close()
+        print("    ✅ epoch 불일치 시 스냅샷 재동기화 확인")
+
+    def test_events_endpoint_stream(self):
+        print("\n[TEST] SSE 엔드포인트 스트림 테스트 시작")
+        response = self.client.get('/api/events/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+
+        stream = iter(response.streaming_content)
+        self.assertTrue(next(stream).decode().startswith('retry:'))
+        self.assertIn('event: snapshot', next(stream).decode())
+
+        # 작업 로그 기록 즉시 log 이벤트 전달
+        JobReporter(CollectionJob.objects.create(gu='영등포구')).log('SSE 테스트 로그', 'INFO')
+        chunk = next(stream).decode()
+        self.assertIn('event: log', chunk)
+        self.assertIn('SSE 테스트 로그', chunk)
+        response.close()
+        print("    ✅ snapshot → log 이벤트 순서 확인")
+
+    async def test_events_endpoint_stream_asgi(self):
+        print("\n[TEST] ASGI SSE 스트림 테스트 시작")
+        import threading
+
+        from stores.events import event_bus
+
+        response = await self.async_client.get('/api/events/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+
+        # 동기 이터레이터였다면 list()로 무한 대기 → 첫 청크부터 바로 받아야 함
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await asyncio.wait_for(anext(stream), 5)).decode().startswith('retry:'))
+        self.assertIn('event: snapshot', (await asyncio.wait_for(anext(stream), 5)).decode())
+
+        # 다른 스레드(워커)에서 발행한 이벤트가 대기 중인 스트림을 깨움
+        threading.Timer(0.1, event_bus.publish, args=('log', {'message': 'ASGI 테스트 로그'})).start()
+        chunk = (await asyncio.wait_for(anext(stream), 5)).decode()
+        self.assertIn('event: log', chunk)
+        self.assertIn('ASGI 테스트 로그', chunk)
+        await stream.aclose()
+        print("    ✅ async 스트림 즉시 전송 + 이벤트 깨움 확인")
+
+
+# ========================================
+# 12. 시스템 리소스 샘플러 테스트
+# ========================================
+
+class SystemMetricsSamplerTests(TestCase):
+    """백그라운드 샘플러 링 버퍼 및 dev_status 응답 테스트"""
+
+    def test_history_is_bounded(self):
+        print("\n[TEST] 샘플러 링 버퍼 크기 제한 테스트 시작")
+        sampler = SystemMetricsSampler(interval=0.01, history_size=5)
+        sampler.start()
+        time.sleep(0.2)
+        sampler.stop()
+
+        history = sampler.history()
+        self.assertLessEqual(len(history), 5)
+        self.assertGreaterEqual(len(history), 2)
+        self.assertIn('cpu', history[-1])
+        print(f"    - 보관 샘플: {len(history)}개")
+        print("    ✅ 최근 N개 샘플만 유지 확인")
+
+    def test_dev_status_does_not_block(self):
+        print("\n[TEST] dev_status 응답 시간 테스트 시작")
+        self.client.get('/api/dev-status/')  # 샘플러 시작
+
+        start = time.time()
+        response = self.client.get('/api/dev-status/')
+        elapsed = time.time() - start
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIn('system', data)
+        self.assertIn('system_history', data)
+        # 요청 중 psutil 블로킹 측정(0.2초)이 없어야 함
+        self.assertLess(elapsed, 0.1)
+        print(f"    - 응답 시간: {elapsed * 1000:.1f}ms")
+        print("    ✅ 최신 샘플 + 시계열 반환 확인")
+
+
+
+# ========================================
+# 13. 수집 작업 큐 테스트
+# ========================================
+
+class CollectionJobQueueTests(TestCase):
+    """CollectionJob 등록/가져가기/실행 상태 저장 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_claim_next_job(self):
+        print("\n[TEST] 작업 가져가기(SKIP LOCKED) 테스트 시작")
+        first = enqueue_job('영등포구', {'kakao_api_key': 'k', 'seoul_api_key': 's'})
+        second = enqueue_job('강남구')
+
+        # 먼저 등록된 작업부터 running으로 전환
+        job = claim_next_job('worker-a')
+        self.assertEqual(job.pk, first.pk)
+        self.assertEqual(job.status, CollectionJob.STATUS_RUNNING)
+        self.assertEqual(job.worker, 'worker-a')
+
+        self.assertEqual(claim_next_job('worker-b').pk, second.pk)
+        self.assertIsNone(claim_next_job('worker-c'))
+        print("    ✅ 등록 순서대로 1건씩 가져감 확인")
+
+    def test_worker_persists_job_state(self):
+        print("\n[TEST] 워커 실행 상태 저장 테스트 시작")
+        job = enqueue_job('영등포구', {'kakao_api_key': 'k', 'seoul_api_key': 's'})
+        # API 키는 DB 컬럼이 아니라 작업 id 키의 단기 캐시로만 전달
+        self.assertNotIn('api_keys', [field.name for field in CollectionJob._meta.fields])
+        self.assertEqual(cache.get(f'collection_job_api_keys:{job.pk}'), {'kakao_api_key': 'k', 'seoul_api_key': 's'})
+
+        with patch('stores.jobs.call_command') as mock_command:
+            processed = run_worker('worker-test', once=True)
+
+        self.assertEqual(processed, 1)
+        self.assertEqual(mock_command.call_count, 5)
+        self.assertEqual(mock_command.call_args_list[0].kwargs['api_key'], 'k')
+        self.assertEqual(mock_command.call_args_list[2].kwargs['api_key'], 's')
+        self.assertIsNone(cache.get(f'collection_job_api_keys:{job.pk}'))  # 가져갈 때 삭제
+        job.refresh_from_db()
+        self.assertEqual(job.status, CollectionJob.STATUS_COMPLETED)
+        self.assertEqual(job.progress, 100)
+        self.assertEqual(job.metrics['stages']['closure']['status'], 'completed')
+        self.assertTrue(job.metrics['logs'])
+
+        # 웹 API는 저장된 작업 상태를 조회
+        data = self.client.get(f'/api/check-status/?job_id={job.pk}').json()
+        self.assertTrue(data['completed'])
+        self.assertEqual(data['target_gu'], '영등포구')
+        print("    ✅ 진행률/metrics DB 저장 및 조회 확인")
+
+    def test_duplicate_enqueue_blocked_by_constraint(self):
+        print("\n[TEST] 같은 구 중복 등록(DB 제약) 테스트 시작")
+        from datetime import timedelta
+
+        first = enqueue_job('영등포구')
+
+        # 확인 후 등록 사이에 끼어든 요청도 DB 제약으로 차단 → None
+        self.assertIsNone(enqueue_job('영등포구'))
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CollectionJob.objects.create(gu='영등포구', status=CollectionJob.STATUS_RUNNING)
+        self.assertEqual(CollectionJob.objects.filter(gu='영등포구').count(), 1)
+
+        with patch('stores.views.get_active_job', return_value=None), \
+                patch('stores.views.validate_api_keys', return_value=(True, None)), \
+                patch.dict(os.environ):
+            data = self.client.post('/api/start-collection/', data=json.dumps({
+                'kakao_api_key': 'k', 'kakao_js_key': 'j', 'seoul_api_key': 's', 'target_gu': '영등포구',
+            }), content_type='application/json').json()
+        self.assertFalse(data['success'])
+        self.assertIn('이미 수집이 진행 중입니다', data['error'])
+
+        # heartbeat가 끊긴 실행 작업은 실패 처리 후 새 작업 등록
+        claim_next_job('worker-a')
+        CollectionJob.objects.filter(pk=first.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+        second = enqueue_job('영등포구')
+        self.assertIsNotNone(second)
+        first.refresh_from_db()
+        self.assertEqual(first.status, CollectionJob.STATUS_FAILED)
+        print("    ✅ 동시 등록 차단 및 끊긴 작업 대체 확인")
+
+
+# ========================================
+# 14. 교차 매칭 지도 페이로드 캐시 테스트
+# ========================================
+
+class MatchedStoresPayloadTests(TestCase):
+    """matched_stores_unique.csv 파싱 결과의 mtime 기준 캐시 테스트"""
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmpdir.name, 'matched_stores_unique.csv')
+        self.write_csv([('GS25 영등포점', '37.5171', '126.9066'), ('CU 좌표없음', '', '')])
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_csv(self, rows):
+        with open(self.csv_path, 'w', encoding='utf-8-sig') as f:
+            f.write('이름,주소,위도,경도,출처,매칭이유\n')
+            for name, lat, lng in rows:
+                f.write(f'{name},서울시 영등포구,{lat},{lng},카카오,이름\n')
+
+    def test_payload_cached_until_file_changes(self):
+        print("\n[TEST] 교차 매칭 페이로드 캐시 테스트 시작")
+        builder = MagicMock(wraps=_build_matched_stores_payload)
+        first = get_file_payload(self.csv_path, builder)
+        second = get_file_payload(self.csv_path, builder)
+        self.assertIs(first, second)
+        self.assertEqual(builder.call_count, 1)
+        self.assertEqual(first['store_count'], 2)
+        self.assertEqual(len(json.loads(first['stores_json'])), 1)  # 좌표 없는 행 제외
+
+        # 파일이 다시 쓰이면 (mtime 변경) 재생성
+        self.write_csv([('GS25 영등포점', '37.5171', '126.9066')])
+        os.utime(self.csv_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        third = get_file_payload(self.csv_path, builder)
+        self.assertEqual(builder.call_count, 2)
+        self.assertEqual(third['store_count'], 1)
+        print("    ✅ 파일 변경 시에만 CSV 재파싱 확인")
+
+
+# ========================================
+# 15. 컬럼형 지도 데이터 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ColumnarPayloadTests(TestCase):
+    """컬럼형(병렬 배열 + 사전 인코딩 + Float32 좌표) 응답 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        for i, status in enumerate(['정상', '폐업', '정상']):
+            StoreClosureResult.objects.create(
+                place_id=f"columnar_{i}",
+                name=f"컬럼형 테스트 {i}",
+                address=f"서울시 영등포구 테스트로 {i}",
+                gu="영등포구",
+                latitude=37.5171 + i * 0.001,
+                longitude=126.9066,
+                status=status,
+                match_reason="이름"
+            )
+
+    def test_columnar_results(self):
+        print("\n[TEST] 결과 API 컬럼형 응답 테스트 시작")
+        rows = self.client.get('/api/get-results/?gu=영등포구').json()['stores']
+        data = self.client.get('/api/get-results/?gu=영등포구&format=columnar').json()['stores']
+
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(sorted(data['dicts']['status']), ['정상', '폐업'])
+        self.assertEqual(data['dicts']['match_reason'], ['이름'])
+        # 복원 결과가 기존 행 형식과 동일
+        decoded = [
+            {
+                'name': data['columns']['name'][i],
+                'address': data['columns']['address'][i],
+                'lat': data['coords'][2 * i],
+                'lng': data['coords'][2 * i + 1],
+                'status': data['dicts']['status'][data['columns']['status'][i]],
+                'match_reason': data['dicts']['match_reason'][data['columns']['match_reason'][i]],
+            }
+            for i in range(data['count'])
+        ]
+        self.assertEqual(decoded, rows)
+        print("    ✅ 사전 인코딩 복원 결과 일치")
+
+    def test_float32_coords(self):
+        print("\n[TEST] Float32 좌표 버퍼 테스트 시작")
+        import base64
+        from array import array
+
+        data = self.client.get('/api/get-results/?gu=영등포구&format=columnar-f32').json()['stores']
+        coords = array('f')
+        coords.frombytes(base64.b64decode(data['coords_f32']))
+        self.assertEqual(len(coords), 6)
+        # Float32 오차 1m(약 0.00001도) 미만
+        self.assertAlmostEqual(coords[0], 37.5171, places=5)
+        self.assertAlmostEqual(coords[1], 126.9066, places=5)
+        print("    ✅ 좌표 바이너리 복원 확인")
+
+
+# ========================================
+# 16. API 키 동시 검증 테스트
+# ========================================
+
+class KeyValidationTests(TestCase):
+    """카카오/서울시 키 동시 검증 및 검증 결과 TTL 캐시 테스트"""
+
+    def setUp(self):
+        clear_validation_cache()
+
+    def test_validations_run_concurrently(self):
+        print("\n[TEST] 키 검증 동시 실행 테스트 시작")
+
+        async def slow_valid(session, api_key):
+            await asyncio.sleep(0.3)
+            return True, None
+
+        with patch('stores.key_validation.validate_kakao_rest_api_key', slow_valid), \
+                patch('stores.key_validation.validate_seoul_openapi_key', slow_valid):
+            start = time.time()
+            result = asyncio.run(validate_api_keys('kakao_key', 'seoul_key'))
+            elapsed = time.time() - start
+
+        self.assertEqual(result, (True, None))
+        # 순차 실행이면 0.6초 이상
+        self.assertLess(elapsed, 0.5)
+        print(f"    - 소요 시간: {elapsed:.2f}초")
+        print("    ✅ 두 검증이 동시에 실행됨 확인")
+
+    def test_kakao_error_reported_first(self):
+        print("\n[TEST] 검증 실패 메시지 우선순위 테스트 시작")
+
+        async def invalid(message):
+            return False, message
+
+        with patch('stores.key_validation.validate_kakao_rest_api_key', lambda s, k: invalid('kakao')), \
+                patch('stores.key_validation.validate_seoul_openapi_key', lambda s, k: invalid('seoul')):
+            result = asyncio.run(validate_api_keys('kakao_key', 'seoul_key'))
+        self.assertEqual(result, (False, 'kakao'))
+        print("    ✅ 카카오 오류 우선 반환 확인")
+
+    def test_valid_key_cached(self):
+        print("\n[TEST] 검증된 키 캐시 테스트 시작")
+        _remember('kakao', 'cached_key')
+
+        async def check():
+            # 캐시된 키는 네트워크 요청 없이 통과 (session 미사용)
+            return await validate_kakao_rest_api_key(None, 'cached_key')
+
+        self.assertEqual(asyncio.run(check()), (True, None))
+        print("    ✅ TTL 내 재검증 생략 확인")
+
+
+# ========================================
+# 17. 결과 스냅샷 (mmap) 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ResultsSnapshotTests(TestCase):
+    """구별 결과 바이너리 스냅샷 저장/로드 및 bbox/status 슬라이스 테스트"""
+
+    def setUp(self):
+        import tempfile
+        cache.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(RESULTS_SNAPSHOT_DIR=self.tmpdir.name)
+        self.settings_override.enable()
+        for i, status in enumerate(['정상', '폐업', '정상', '폐업']):
+            StoreClosureResult.objects.create(
+                place_id=f"snapshot_{i}",
+                name=f"스냅샷 테스트 {i}",
+                address=f"서울시 영등포구 테스트로 {i}",
+                gu="영등포구",
+                latitude=37.5100 + i * 0.01,
+                longitude=126.9000 + i * 0.01,
+                status=status,
+                match_reason="이름+주소" if i % 2 else "이름"
+            )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.tmpdir.cleanup()
+
+    def test_snapshot_matches_db_rows(self):
+        print("\n[TEST] 스냅샷 행 일치 테스트 시작")
+        db_rows = self.client.get('/api/get-results/?gu=영등포구').json()['stores']
+
+        self.assertEqual(write_snapshot('영등포구'), 4)
+        snapshot = load_snapshot('영등포구')
+        self.assertIsNotNone(snapshot)
+        self.assertIs(load_snapshot('영등포구'), snapshot)  # 포인터가 같으면 재사용
+        self.assertEqual(sorted(snapshot.rows(), key=lambda r: r['name']),
+                         sorted(db_rows, key=lambda r: r['name']))
+        print("    ✅ 스냅샷 복원 결과가 DB 조회와 동일")
+
+    def test_bbox_and_status_filter(self):
+        print("\n[TEST] 스냅샷 bbox/status 필터 테스트 시작")
+        write_snapshot('영등포구')
+
+        # i = 1, 2 영역
+        response = self.client.get('/api/get-results/?gu=영등포구&bbox=126.905,37.515,126.925,37.535')
+        names = sorted(row['name'] for row in response.json()['stores'])
+        self.assertEqual(names, ['스냅샷 테스트 1', '스냅샷 테스트 2'])
+
+        response = self.client.get('/api/get-results/?gu=영등포구&bbox=126.905,37.515,126.925,37.535&status=폐업')
+        self.assertEqual([row['name'] for row in response.json()['stores']], ['스냅샷 테스트 1'])
+
+        response = self.client.get('/api/get-results/?gu=영등포구&bbox=1,2,3')
+        self.assertEqual(response.status_code, 400)
+        print("    ✅ 영역/상태 필터 및 잘못된 bbox 처리 확인")
+
+    def test_new_snapshot_replaces_pointer(self):
+        print("\n[TEST] 스냅샷 교체 테스트 시작")
+        write_snapshot('영등포구')
+        StoreClosureResult.objects.filter(place_id='snapshot_0').delete()
+        write_snapshot('영등포구')
+        write_snapshot('영등포구')
+
+        self.assertEqual(load_snapshot('영등포구').count, 3)
+        root = os.path.join(self.tmpdir.name, os.listdir(self.tmpdir.name)[0])
+        versions = [name for name in os.listdir(root) if name.startswith('v')]
+        self.assertEqual(len(versions), 2)  # 이전 버전 정리
+        print("    ✅ current 포인터 교체 및 오래된 버전 정리 확인")
+
+    def test_missing_snapshot_falls_back_to_db(self):
+        print("\n[TEST] 스냅샷 없음 → DB 조회 테스트 시작")
+        self.assertIsNone(load_snapshot('영등포구'))
+        response = self.client.get('/api/get-results/?gu=영등포구&status=정상')
+        self.assertEqual(len(response.json()['stores']), 2)
+        print("    ✅ DB 필터 조회 확인")
+
+
+# ========================================
+# 18. 사전 압축 응답 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class PrecompressedResponseTests(TestCase):
+    """gzip/brotli 사전 압축본 캐시 및 Accept-Encoding 협상 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        for i in range(50):
+            StoreClosureResult.objects.create(
+                place_id=f"compress_{i}",
+                name=f"압축 테스트 {i}",
+                address=f"서울시 영등포구 테스트로 {i}",
+                gu="영등포구",
+                latitude=37.5171 + i * 0.0001,
+                longitude=126.9066,
+                status="정상",
+                match_reason="이름"
+            )
+
+    def test_negotiate_encoding(self):
+        print("\n[TEST] Accept-Encoding 협상 테스트 시작")
+        available = ['identity', 'gzip', 'br']
+        self.assertEqual(negotiate_encoding('gzip, deflate, br', available), 'br')
+        self.assertEqual(negotiate_encoding('br;q=0, gzip', available), 'gzip')
+        self.assertEqual(negotiate_encoding('gzip', ['identity']), 'identity')
+        self.assertEqual(negotiate_encoding('', available), 'identity')
+        print("    ✅ q값/서버 선호 순서 반영 확인")
+
+    def test_gzip_response_matches_identity(self):
+        print("\n[TEST] gzip 응답 테스트 시작")
+        import gzip
+
+        plain = self.client.get('/api/get-results/?gu=영등포구')
+        compressed = self.client.get('/api/get-results/?gu=영등포구', HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', compressed['Vary'])
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertLess(len(compressed.content), len(plain.content))
+        print(f"    - {len(plain.content)} → {len(compressed.content)} bytes")
+        print("    ✅ 압축본 복원 결과 일치")
+
+    def test_compressed_once_per_version(self):
+        print("\n[TEST] 버전당 1회 압축 테스트 시작")
+        with patch('stores.data_cache.compress_variants', wraps=compress_variants) as mock_compress:
+            for _ in range(3):
+                self.client.get('/api/get-results/?gu=영등포구', HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(mock_compress.call_count, 1)
+
+            bump_data_version('영등포구')
+            self.client.get('/api/get-results/?gu=영등포구', HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(mock_compress.call_count, 2)
+        print("    ✅ 데이터 버전이 바뀔 때만 재압축 확인")
+
+    def test_quadrants_split_from_dev_status(self):
+        print("\n[TEST] 4분면 좌표 분리 테스트 시작")
+        quadrants = [{'name': '다이소 테스트점', 'center': {'lat': 37.5, 'lng': 126.9}, 'quadrants': []}]
+        job = CollectionJob.objects.create(gu='영등포구', metrics={'quadrants': quadrants})
+
+        status = self.client.get(f'/api/dev-status/?job_id={job.id}').json()
+        self.assertNotIn('quadrants', status['metrics'])
+        self.assertEqual(status['metrics']['quadrant_count'], 1)
+
+        data = self.client.get(f'/api/dev-status/quadrants/?job_id={job.id}').json()
+        self.assertEqual(data['quadrants'], quadrants)
+        print("    ✅ dev-status에서 4분면 좌표 분리 확인")
+
+
+# ========================================
+# 19. 정적 지도 번들 내보내기 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class StaticExportTests(TestCase):
+    """run_all --export-static 구별 정적 번들 테스트"""
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(RESULTS_SNAPSHOT_DIR=self.tmpdir.name + '/snapshots')
+        self.settings_override.enable()
+        for i in range(20):
+            StoreClosureResult.objects.create(
+                place_id=f"export_{i}",
+                name=f"정적 번들 테스트 {i}",
+                address=f"서울시 영등포구 테스트로 {i}",
+                gu="영등포구",
+                latitude=37.5171 + i * 0.0001,
+                longitude=126.9066,
+                status="폐업" if i % 5 == 0 else "정상",
+                match_reason="이름"
+            )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.tmpdir.cleanup()
+
+    def test_export_bundle(self):
+        print("\n[TEST] 정적 번들 생성 테스트 시작")
+        output_dir = os.path.join(self.tmpdir.name, 'export')
+        manifest = export_static_bundle('영등포구', output_dir)
+        bundle_dir = os.path.join(output_dir, 'yd')
+
+        self.assertEqual(manifest['store_count'], 20)
+        for page in ('store_closure_map.html', 'map.html', 'manifest.json'):
+            self.assertTrue(os.path.exists(os.path.join(bundle_dir, page)))
+
+        # 결과 데이터 파일은 get_results 컬럼형 응답과 동일
+        with open(os.path.join(bundle_dir, manifest['files']['results']), 'rb') as f:
+            exported = f.read()
+        response = self.client.get('/api/get-results/?gu=영등포구&format=columnar')
+        self.assertEqual(exported, response.content)
+
+        with open(os.path.join(bundle_dir, manifest['files']['closure']), encoding='utf-8') as f:
+            geojson = json.load(f)
+        self.assertEqual(len(geojson['features']), 20)
+
+        # 육각 격자 레이어는 API 없이 페이지에 내장 (웹 페이지는 null → API 조회)
+        with open(os.path.join(bundle_dir, 'store_closure_map.html'), encoding='utf-8') as f:
+            html = f.read()
+        self.assertNotIn("JSON.parse('null')", html)
+        self.assertIn("JSON.parse('null')", self.client.get('/store-closure/').content.decode())
+        print("    ✅ HTML/데이터 파일 생성 및 API 응답 일치 확인")
+
+    def test_stale_data_files_removed(self):
+        print("\n[TEST] 이전 데이터 파일 정리 테스트 시작")
+        output_dir = os.path.join(self.tmpdir.name, 'export')
+        first = export_static_bundle('영등포구', output_dir)
+        StoreClosureResult.objects.filter(place_id='export_0').delete()
+        second = export_static_bundle('영등포구', output_dir)
+
+        self.assertNotEqual(first['files']['results'], second['files']['results'])
+        data_files = os.listdir(os.path.join(output_dir, 'yd', 'data'))
+        self.assertNotIn(os.path.basename(first['files']['results']), data_files)
+        self.assertIn(os.path.basename(second['files']['results']), data_files)
+        print("    ✅ 내용이 바뀌면 새 해시 파일로 교체 확인")
+
+
+# ========================================
+# 20. 매장/인허가 검색 테스트
+# ========================================
+
+@requires_postgis
+class StoreSearchTests(TestCase):
+    """pg_trgm 기반 /api/search/ 테스트"""
+
+    def setUp(self):
+        StoreClosureResult.objects.create(
+            place_id="search_1", name="GS25 Yeouido Center", address="Seoul Yeongdeungpo Yeouido-dong 1",
+            gu="영등포구", latitude=37.5219, longitude=126.9245, location=Point(126.9245, 37.5219),
+            status="폐업", match_reason="이름"
+        )
+        StoreClosureResult.objects.create(
+            place_id="search_2", name="CU Gangnam Station", address="Seoul Gangnam Yeoksam-dong 2",
+            gu="강남구", latitude=37.4979, longitude=127.0276, location=Point(127.0276, 37.4979),
+            status="정상", match_reason="이름"
+        )
+        TobaccoRetailLicense.objects.create(
+            mgtno="search_tobacco_1", bplcnm="GS25 Yeouido Center", gu="영등포구",
+            rdnwhladdr="Seoul Yeongdeungpo Yeouido-dong 1", trdstatenm="폐업",
+            location=Point(126.9245, 37.5219)
+        )
+
+    def test_search_ranked_by_similarity(self):
+        print("\n[TEST] 유사도 검색 테스트 시작")
+        data = self.client.get('/api/search/?q=Yeouido Center').json()
+        self.assertGreaterEqual(data['count'], 2)
+        self.assertEqual({row['source'] for row in data['results'][:2]}, {'closure', 'tobacco'})
+        similarities = [row['similarity'] for row in data['results']]
+        self.assertEqual(similarities, sorted(similarities, reverse=True))
+        print("    ✅ 여러 테이블 결과 유사도 순 병합 확인")
+
+    def test_search_filters(self):
+        print("\n[TEST] 검색 필터 테스트 시작")
+        data = self.client.get('/api/search/?q=Seoul&gu=강남구&source=closure').json()
+        self.assertEqual([row['name'] for row in data['results']], ['CU Gangnam Station'])
+
+        data = self.client.get('/api/search/?q=Seoul&source=closure&bbox=126.9,37.5,126.95,37.55').json()
+        self.assertEqual([row['name'] for row in data['results']], ['GS25 Yeouido Center'])
+        print("    ✅ gu/bbox/source 필터 확인")
+
+    def test_invalid_search(self):
+        print("\n[TEST] 잘못된 검색 요청 테스트 시작")
+        self.assertEqual(self.client.get('/api/search/?q=G').status_code, 400)
+        self.assertEqual(self.client.get('/api/search/?q=GS25&source=unknown').status_code, 400)
+        self.assertEqual(self.client.get('/api/search/?q=GS25&bbox=1,2').status_code, 400)
+        print("    ✅ 짧은 검색어/잘못된 대상/bbox 400 응답 확인")
+
+
+# ========================================
+# 21. 육각 격자 폐업 밀도 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+@requires_postgis
+class HexDensityTests(TestCase):
+    """HexCell 집합 연산 갱신 및 /api/hex-density/ 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        # 여의도 부근 5개 (폐업 2), 문래동 부근 3개 (폐업 0)
+        points = [(126.9245, 37.5219)] * 5 + [(126.8950, 37.5180)] * 3
+        for i, (lng, lat) in enumerate(points):
+            StoreClosureResult.objects.create(
+                place_id=f"hex_{i}", name=f"육각 테스트 {i}", address="서울시 영등포구",
+                gu="영등포구", latitude=lat, longitude=lng, location=Point(lng, lat),
+                status="폐업" if i < 2 else "정상", match_reason="이름"
+            )
+        SeoulRestaurantLicense.objects.create(
+            mgtno="hex_license_1", bplcnm="인허가 테스트", gu="영등포구", uptaenm="편의점",
+            location=Point(126.9245, 37.5219)
+        )
+
+    def test_refresh_hex_cells(self):
+        print("\n[TEST] 육각 격자 집계 테스트 시작")
+        refresh_hex_cells('영등포구')
+
+        for resolution in HEX_RESOLUTIONS:
+            cells = HexCell.objects.filter(gu='영등포구', resolution=resolution)
+            self.assertEqual(sum(cell.closure_total for cell in cells), 8)
+            self.assertEqual(sum(cell.closed_count for cell in cells), 2)
+            self.assertEqual(sum(cell.license_count for cell in cells), 1)
+
+        # 두 지점은 약 2.6km 떨어져 있으므로 1km 격자에서도 다른 셀
+        hottest = HexCell.objects.filter(resolution=500).order_by('-closure_rate').first()
+        self.assertEqual((hottest.closure_total, hottest.closed_count, hottest.closure_rate), (5, 2, 40.0))
+
+        # 재실행 시 중복 없이 교체
+        count = HexCell.objects.count()
+        refresh_hex_cells('영등포구')
+        self.assertEqual(HexCell.objects.count(), count)
+        print("    ✅ 크기별 셀 합계/폐업률 확인")
+
+    def test_boundary_point_counted_once(self):
+        print("\n[TEST] 셀 경계 위 매장 중복 집계 방지 테스트 시작")
+        from django.db import connection
+
+        # 250m 격자 셀 꼭짓점(3개 셀이 만나는 점)에 매장 배치
+        store = StoreClosureResult.objects.create(
+            place_id="hex_vertex", name="꼭짓점 매장", address="서울시 영등포구", gu="영등포구",
+            status="폐업", match_reason="이름"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE store_closure_result SET location = ("
+                "  SELECT ST_Transform(ST_StartPoint(ST_ExteriorRing(hex.geom)), 4326)"
+                "  FROM ST_HexagonGrid(250, ST_Transform(ST_MakeEnvelope(126.92, 37.52, 126.925, 37.525, 4326), 5179)) AS hex"
+                "  ORDER BY hex.i, hex.j LIMIT 1"
+                ") WHERE place_id = %s",
+                [store.place_id],
+            )
+        refresh_hex_cells('영등포구')
+
+        for resolution in HEX_RESOLUTIONS:
+            cells = HexCell.objects.filter(gu='영등포구', resolution=resolution)
+            self.assertEqual(sum(cell.closure_total for cell in cells), 9)
+            self.assertEqual(sum(cell.closed_count for cell in cells), 3)
+        print("    ✅ 매장마다 크기별 셀 1개에만 집계 확인")
+
+    def test_hex_density_api(self):
+        print("\n[TEST] 밀도 API 테스트 시작")
+        refresh_hex_cells('영등포구')
+        bump_data_version('영등포구')
+
+        data = self.client.get('/api/hex-density/?resolution=1000').json()
+        self.assertEqual(data['resolution'], 1000)
+        self.assertEqual(sum(f['properties']['total'] for f in data['features']), 8)
+        ring = data['features'][0]['geometry']['coordinates'][0]
+        self.assertEqual(len(ring), 7)  # 육각형 + 닫는 점
+
+        # 지원하지 않는 크기는 기본값
+        data = self.client.get('/api/hex-density/?resolution=123').json()
+        self.assertEqual(data['resolution'], 500)
+        print("    ✅ GeoJSON 응답 확인")
+
+
+# ========================================
+# 22. 다이소별 상권 밀도 테스트
+# ========================================
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+@requires_postgis
+class DaisoDensityTests(TestCase):
+    """ST_DWithin/KNN 기반 다이소별 반경 카운트 및 최근접 거리 테스트"""
+
+    LNG, LAT = 126.9245, 37.5219
+
+    def setUp(self):
+        cache.clear()
+        YeongdeungpoDaiso.objects.create(
+            name="다이소 밀도A점", address="서울시 영등포구", daiso_id="density_a",
+            gu="영등포구", location=Point(self.LNG, self.LAT)
+        )
+        # 위도 0.02도 ≈ 2.2km
+        YeongdeungpoDaiso.objects.create(
+            name="다이소 밀도B점", address="서울시 영등포구", daiso_id="density_b",
+            gu="영등포구", location=Point(self.LNG, self.LAT + 0.02)
+        )
+        # A점에서 약 111m, 333m, 888m
+        for i, offset in enumerate([0.001, 0.003, 0.008]):
+            YeongdeungpoConvenience.objects.create(
+                place_id=f"density_{i}", base_daiso="다이소 밀도A점", gu="영등포구",
+                name=f"밀도 편의점 {i}", address="서울시 영등포구", distance=0,
+                location=Point(self.LNG, self.LAT + offset)
+            )
+        StoreClosureResult.objects.create(
+            place_id="density_closed", name="밀도 폐업", address="서울시 영등포구", gu="영등포구",
+            latitude=self.LAT + 0.003, longitude=self.LNG, location=Point(self.LNG, self.LAT + 0.003),
+            status="폐업", match_reason="없음"
+        )
+        SeoulRestaurantLicense.objects.create(
+            mgtno="density_license", bplcnm="밀도 인허가", gu="영등포구", uptaenm="편의점",
+            location=Point(self.LNG, self.LAT + 0.001)
+        )
+
+    def test_radius_counts_and_nearest(self):
+        print("\n[TEST] 반경별 카운트/최근접 거리 테스트 시작")
+        daisos = {row['name']: row for row in daiso_density('영등포구')}
+        a = daisos['다이소 밀도A점']
+
+        self.assertEqual(a['convenience'], {**a['convenience'], '250': 1, '500': 2, '1000': 3})
+        self.assertAlmostEqual(a['convenience']['nearest_m'], 111, delta=2)
+        self.assertEqual((a['licensed']['250'], a['closed']['250'], a['closed']['500']), (1, 0, 1))
+        self.assertAlmostEqual(a['nearest_daiso_m'], 2220, delta=10)
+
+        b = daisos['다이소 밀도B점']
+        self.assertEqual(b['convenience']['1000'], 0)
+        self.assertAlmostEqual(b['convenience']['nearest_m'], 1332, delta=10)
+        print("    ✅ ST_DWithin 반경 카운트 및 KNN 최근접 거리 확인")
+
+    def test_radius_prefilter_at_high_latitude(self):
+        print("\n[TEST] 고위도 반경 후보 검색 테스트 시작")
+        # 위도 38.6도: 경도 1도 ≈ 87km → 고정 88km 환산으로는 1000m 반경 끝이 빠짐
+        lng, lat = 128.4677, 38.6
+        YeongdeungpoDaiso.objects.create(
+            name="다이소 고성점", address="강원특별자치도 고성군", daiso_id="density_north",
+            gu="고성군", location=Point(lng, lat)
+        )
+        # 동쪽 약 994m
+        YeongdeungpoConvenience.objects.create(
+            place_id="density_north", base_daiso="다이소 고성점", gu="고성군",
+            name="고위도 편의점", address="강원특별자치도 고성군", distance=0,
+            location=Point(lng + 0.0114, lat)
+        )
+
+        north = daiso_density('고성군')[0]
+        self.assertAlmostEqual(north['convenience']['nearest_m'], 994, delta=5)
+        self.assertEqual(north['convenience']['1000'], 1)
+        print("    ✅ 위도별 도 환산으로 반경 끝 후보 포함 확인")
+
+    def test_density_api_cached(self):
+        print("\n[TEST] 상권 밀도 API 캐시 테스트 시작")
+        with patch('stores.views.daiso_density_json', wraps=daiso_density_json) as builder:
+            first = self.client.get('/api/daiso-density/?gu=영등포구').json()
+            self.client.get('/api/daiso-density/?gu=영등포구')
+            self.assertEqual(builder.call_count, 1)
+        self.assertEqual(len(first['daisos']), 2)
+        print("    ✅ 데이터 버전이 같으면 재계산 없음 확인")
+
+
+# ========================================
+# 23. 최근접 다이소 재할당 테스트
+# ========================================
+
+@requires_postgis
+class NearestDaisoAssignmentTests(TestCase):
+    """KNN 기반 base_daiso/distance 재계산 테스트"""
+
+    LNG, LAT = 126.9245, 37.5219
+
+    def setUp(self):
+        YeongdeungpoDaiso.objects.create(
+            name="다이소 근접A점", address="서울시 영등포구", daiso_id="nearest_a",
+            gu="영등포구", location=Point(self.LNG, self.LAT)
+        )
+        YeongdeungpoDaiso.objects.create(
+            name="다이소 근접B점", address="서울시 영등포구", daiso_id="nearest_b",
+            gu="영등포구", location=Point(self.LNG, self.LAT + 0.01)
+        )
+        # A점에서 약 111m, B점에서 약 999m - 마지막으로 저장한 B점이 남은 상태
+        YeongdeungpoConvenience.objects.create(
+            place_id="nearest_0", base_daiso="다이소 근접B점", gu="영등포구",
+            name="근접 편의점", address="서울시 영등포구", distance=999,
+            location=Point(self.LNG, self.LAT + 0.001)
+        )
+        YeongdeungpoConvenience.objects.create(
+            place_id="nearest_other_gu", base_daiso="다이소 근접B점", gu="마포구",
+            name="다른 구 편의점", address="서울시 마포구", distance=999,
+            location=Point(self.LNG, self.LAT + 0.001)
+        )
+
+    def test_reassigns_to_nearest(self):
+        print("\n[TEST] 최근접 다이소 재할당 테스트 시작")
+        self.assertEqual(assign_nearest_daiso('영등포구'), 1)
+
+        store = YeongdeungpoConvenience.objects.get(place_id="nearest_0")
+        self.assertEqual(store.base_daiso, "다이소 근접A점")
+        self.assertAlmostEqual(store.distance, 111, delta=2)
+        # 다른 구는 변경 없음
+        other = YeongdeungpoConvenience.objects.get(place_id="nearest_other_gu")
+        self.assertEqual(other.base_daiso, "다이소 근접B점")
+        print("    ✅ 실제 최근접 다이소/거리로 교체 확인")
+
+    def test_unchanged_rows_skipped(self):
+        print("\n[TEST] 재할당 멱등성 테스트 시작")
+        assign_nearest_daiso('영등포구')
+        self.assertEqual(assign_nearest_daiso('영등포구'), 0)
+        print("    ✅ 값이 같으면 갱신 없음 확인")
+
+
+# ========================================
+# 24. 조회 쿼리 벤치마크 테스트
+# ========================================
+
+@requires_postgis
+class BenchmarkQueriesTests(TestCase):
+    """gu 인덱스 유무 EXPLAIN ANALYZE 비교 커맨드 테스트"""
+
+    def test_benchmark_rolls_back(self):
+        print("\n[TEST] 쿼리 벤치마크 롤백 테스트 시작")
+        out = StringIO()
+        call_command('benchmark_queries', rows=20, repeat=1, i_know=True, stdout=out)
+
+        output = out.getvalue()
+        for name in ('results_status', 'license_convenience', 'daiso_density'):
+            self.assertIn(name, output)
+        # 합성 데이터 롤백
+        self.assertEqual(StoreClosureResult.objects.count(), 0)
+        self.assertEqual(SeoulRestaurantLicense.objects.count(), 0)
+        # DROP INDEX 롤백 (인덱스 유지)
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM pg_indexes WHERE indexname = 'closure_gu_status_idx'")
+            self.assertEqual(cursor.fetchone()[0], 1)
+        print("    ✅ 합성 데이터/인덱스 변경 롤백 확인")
+
+    def test_benchmark_refuses_without_flag(self):
+        print("\n[TEST] 쿼리 벤치마크 실행 거부 테스트 시작")
+        out = StringIO()
+        with override_settings(DEBUG=False):
+            call_command('benchmark_queries', rows=20, repeat=1, stdout=out)
+
+        self.assertIn('--i-know', out.getvalue())
+        self.assertNotIn('results_status', out.getvalue())
+        print("    ✅ DEBUG=False + --i-know 없음 → 합성 데이터 삽입 없이 종료 확인")
+
+
+# ========================================
+# 25. 구(gu) LIST 파티셔닝 테스트
+# ========================================
+
+@requires_postgis
+class GuPartitioningTests(TestCase):
+    """gu 파티션 TRUNCATE 삭제 및 파티션 pruning 테스트"""
+
+    def setUp(self):
+        for gu, count in (("영등포구", 3), ("마포구", 2), ("해운대구", 1)):
+            for i in range(count):
+                StoreClosureResult.objects.create(
+                    place_id=f"partition_{gu}_{i}", name=f"파티션 {i}", address=f"{gu}", gu=gu,
+                    latitude=37.52, longitude=126.92, location=Point(126.92, 37.52),
+                    status="정상", match_reason="테스트"
+                )
+
+    def test_clear_gu_truncates_partition(self):
+        print("\n[TEST] 구 파티션 삭제 테스트 시작")
+        self.assertTrue(is_partitioned('store_closure_result'))
+        self.assertEqual(clear_gu(StoreClosureResult, "영등포구"), 3)
+        self.assertEqual(StoreClosureResult.objects.filter(gu="영등포구").count(), 0)
+        self.assertEqual(StoreClosureResult.objects.filter(gu="마포구").count(), 2)
+        # 지원하지 않는 구는 DEFAULT 파티션 → DELETE
+        self.assertEqual(clear_gu(StoreClosureResult, "해운대구"), 1)
+        self.assertEqual(StoreClosureResult.objects.count(), 2)
+        print("    ✅ 파티션 TRUNCATE 및 DEFAULT 파티션 DELETE 확인")
+
+    def test_gu_filter_prunes_partitions(self):
+        print("\n[TEST] 파티션 pruning 테스트 시작")
+        plan = StoreClosureResult.objects.filter(gu="영등포구").explain()
+        self.assertIn("store_closure_result_yd", plan)
+        self.assertNotIn("store_closure_result_mp", plan)
+        print("    ✅ gu 조건 조회 시 파티션 1개만 스캔 확인")
+
+    def test_gu_update_moves_row(self):
+        print("\n[TEST] 구 변경 시 파티션 이동 테스트 시작")
+        StoreClosureResult.objects.filter(place_id="partition_마포구_0").update(gu="영등포구")
+        self.assertEqual(StoreClosureResult.objects.filter(gu="영등포구").count(), 4)
+        print("    ✅ upsert로 gu가 바뀌어도 행이 파티션 간 이동")
+
+
+# ========================================
+# 26. 인허가 일자/숫자 타입 컬럼 테스트
+# ========================================
+
+class TypedLicenseFieldTests(TestCase):
+    """OpenAPI 문자열 → DateField/DecimalField/IntegerField 변환 테스트"""
+
+    def test_parsers(self):
+        print("\n[TEST] 인허가 값 파싱 테스트 시작")
+        from datetime import date
+        from decimal import Decimal
+
+        self.assertEqual(parse_date('2015-03-02'), date(2015, 3, 2))
+        self.assertEqual(parse_date('20150302'), date(2015, 3, 2))
+        self.assertIsNone(parse_date(''))
+        self.assertIsNone(parse_date('2015-13-40'))
+        modified = parse_datetime('2021-03-14 02:40:00.0')
+        self.assertEqual((modified.hour, modified.utcoffset().total_seconds()), (2, 9 * 3600))
+        self.assertEqual(parse_decimal(' 1,234.5 '), Decimal('1234.5'))
+        self.assertIsNone(parse_decimal('없음'))
+        self.assertEqual(parse_int('3.0'), 3)
+        print("    ✅ 일자/일시/숫자 파싱 및 오류 값 NULL 처리 확인")
+
+    def test_decimal_precision(self):
+        print("\n[TEST] DecimalField 자릿수 맞춤 테스트 시작")
+        from decimal import Decimal
+
+        values = typed_license_values({'sitearea': '23.456', 'faciltotscp': '12345678901.5', 'x': '197215.8438389'})
+        self.assertEqual(values, {'sitearea': Decimal('23.46'), 'faciltotscp': None, 'x': Decimal('197215.843839')})
+        self.assertIsNone(parse_decimal('9999999999.995', max_digits=12, decimal_places=2))
+        self.assertEqual(parse_decimal('0', max_digits=12, decimal_places=2), Decimal('0.00'))
+
+        # 자릿수를 넘는 값은 NULL로 저장되고 나머지 값은 그대로 저장
+        SeoulRestaurantLicense.objects.create(
+            mgtno="typed_overflow", bplcnm="자릿수 테스트", gu="영등포구",
+            **typed_license_values({'sitearea': '1e15', 'x': '191234.5'}),
+        )
+        store = SeoulRestaurantLicense.objects.get(mgtno="typed_overflow")
+        self.assertEqual((store.sitearea, store.x), (None, Decimal('191234.5')))
+        print("    ✅ 소수 2자리 반올림 + 자릿수 초과 NULL 처리 확인")
+
+    def test_closed_within_days_query(self):
+        print("\n[TEST] 최근 폐업 기간 조회 테스트 시작")
+        from datetime import timedelta
+
+        today = timezone.localdate()
+        for mgtno, closed in (("typed_recent", today - timedelta(days=10)), ("typed_old", today - timedelta(days=400))):
+            SeoulRestaurantLicense.objects.create(
+                mgtno=mgtno, bplcnm="타입 테스트", gu="영등포구",
+                **typed_license_values({'dcbymd': closed.isoformat(), 'sitearea': '23.5', 'totepnum': '2', 'x': '191234.5'}),
+            )
+
+        recent = SeoulRestaurantLicense.objects.filter(dcbymd__gte=today - timedelta(days=90))
+        self.assertEqual(list(recent.values_list('mgtno', flat=True)), ["typed_recent"])
+        store = recent.get()
+        self.assertEqual((float(store.sitearea), store.totepnum), (23.5, 2))
+        print("    ✅ dcbymd 기간 조건 조회 확인")
+
+
+# ========================================
+# 27. 폐업 상태 변경 이력 테스트
+# ========================================
+
+class ClosureHistoryTests(TestCase):
+    """상태/매칭 이유가 바뀐 매장만 이력에 추가되는지 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        for place_id, status in (("history_a", "정상"), ("history_b", "정상")):
+            StoreClosureResult.objects.create(
+                place_id=place_id, name=f"이력 {place_id}", address="서울시 영등포구", gu="영등포구",
+                latitude=37.52, longitude=126.92, location=Point(126.92, 37.52),
+                status=status, match_reason="이름"
+            )
+
+    def test_records_only_changes(self):
+        print("\n[TEST] 상태 변경 감지 테스트 시작")
+        self._assert_records_only_changes()
+        print("    ✅ 변경된 매장만 이력 추가 확인")
+
+    def test_records_only_changes_orm_fallback(self):
+        print("\n[TEST] 상태 변경 감지 (LATERAL 없는 DB) 테스트 시작")
+        with patch.object(connection, 'vendor', 'sqlite'):
+            self._assert_records_only_changes()
+        print("    ✅ 서브쿼리 + bulk_create 경로도 같은 이력 기록")
+
+    def _assert_records_only_changes(self):
+        from datetime import timedelta
+
+        first = timezone.now() - timedelta(days=10)
+        self.assertEqual(record_closure_history("영등포구", changed_at=first), 2)
+        # 변경 없음 → 추가 없음
+        self.assertEqual(record_closure_history("영등포구"), 0)
+
+        StoreClosureResult.objects.filter(place_id="history_a").update(status="폐업", match_flags=0)
+        self.assertEqual(record_closure_history("영등포구"), 1)
+
+        latest = StoreClosureHistory.objects.filter(place_id="history_a").latest('changed_at')
+        self.assertEqual((latest.previous_status, latest.status), ("정상", "폐업"))
+        self.assertEqual(StoreClosureHistory.objects.count(), 3)
+
+    def test_newly_closed_report(self):
+        print("\n[TEST] 신규 폐업 리포트 테스트 시작")
+        from datetime import timedelta
+
+        record_closure_history("영등포구", changed_at=timezone.now() - timedelta(days=30))
+        StoreClosureResult.objects.filter(place_id="history_b").update(status="폐업")
+        record_closure_history("영등포구")
+
+        since = timezone.now() - timedelta(days=7)
+        closed = newly_changed("영등포구", since)
+        self.assertEqual([row['place_id'] for row in closed], ["history_b"])
+        self.assertEqual(closed[0]['name'], "이력 history_b")
+        # 최초 관측(30일 전)은 추이에서 제외
+        self.assertEqual([day.get('폐업') for day in status_trend("영등포구", since)], [1])
+
+        data = self.client.get('/api/closure-history/?gu=영등포구&days=7').json()
+        self.assertEqual(len(data['newly_closed']), 1)
+        print("    ✅ 기간 내 신규 폐업 조회 및 API 확인")
+
+
+# ========================================
+# 28. 매칭 근거 비트마스크 테스트
+# ========================================
+
+class MatchFlagsTests(TestCase):
+    """match_flags 비트 조합과 match_reason 표시 문자열 변환 테스트"""
+
+    def test_label_round_trip(self):
+        print("\n[TEST] 매칭 근거 비트 변환 테스트 시작")
+        name, address, coord = (
+            StoreClosureResult.MATCH_NAME, StoreClosureResult.MATCH_ADDRESS, StoreClosureResult.MATCH_COORD
+        )
+        self.assertEqual(StoreClosureResult.reason_flags('이름, 주소, 좌표'), name | address | coord)
+        self.assertEqual(StoreClosureResult.reason_flags('이름+주소'), name | address)
+        self.assertEqual(StoreClosureResult.reason_label(name | coord), '이름, 좌표')
+        self.assertEqual(StoreClosureResult.reason_label(0), '없음')
+        self.assertEqual(StoreClosureResult.flags_with(address), [2, 3, 6, 7])
+        print("    ✅ 문자열 ↔ 비트 조합 변환 확인")
+
+    def test_property_sets_flags(self):
+        print("\n[TEST] match_reason 속성 저장 테스트 시작")
+        store = StoreClosureResult.objects.create(
+            place_id="flags_0", name="비트 테스트", address="서울시 영등포구", gu="영등포구",
+            status="정상", match_reason="주소, 좌표"
+        )
+        store.refresh_from_db()
+        self.assertEqual(store.match_flags, StoreClosureResult.MATCH_ADDRESS | StoreClosureResult.MATCH_COORD)
+        self.assertEqual(store.match_reason, '주소, 좌표')
+        self.assertEqual(
+            StoreClosureResult.objects.filter(
+                match_flags__in=StoreClosureResult.flags_with(StoreClosureResult.MATCH_COORD)
+            ).count(),
+            1
+        )
+        print("    ✅ 표시 문자열로 생성해도 정수 비트로 저장/조회 확인")
+
+
+# ========================================
+# 29. --clear 스테이징 재수집 (원자적 교체) 테스트
+# ========================================
+
+@requires_postgis
+class StagedReloadTests(TestCase):
+    """스테이징 테이블에 기록 후 구 데이터를 한 번에 교체하는지 테스트"""
+
+    def setUp(self):
+        for gu, count in (("영등포구", 3), ("마포구", 2)):
+            for i in range(count):
+                StoreClosureResult.objects.create(
+                    place_id=f"staged_{gu}_{i}", name=f"기존 {i}", address=gu, gu=gu,
+                    status="정상", match_flags=0
+                )
+
+    def _stage(self, model, place_ids):
+        for place_id in place_ids:
+            model.objects.update_or_create(
+                place_id=place_id,
+                defaults={'name': "신규", 'address': "영등포구", 'gu': "영등포구", 'status': "폐업"},
+            )
+
+    def test_readers_keep_old_rows_until_commit(self):
+        print("\n[TEST] 스테이징 파티션 교체 테스트 시작")
+        reload = StagedReload(StoreClosureResult, "영등포구")
+        staging = reload.begin()
+        self._stage(staging, ["staged_new_0", "staged_new_1"])
+
+        # 수집 중에는 라이브 테이블이 그대로
+        self.assertEqual(StoreClosureResult.objects.filter(gu="영등포구").count(), 3)
+
+        self.assertEqual(reload.commit(), 2)
+        live = StoreClosureResult.objects.filter(gu="영등포구")
+        self.assertEqual(sorted(live.values_list('place_id', flat=True)), ["staged_new_0", "staged_new_1"])
+        self.assertEqual(StoreClosureResult.objects.filter(gu="마포구").count(), 2)
+        # 교체된 테이블이 다시 구 파티션으로 연결됨
+        self.assertIn("store_closure_result_yd", live.explain())
+        print("    ✅ 커밋 전 기존 데이터 유지, 커밋 후 파티션 교체 확인")
+
+    def test_moved_store_not_duplicated(self):
+        print("\n[TEST] 구 이동 매장 중복 방지 테스트 시작")
+        with StagedReload(StoreClosureResult, "영등포구") as staging:
+            self._stage(staging, ["staged_마포구_0"])
+        self.assertEqual(StoreClosureResult.objects.filter(place_id="staged_마포구_0").get().gu, "영등포구")
+        self.assertEqual(StoreClosureResult.objects.filter(gu="마포구").count(), 1)
+        print("    ✅ 다른 구에 남은 같은 place_id 정리 확인")
+
+    def test_moved_store_kept_while_other_gu_reloading(self):
+        print("\n[TEST] 인접 구 동시 재수집 보호 테스트 시작")
+        # 마포구도 재수집 중 (스테이징 테이블 존재)
+        mapo = StagedReload(StoreClosureResult, "마포구")
+        mapo_staging = mapo.begin()
+        mapo_staging.objects.update_or_create(
+            place_id="staged_마포구_1", gu="마포구",
+            defaults={'name': "신규", 'address': "마포구", 'status': "정상"},
+        )
+
+        # 영등포구 교체는 수집 중인 마포구 라이브 행을 지우지 않음
+        with StagedReload(StoreClosureResult, "영등포구") as staging:
+            self._stage(staging, ["staged_마포구_0"])
+        self.assertEqual(StoreClosureResult.objects.filter(gu="마포구").count(), 2)
+        self.assertEqual(StoreClosureResult.objects.filter(place_id="staged_마포구_0").count(), 2)
+
+        # 마포구 교체가 끝나면 최신 수집 결과 기준으로 정리됨
+        mapo.commit()
+        self.assertEqual(
+            list(StoreClosureResult.objects.filter(place_id="staged_마포구_0").values_list('gu', flat=True)),
+            ["영등포구"],
+        )
+        self.assertEqual(
+            list(StoreClosureResult.objects.filter(gu="마포구").values_list('place_id', flat=True)),
+            ["staged_마포구_1"],
+        )
+        print("    ✅ 재수집 중인 구는 건너뛰고 그 구 교체 시 정리 확인")
+
+    def test_failed_reload_keeps_live_data(self):
+        print("\n[TEST] 실패/0건 재수집 폐기 테스트 시작")
+        with self.assertRaises(RuntimeError):
+            with StagedReload(StoreClosureResult, "영등포구") as staging:
+                self._stage(staging, ["staged_new_0"])
+                raise RuntimeError("수집 실패")
+        reload = StagedReload(StoreClosureResult, "영등포구")
+        reload.begin()
+        self.assertIsNone(reload.finish(False))
+        self.assertEqual(StoreClosureResult.objects.filter(gu="영등포구").count(), 3)
+
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('store_closure_result_yd_staging')")
+            self.assertIsNone(cursor.fetchone()[0])
+        print("    ✅ 예외/0건이면 스테이징만 삭제하고 기존 데이터 유지")
+
+    def test_unpartitioned_table_swap(self):
+        print("\n[TEST] 일반 테이블(다이소) 교체 테스트 시작")
+        YeongdeungpoDaiso.objects.create(
+            daiso_id="staged_old", name="다이소 기존점", address="영등포구", location=Point(126.9, 37.5), gu="영등포구"
+        )
+        other = YeongdeungpoDaiso.objects.create(
+            daiso_id="staged_other", name="다이소 마포점", address="마포구", location=Point(126.9, 37.55), gu="마포구"
+        )
+        with StagedReload(YeongdeungpoDaiso, "영등포구") as staging:
+            # 수집기와 같은 경로 (id는 IDENTITY 컬럼 → 스테이징에도 라이브 시퀀스 기본값 필요)
+            staging.objects.select_for_update().update_or_create(
+                daiso_id="staged_new",
+                defaults={'name': "다이소 신규점", 'address': "영등포구", 'location': Point(126.9, 37.5), 'gu': "영등포구"},
+            )
+        self.assertEqual(
+            list(YeongdeungpoDaiso.objects.filter(gu="영등포구").values_list('daiso_id', flat=True)), ["staged_new"]
+        )
+        # 교체된 행 id가 다른 구 id와 겹치지 않고, 이후 라이브 INSERT도 충돌하지 않음
+        self.assertNotEqual(YeongdeungpoDaiso.objects.get(daiso_id="staged_new").pk, other.pk)
+        YeongdeungpoDaiso.objects.create(
+            daiso_id="staged_after", name="다이소 추가점", address="영등포구", location=Point(126.9, 37.5), gu="영등포구"
+        )
+        self.assertEqual(YeongdeungpoDaiso.objects.count(), 3)
+        print("    ✅ DELETE + INSERT 한 트랜잭션 교체 확인 (id 시퀀스 공유)")
+
+
+# ========================================
+# 30. 구 경계 폴리곤 좌표 판별 테스트
+# ========================================
+
+class GuBoundaryTests(TestCase):
+    """GuBoundary 적재, numpy 배치 판별, SQL ST_Contains 판별 테스트"""
+
+    # 여의도(영등포구), 명동(중구), 서울 밖(경기 남부)
+    POINTS = [(126.924, 37.525), (126.985, 37.5605), (126.9, 37.2)]
+
+    def test_batch_classify_matches_prepared_geometry(self):
+        print("\n[TEST] 좌표 배치 구 판별 테스트 시작")
+        from django.contrib.gis.geos import Polygon
+        from stores.gu_boundary_data import SEOUL_GU_BOUNDARIES
+
+        classifier = GuClassifier.from_static()
+        lngs, lats = zip(*self.POINTS)
+        self.assertEqual(classifier.classify(lngs, lats), ["영등포구", "중구", None])
+        # 좌표가 없거나 숫자가 아니면 None (주소 판별로 대체)
+        self.assertEqual(
+            classifier.classify_items([{'x': '126.924', 'y': '37.525'}, {'x': '', 'y': None}]), ["영등포구", None]
+        )
+
+        # 경계선 허용 거리 0이면 GEOS prepared geometry 판별과 일치
+        import numpy as np
+        rng = np.random.default_rng(0)
+        lngs, lats = rng.uniform(126.76, 127.19, 500), rng.uniform(37.42, 37.71, 500)
+        prepared = {gu: Polygon(info['boundary']).prepared for gu, info in SEOUL_GU_BOUNDARIES.items()}
+        exact = GuClassifier.from_static(tolerance=0).classify(lngs, lats)
+        for lng, lat, gu in zip(lngs, lats, exact):
+            expected = [name for name, polygon in prepared.items() if polygon.contains(Point(lng, lat))]
+            self.assertEqual(gu, expected[0] if expected else None)
+        # 기본 판별기는 같은 결과이거나 경계선 근처라 None
+        self.assertTrue(all(gu == exact_gu or gu is None for gu, exact_gu in zip(classifier.classify(lngs, lats), exact)))
+        print("    ✅ numpy 광선 교차 판별 = GEOS prepared contains")
+
+    def test_daiso_collector_uses_coordinates(self):
+        print("\n[TEST] 다이소 수집 좌표 기준 구 판별 테스트 시작")
+        from stores.management.commands import v2_3_1_collect_yeongdeungpo_daiso as daiso_command
+
+        stores = [
+            {'strCd': 'gu_d1', 'strNm': '여의도점', 'strAddr': '서울 영등포구 여의대로 1', 'strLttd': 37.525, 'strLitd': 126.924},
+            # 주소에는 검색 구가 있지만 좌표는 마포구 → 좌표 우선으로 제외
+            {'strCd': 'gu_d2', 'strNm': '영등포로점', 'strAddr': '서울 영등포구 영등포로 2', 'strLttd': 37.5663, 'strLitd': 126.9086},
+            # 서울 밖 (경계 판별 불가) → 주소의 시도/구 이름으로 제외
+            {'strCd': 'gu_d3', 'strNm': '해운대점', 'strAddr': '부산 해운대구 해운대로 3', 'strLttd': 35.16, 'strLitd': 129.16},
+        ]
+        with patch.object(daiso_command.Command, 'fetch_from_daiso_api', return_value=stores), \
+                patch.object(daiso_command.time, 'sleep'), override_settings(KAKAO_API_KEY=None), \
+                patch.dict(os.environ, {'KAKAO_API_KEY': ''}):
+            call_command('v2_3_1_collect_yeongdeungpo_daiso', gu="영등포구", stdout=StringIO())
+
+        self.assertEqual(list(YeongdeungpoDaiso.objects.values_list('daiso_id', 'gu')), [("gu_d1", "영등포구")])
+        print("    ✅ 좌표 기준 구 판별, 판별 불가 시 주소 대체 확인")
+
+    def test_near_boundary_falls_back_to_address(self):
+        print("\n[TEST] 경계선 근처 주소 판별 대체 테스트 시작")
+        from stores.management.commands import v2_3_1_collect_yeongdeungpo_daiso as daiso_command
+
+        # 근사 폴리곤으로는 마포구 쪽이지만 영등포구 경계선에서 약 50m
+        lng, lat = 126.9318, 37.5342
+        self.assertEqual(GuClassifier.from_static(tolerance=0).gu_of(lng, lat), "마포구")
+        self.assertIsNone(GuClassifier.from_static().gu_of(lng, lat))
+
+        stores = [
+            {'strCd': 'gu_near', 'strNm': '여의나루점', 'strAddr': '서울 영등포구 여의동로 1', 'strLttd': lat, 'strLitd': lng},
+        ]
+        with patch.object(daiso_command.Command, 'fetch_from_daiso_api', return_value=stores), \
+                patch.object(daiso_command.time, 'sleep'), override_settings(KAKAO_API_KEY=None), \
+                patch.dict(os.environ, {'KAKAO_API_KEY': ''}):
+            call_command('v2_3_1_collect_yeongdeungpo_daiso', gu="영등포구", stdout=StringIO())
+
+        self.assertEqual(list(YeongdeungpoDaiso.objects.values_list('daiso_id', 'gu')), [("gu_near", "영등포구")])
+        print("    ✅ 경계선 허용 거리 이내는 주소의 구로 판별 확인")
+
+    def test_boundaries_loaded_and_sql_contains(self):
+        print("\n[TEST] 구 경계 적재 및 ST_Contains 테스트 시작")
+        self.assertEqual(load_gu_boundaries(), 25)
+        self.assertEqual(GuBoundary.objects.count(), 25)
+        self.assertEqual(GuClassifier.from_db().gu_of(126.924, 37.525), "영등포구")
+
+        for i, (lng, lat) in enumerate(self.POINTS):
+            YeongdeungpoConvenience.objects.create(
+                place_id=f"boundary_{i}", name=f"경계 {i}", address="서울시", gu="영등포구",
+                base_daiso="테스트", distance=0, location=Point(lng, lat)
+            )
+        rows = dict(
+            annotate_boundary_gu(YeongdeungpoConvenience.objects.all()).values_list('place_id', 'boundary_gu')
+        )
+        self.assertEqual(rows, {"boundary_0": "영등포구", "boundary_1": "중구", "boundary_2": None})
+        print("    ✅ DB 행 좌표 → 구 (ST_Contains 서브쿼리) 확인")
+
+
+# ========================================
+# 31. 지역 레지스트리 / 샤드 스케줄러 테스트
+# ========================================
+
+class RegionRegistryTests(TestCase):
+    """Region 테이블 기반 지역 조회와 과거 실행 시간 기반 LPT 샤드 배정 테스트"""
+
+    def setUp(self):
+        clear_region_cache()
+
+    def tearDown(self):
+        clear_region_cache()
+
+    def test_registry_reads_region_table(self):
+        print("\n[TEST] 지역 레지스트리 조회 테스트 시작")
+        from stores.management.commands.gu_codes import get_gu_info, get_restaurant_service, list_supported_gu
+
+        self.assertEqual(len(get_registry()), 25)
+        self.assertEqual(get_gu_info("중구")['daiso_keyword'], "중구")
+        self.assertEqual(get_gu_info("영등포구")['daiso_keyword'], "영등포")
+
+        Region.objects.create(
+            key="부산 중구", sido="부산광역시", sigungu="중구", code="BSJG",
+            restaurant_service="LOCALDATA_072405_BSJG", tobacco_service="LOCALDATA_114302_BSJG",
+        )
+        Region.objects.filter(key="강남구").update(enabled=False)
+        clear_region_cache()
+        self.assertIn("부산 중구", list_supported_gu())
+        self.assertNotIn("강남구", list_supported_gu())
+        self.assertEqual(get_restaurant_service("부산 중구"), "LOCALDATA_072405_BSJG")
+        print("    ✅ Python dict 수정 없이 지역 추가/제외 확인")
+
+    def test_lpt_plan_balances_cost(self):
+        print("\n[TEST] LPT 샤드 배정 테스트 시작")
+        plan = plan_shards({"a": 10, "b": 9, "c": 8, "d": 7, "e": 1}, 2)
+        self.assertEqual([entry['regions'] for entry in plan], [["a", "d", "e"], ["b", "c"]])
+        self.assertEqual([entry['load'] for entry in plan], [18, 17])
+        print("    ✅ 비용 큰 지역부터 부하가 작은 샤드에 배정")
+
+    def test_run_cost_moving_average(self):
+        print("\n[TEST] 지역 실행 시간 이력 테스트 시작")
+        record_run_cost("영등포구", 100)
+        record_run_cost("영등포구", 200)
+        region = Region.objects.get(key="영등포구")
+        self.assertEqual(region.run_count, 2)
+        self.assertAlmostEqual(region.cost_seconds, 130)
+        print("    ✅ 첫 실행은 그대로, 이후 지수 이동 평균")
+
+    def test_sharded_enqueue_and_claim(self):
+        print("\n[TEST] 샤드 등록/작업 가져가기 테스트 시작")
+        for key, cost in (("영등포구", 300), ("강남구", 200), ("마포구", 100)):
+            Region.objects.filter(key=key).update(cost_seconds=cost, run_count=1)
+
+        jobs, plan = enqueue_regions(["영등포구", "강남구", "마포구"], shards=2)
+        self.assertEqual([job.gu for job in jobs], ["영등포구", "강남구", "마포구"])
+        self.assertEqual({job.gu: job.shard for job in jobs}, {"영등포구": 0, "강남구": 1, "마포구": 1})
+
+        # 샤드 1 워커는 자기 샤드 작업(비용 큰 순)부터, 비면 다른 샤드 작업을 가져감
+        claimed = [claim_next_job("worker-1", shard=1).gu for _ in range(3)]
+        self.assertEqual(claimed, ["강남구", "마포구", "영등포구"])
+        self.assertIsNone(claim_next_job("worker-1", shard=1))
+        print("    ✅ 자기 샤드 우선 + work stealing 확인")
+
+    def test_import_regions_command(self):
+        print("\n[TEST] 지역 CSV 적재 커맨드 테스트 시작")
+        import tempfile
+
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("sido,sigungu,code,restaurant_service,tobacco_service,boundary\n")
+            f.write('부산광역시,해운대구,BSHU,LOCALDATA_072405_BSHU,LOCALDATA_114302_BSHU,'
+                    '"POLYGON((129.1 35.15, 129.2 35.15, 129.2 35.2, 129.1 35.2, 129.1 35.15))"\n')
+        try:
+            call_command('import_regions', f.name, stdout=StringIO())
+        finally:
+            os.unlink(f.name)
+
+        region = Region.objects.get(key="부산 해운대구")
+        self.assertEqual((region.sido, region.daiso_keyword), ("부산광역시", "해운대"))
+        self.assertTrue(GuBoundary.objects.filter(gu="부산 해운대구", boundary__contains=Point(129.15, 35.17)).exists())
+        self.assertIn("부산 해운대구", get_registry())
+        print("    ✅ CSV → Region/GuBoundary 적재 확인")
+
+    def test_import_regions_keeps_all_polygons(self):
+        print("\n[TEST] MultiPolygon 경계 전체 보관 테스트 시작")
+        import tempfile
+        from stores.gu_boundaries import GuClassifier
+
+        # 본토 + 섬 (섬이 더 작아도 버려지면 안 됨)
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("sido,sigungu,code,restaurant_service,tobacco_service,boundary\n")
+            f.write('인천광역시,옹진군,ICOJ,LOCALDATA_072405_ICOJ,LOCALDATA_114302_ICOJ,'
+                    '"MULTIPOLYGON(((126.0 37.0, 126.2 37.0, 126.2 37.2, 126.0 37.2, 126.0 37.0)),'
+                    '((125.6 37.6, 125.65 37.6, 125.65 37.65, 125.6 37.65, 125.6 37.6)))"\n')
+        try:
+            call_command('import_regions', f.name, stdout=StringIO())
+        finally:
+            os.unlink(f.name)
+
+        key = Region.objects.get(sigungu="옹진군").key
+        for point in (Point(126.1, 37.1), Point(125.62, 37.62)):
+            self.assertTrue(GuBoundary.objects.filter(gu=key, boundary__contains=point).exists())
+
+        classifier = GuClassifier.from_db()
+        self.assertEqual(classifier.classify([126.1, 125.62, 125.8], [37.1, 37.62, 37.4]), [key, key, None])
+        print("    ✅ 섬 폴리곤까지 ST_Contains/배치 판별 확인")
+
+
+# ========================================
+# 32. SpatiaLite 로컬 프로필 테스트
+# ========================================
+
+class SpatiaLiteProfileTests(TestCase):
+    """SpatiaLite 백엔드 스키마/PostGIS 전용 경로 대체 테스트"""
+
+    def setUp(self):
+        StoreClosureResult.objects.create(
+            place_id="profile_1", name="GS25 여의도센터", address="서울 영등포구 여의도동 1", gu="영등포구",
+            latitude=37.5219, longitude=126.9245, location=Point(126.9245, 37.5219),
+            status="폐업", match_flags=0
+        )
+        StoreClosureResult.objects.create(
+            place_id="profile_2", name="CU 당산역", address="서울 영등포구 GS25 옆", gu="영등포구",
+            latitude=37.5340, longitude=126.9020, location=Point(126.9020, 37.5340),
+            status="정상", match_flags=0
+        )
+
+    def test_schema_editor_skips_gin_indexes(self):
+        print("\n[TEST] SpatiaLite 스키마 GinIndex 생략 테스트 시작")
+        from config.spatialite_backend.base import DatabaseWrapper
+
+        # 연결 없이 SQL만 생성 (mod_spatialite 불필요)
+        wrapper = DatabaseWrapper({
+            'ENGINE': 'config.spatialite_backend', 'NAME': ':memory:', 'OPTIONS': {}, 'TIME_ZONE': None,
+        })
+        editor = wrapper.SchemaEditorClass(wrapper, collect_sql=True)
+        statements = [str(sql) for sql in editor._model_indexes_sql(YeongdeungpoConvenience)]
+        self.assertTrue(any('conv_gu_idx' in sql for sql in statements))
+        self.assertFalse(any('gin' in sql.lower() for sql in statements))
+
+        trigram = next(index for index in YeongdeungpoConvenience._meta.indexes if index.name == 'conv_name_trgm_idx')
+        editor.add_index(YeongdeungpoConvenience, trigram)
+        self.assertEqual(editor.collected_sql, [])
+        print("    ✅ pg_trgm GinIndex 제외, 일반 인덱스 유지 확인")
+
+    def test_postgis_only_steps_skipped(self):
+        print("\n[TEST] PostGIS 전용 후처리 건너뜀 테스트 시작")
+        HexCell.objects.create(
+            gu="영등포구", resolution=500, i=0, j=0, geom=Polygon.from_bbox((126.9, 37.5, 126.91, 37.51)),
+            closure_total=1, normal_count=0, closed_count=1, license_count=0
+        )
+        with patch.object(connection, 'vendor', 'sqlite'):
+            self.assertEqual(refresh_hex_cells("영등포구"), 0)
+            self.assertEqual(assign_nearest_daiso("영등포구"), 0)
+            self.assertEqual(daiso_density("영등포구"), [])
+        # 이전 격자는 남기지 않음
+        self.assertFalse(HexCell.objects.filter(gu="영등포구").exists())
+        print("    ✅ 육각 격자/최근접 다이소/밀도 0건 처리 확인")
+
+    def test_search_falls_back_to_substring(self):
+        print("\n[TEST] pg_trgm 없는 검색 대체 테스트 시작")
+        with patch.object(connection, 'vendor', 'sqlite'):
+            data = self.client.get('/api/search/?q=GS25&source=closure').json()
+        # 이름 일치(1.0)가 주소만 일치(0.5)보다 먼저
+        self.assertEqual([row['name'] for row in data['results']], ["GS25 여의도센터", "CU 당산역"])
+        self.assertEqual([row['similarity'] for row in data['results']], [1.0, 0.5])
+        print("    ✅ 부분 일치 + 이름 우선 정렬 확인")
+
+    def test_settings_profile_uses_temp_dir(self):
+        print("\n[TEST] SpatiaLite 설정 프로필 테스트 시작")
+        import importlib
+
+        with patch.dict(os.environ, {'SPATIALITE_WORK_DIR': ''}):
+            profile = importlib.import_module('config.settings_spatialite')
+        database = profile.DATABASES['default']
+        self.assertEqual(database['ENGINE'], 'config.spatialite_backend')
+        self.assertTrue(database['NAME'].startswith(profile.WORK_DIR))
+        self.assertTrue(profile.RESULTS_SNAPSHOT_DIR.startswith(profile.WORK_DIR))
+        self.assertFalse(profile.COLLECTION_EMBEDDED_WORKER)
+        print("    ✅ 프로세스별 임시 디렉터리 DB/캐시/스냅샷 확인")
+
+
+# ========================================
+# 33. 인허가 TM 좌표 배치 변환 테스트
+# ========================================
+
+class TmCoordinateBatchTests(TestCase):
+    """TM(EPSG:5174) → WGS84 배치 변환 및 EWKB 위치 테스트"""
+
+    def test_invalid_values_masked(self):
+        print("\n[TEST] 좌표 파싱 마스크 테스트 시작")
+        import numpy as np
+
+        parsed = parse_coordinates([' 197215.84 ', '', None, 'abc', '1.2.3', '-5'])
+        self.assertEqual(parsed[0], 197215.84)
+        self.assertEqual(parsed[5], -5.0)
+        self.assertTrue(np.isnan(parsed[1:5]).all())
+        print("    ✅ 공백 제거, 빈 값/형식 오류는 NaN")
+
+    def test_signed_and_exponent_values(self):
+        print("\n[TEST] 부호/지수 표기 좌표 파싱 테스트 시작")
+        import numpy as np
+
+        parsed = parse_coordinates(['+197215.84', '1.9721584E+05', '4.47e5', '--5', '+-5', 'inf', 'nan', '1e'])
+        self.assertEqual(parsed[:3].tolist(), [197215.84, 197215.84, 447000.0])
+        self.assertTrue(np.isnan(parsed[3:]).all())
+
+        rows = [{'X': '1.97215843838E+05', 'Y': '+447234.12'}, {'X': '197215.843838', 'Y': '447234.12'}]
+        first, second = tm_rows_to_wgs84(rows)
+        self.assertAlmostEqual(first[0], second[0], places=9)
+        self.assertAlmostEqual(first[1], second[1], places=9)
+        print("    ✅ '+' 부호/지수 표기 변환, 무한대/형식 오류는 NaN")
+
+    def test_batch_matches_scalar_transform(self):
+        print("\n[TEST] 배치 변환 = 행별 pyproj 변환 테스트 시작")
+        from pyproj import Transformer
+
+        transformer = Transformer.from_crs("EPSG:5174", "EPSG:4326", always_xy=True)
+        rows = [
+            {'X': '197215.843838', 'Y': '447234.12'},
+            {'X': '', 'Y': '447234.12'},
+            {'X': '191000.5', 'Y': None},
+            {'X': '191000.5', 'Y': '443500.25'},
+        ]
+        results = tm_rows_to_wgs84(rows)
+        self.assertEqual(results[1], (None, None, None))
+        self.assertEqual(results[2], (None, None, None))
+
+        for row, (latitude, longitude, location) in zip([rows[0], rows[3]], [results[0], results[3]]):
+            lon, lat = transformer.transform(float(row['X']), float(row['Y']))
+            self.assertAlmostEqual(latitude, lat, places=9)
+            self.assertAlmostEqual(longitude, lon, places=9)
+            # EWKB → SRID 포함 Point로 저장
+            store = TobaccoRetailLicense.objects.create(
+                mgtno=f"tm_{row['X']}", bplcnm="좌표 테스트", gu="영등포구", location=location
+            )
+            store.refresh_from_db()
+            self.assertEqual(store.location.srid, 4326)
+            self.assertAlmostEqual(store.location.x, lon, places=9)
+            self.assertAlmostEqual(store.location.y, lat, places=9)
+        print("    ✅ 위경도/위치가 행별 변환 결과와 일치")
+
+    def test_batch_performance(self):
+        print("\n[TEST] 좌표 배치 변환 성능 테스트 시작")
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        rows = [
+            {'X': f'{x:.6f}', 'Y': f'{y:.6f}'}
+            for x, y in zip(rng.uniform(180000, 215000, 20000), rng.uniform(435000, 465000, 20000))
+        ]
+        start = time.perf_counter()
+        results = tm_rows_to_wgs84(rows)
+        elapsed = time.perf_counter() - start
+        self.assertTrue(all(location is not None for _, _, location in results))
+        self.assertLess(elapsed, 1.0)
+        print(f"    ✅ 20,000건 변환 {elapsed * 1000:.1f}ms")
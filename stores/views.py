@@ -1,9 +1,45 @@
 from django.shortcuts import render
+from django.template.loader import render_to_string
 from django.conf import settings
+from django.views.decorators.http import condition
+from django.utils import timezone
 from .models import NearbyStore
+from .data_cache import (
+    ALL_GU,
+    get_cached_payload,
+    get_cached_variants,
+    get_file_payload,
+    get_last_updated_gu,
+    version_etag,
+    version_last_modified,
+)
+from .events import event_bus, format_sse
+from .system_metrics import system_sampler
+from .key_validation import validate_api_keys
+from .snapshot import load_snapshot
+from .search import DEFAULT_LIMIT as DEFAULT_SEARCH_LIMIT, search_stores
+from .history import closure_history_json
+from .analytics import DEFAULT_HEX_RESOLUTION, HEX_RESOLUTIONS, daiso_density_json, hex_cells_geojson
+from .compression import compress_variants, compressed_response
+from .columnar import (
+    FORMAT_COLUMNAR,
+    FORMAT_ROWS,
+    dumps_stores,
+    encode_stores,
+    payload_format,
+)
+import hashlib
 import json
 
-def map_view(request):
+
+# 컬럼형 응답에서 사전 인코딩할 필드 (값 종류가 적음)
+STORE_DICT_FIELDS = ('status', 'match_reason')
+
+HTML_CONTENT_TYPE = 'text/html; charset=utf-8'
+
+
+def _build_map_stores_json(fmt):
+    """map_view용 JSON 페이로드 생성 (DB 조회 + 직렬화)"""
     # 1. DB에서 데이터 가져오기 (N+1 방지: values() 사용)
     stores = NearbyStore.objects.values('name', 'category', 'location')
 
@@ -18,15 +54,34 @@ def map_view(request):
                 'category': store['category'],
             })
 
-    # 3. 데이터 포장
-    context = {
-        # 자바스크립트로 보낼 데이터 (한글 깨짐 방지 처리)
-        'stores_json': json.dumps(stores_list, ensure_ascii=False),
-        # API 키를 settings.py에서 가져오거나, 여기에 직접 문자열로 넣어도 됨
-        'kakao_js_key': settings.KAKAO_JS_KEY, 
-    }
-    
-    return render(request, 'map.html', context)
+    # 자바스크립트로 보낼 데이터 (한글 깨짐 방지 처리)
+    return dumps_stores(stores_list, fmt, dict_fields=('category',))
+
+
+def _map_format(request):
+    """지도 템플릿 내장 데이터 형식 (템플릿이 디코더를 포함하므로 기본 컬럼형, ?format=rows로 기존 형식)"""
+    return payload_format(request, default=FORMAT_COLUMNAR)
+
+
+@condition(
+    etag_func=lambda request: version_etag(f'map-{_map_format(request)}', ALL_GU),
+    last_modified_func=lambda request: version_last_modified(ALL_GU),
+)
+def map_view(request):
+    # 데이터 버전 기준 캐시 (버전이 같으면 DB 조회/렌더링/압축 없음)
+    fmt = _map_format(request)
+
+    def build_page():
+        # 데이터 포장
+        context = {
+            'stores_json': _build_map_stores_json(fmt),
+            # API 키를 settings.py에서 가져오거나, 여기에 직접 문자열로 넣어도 됨
+            'kakao_js_key': settings.KAKAO_JS_KEY, 
+        }
+        return render_to_string('map.html', context)
+
+    variants = get_cached_variants(f'map_page:{fmt}', ALL_GU, build_page)
+    return compressed_response(request, variants, HTML_CONTENT_TYPE)
 
 
 def kakao_map_test(request):
@@ -34,53 +89,78 @@ def kakao_map_test(request):
     return render(request, 'kakao_map_test.html')
 
 
-def matched_stores_map(request):
-    """교차 매칭된 편의점 데이터를 카카오맵에 표시"""
-    import os
-    import pandas as pd
-    
-    # CSV 파일 경로 (프로젝트 루트의 matched_stores_unique.csv)
-    csv_path = os.path.join(settings.BASE_DIR, 'matched_stores_unique.csv')
+def _build_matched_stores_payload(csv_path):
+    """matched_stores_map용 페이로드 생성 (CSV 파싱 + 직렬화, 파일이 바뀔 때만 실행)"""
+    import csv
     
     stores_list = []
     store_count = 0
     
-    if os.path.exists(csv_path):
-        df = pd.read_csv(csv_path, encoding='utf-8-sig')
-        store_count = len(df)
-        
-        for _, row in df.iterrows():
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            store_count += 1
             # 위도/경도가 있는 경우만 추가
-            if pd.notna(row['위도']) and pd.notna(row['경도']):
-                stores_list.append({
-                    'name': row['이름'],
-                    'address': row['주소'],
-                    'lat': float(row['위도']),
-                    'lng': float(row['경도']),
-                    'source': row['출처'],
-                    'match_reason': row['매칭이유']
-                })
+            try:
+                lat, lng = float(row['위도']), float(row['경도'])
+            except (TypeError, ValueError):
+                continue
+            if lat != lat or lng != lng:  # NaN
+                continue
+            stores_list.append({
+                'name': row['이름'],
+                'address': row['주소'],
+                'lat': lat,
+                'lng': lng,
+                'source': row['출처'],
+                'match_reason': row['매칭이유']
+            })
     
-    context = {
+    return {
         'stores_json': json.dumps(stores_list, ensure_ascii=False),
-        'kakao_js_key': settings.KAKAO_JS_KEY,
         'store_count': store_count,
     }
-    
-    return render(request, 'matched_stores_map.html', context)
 
 
-def store_closure_map_view(request):
-    """폐업 매장 체크 결과를 카카오맵에 표시 (DB에서 읽기)"""
+def matched_stores_map(request):
+    """교차 매칭된 편의점 데이터를 카카오맵에 표시"""
+    import os
+    
+    # CSV 파일 경로 (프로젝트 루트의 matched_stores_unique.csv)
+    # v2_1_cross_match_stores가 파일을 다시 쓰면 mtime이 바뀌어 자동 재생성
+    csv_path = os.path.join(settings.BASE_DIR, 'matched_stores_unique.csv')
+    
+    def build_page(path):
+        context = {
+            **_build_matched_stores_payload(path),
+            'kakao_js_key': settings.KAKAO_JS_KEY,
+        }
+        return compress_variants(render_to_string('matched_stores_map.html', context))
+    
+    variants = get_file_payload(csv_path, build_page)
+    if variants is None:
+        return render(request, 'matched_stores_map.html', {
+            'stores_json': '[]',
+            'store_count': 0,
+            'kakao_js_key': settings.KAKAO_JS_KEY,
+        })
+    return compressed_response(request, variants, HTML_CONTENT_TYPE)
+
+
+def _build_closure_map_payload(fmt, gu=None):
+    """store_closure_map_view용 페이로드 생성 (DB 조회 + 직렬화, gu 지정 시 해당 구만)"""
     from .models import StoreClosureResult
     
     stores_list = []
     normal_count = 0
     closed_count = 0
     
+    closure_results = StoreClosureResult.objects.all()
+    if gu is not None:
+        closure_results = closure_results.filter(gu=gu)
+    
     # DB에서 데이터 읽기 (N+1 방지: values() 사용으로 필요한 필드만 조회)
-    closure_results = StoreClosureResult.objects.values(
-        'name', 'address', 'latitude', 'longitude', 'status', 'match_reason', 'gu'
+    closure_results = closure_results.values(
+        'name', 'address', 'latitude', 'longitude', 'status', 'match_flags', 'gu'
     )
     
     for store in closure_results:
@@ -97,71 +177,56 @@ def store_closure_map_view(request):
                 'lat': float(store['latitude']),
                 'lng': float(store['longitude']),
                 'status': status,
-                'match_reason': store['match_reason'],
+                'match_reason': StoreClosureResult.reason_label(store['match_flags']),
                 'gu': store['gu']
             })
     
-    context = {
-        'stores_json': json.dumps(stores_list, ensure_ascii=False),
-        'kakao_js_key': settings.KAKAO_JS_KEY,
+    return {
+        'stores_json': dumps_stores(stores_list, fmt, dict_fields=STORE_DICT_FIELDS + ('gu',)),
         'normal_count': normal_count,
         'closed_count': closed_count,
     }
+
+
+@condition(
+    etag_func=lambda request: version_etag(f'closure_map-{_map_format(request)}', ALL_GU),
+    last_modified_func=lambda request: version_last_modified(ALL_GU),
+)
+def store_closure_map_view(request):
+    """폐업 매장 체크 결과를 카카오맵에 표시 (DB에서 읽기, 데이터 버전 기준 캐시)"""
+    fmt = _map_format(request)
+    
+    def build_page():
+        context = {
+            **_build_closure_map_payload(fmt),
+            'kakao_js_key': settings.KAKAO_JS_KEY,
+        }
+        return render_to_string('store_closure_map.html', context)
     
-    return render(request, 'store_closure_map.html', context)
+    variants = get_cached_variants(f'closure_map_page:{fmt}', ALL_GU, build_page)
+    return compressed_response(request, variants, HTML_CONTENT_TYPE)
 
 
 # ========================================
 # 수집 UI 관련 뷰
 # ========================================
 import os
-import threading
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST, require_GET
-from django.core.management import call_command
-
-
-# 수집 상태 저장 (메모리, 단일 사용자용)
-collection_status = {
-    'running': False,
-    'progress': 0,
-    'message': '',
-    'completed': False,
-    'error': None,
-    'target_gu': None,
-    # 개발자 모니터링용 상세 metrics
-    'metrics': {
-        'start_time': None,
-        'end_time': None,
-        'elapsed_seconds': 0,
-        'stages': {
-            'daiso': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-            'convenience': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-            'restaurant': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-            'tobacco': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-            'closure': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-        },
-        'api_calls': {'kakao': 0, 'seoul': 0, 'daiso': 0, 'total': 0},
-        'data_quality': {
-            'duplicates_removed': 0,
-            'coords_missing': 0,
-            'address_mismatch': 0,
-            'total_records': 0,
-            'coord_accuracy_avg': 0
-        },
-        'cross_validation': {
-            'restaurant_match': 0,
-            'tobacco_match': 0,
-            'csv_match': 0,
-            'normal': 0,
-            'closed': 0,
-            'total': 0
-        },
-        'logs': [],
-        'quadrants': []  # 4분면 좌표 데이터 [{center: {lat, lng}, bounds: [...]}]
-    }
-}
+from .models import CollectionJob
+from .jobs import (
+    enqueue_job,
+    ensure_embedded_worker,
+    get_active_job,
+    initial_metrics,
+    job_status_payload,
+    start_event_listener,
+)
+
+
+# 수집 작업 상태는 CollectionJob(DB)에 저장 - 실행은 collect_worker가 담당 (stores/jobs.py)
 
 
 def collector_view(request):
@@ -169,52 +234,14 @@ def collector_view(request):
     return render(request, 'collector.html')
 
 
-import requests
-
-def validate_kakao_rest_api_key(api_key):
-    """카카오 REST API 키 유효성 검증"""
-    try:
-        url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {api_key}"}
-        params = {"query": "테스트"}
-        response = requests.get(url, headers=headers, params=params, timeout=5)
-        if response.status_code == 401:
-            return False, "카카오 REST API 키가 올바르지 않습니다."
-        return True, None
-    except Exception as e:
-        return False, f"카카오 REST API 검증 중 오류: {str(e)}"
-
-
-def validate_seoul_openapi_key(api_key):
-    """서울시 OpenAPI 키 유효성 검증"""
-    try:
-        url = f"http://openapi.seoul.go.kr:8088/{api_key}/json/LOCALDATA_072405_YP/1/1/"
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        
-        # API 응답에서 에러 확인
-        if 'RESULT' in data:
-            code = data['RESULT'].get('CODE', '')
-            if code == 'INFO-200':
-                # 데이터 없음은 키는 유효함
-                return True, None
-            elif code in ['ERROR-300', 'ERROR-331', 'ERROR-332', 'ERROR-333', 'ERROR-334']:
-                return False, "서울시 OpenAPI 키가 올바르지 않습니다."
-        return True, None
-    except Exception as e:
-        return False, f"서울시 OpenAPI 검증 중 오류: {str(e)}"
-
-
 @csrf_exempt
 @require_POST
-def start_collection(request):
-    """수집 시작 API"""
-    global collection_status
-    
-    # 이미 실행 중이면 거부
-    if collection_status['running']:
-        return JsonResponse({'success': False, 'error': '이미 수집이 진행 중입니다.'})
+async def start_collection(request):
+    """
+    수집 시작 API (작업 등록만 하고 즉시 반환)
     
+    비동기 뷰: 외부 API 키 검증(최대 5초) 동안 워커 스레드를 점유하지 않음 (config/asgi.py)
+    """
     try:
         data = json.loads(request.body)
         kakao_api_key = data.get('kakao_api_key')
@@ -222,352 +249,450 @@ def start_collection(request):
         seoul_api_key = data.get('seoul_api_key')
         target_gu = data.get('target_gu', '영등포구')
         
+        # 같은 구가 이미 대기/실행 중이면 거부 (다른 구는 동시에 수집 가능)
+        if await sync_to_async(get_active_job)(target_gu):
+            return JsonResponse({'success': False, 'error': f'이미 수집이 진행 중입니다. ({target_gu})'})
+        
         if not all([kakao_api_key, kakao_js_key, seoul_api_key]):
             return JsonResponse({'success': False, 'error': 'API 키가 누락되었습니다.'})
         
-        # API 키 유효성 검증
-        # 1. 카카오 REST API 키 검증
-        is_valid, error_msg = validate_kakao_rest_api_key(kakao_api_key)
+        # API 키 유효성 검증 (카카오/서울시 동시 실행, 최근 검증된 키는 생략)
+        is_valid, error_msg = await validate_api_keys(kakao_api_key, seoul_api_key)
         if not is_valid:
             return JsonResponse({'success': False, 'error': error_msg})
         
-        # 2. 서울시 OpenAPI 키 검증
-        is_valid, error_msg = validate_seoul_openapi_key(seoul_api_key)
-        if not is_valid:
-            return JsonResponse({'success': False, 'error': error_msg})
-        
-        # 상태 초기화 (metrics 포함)
-        import time as time_module
-        collection_status = {
-            'running': True,
-            'progress': 0,
-            'message': '수집 준비 중...',
-            'completed': False,
-            'error': None,
-            'target_gu': target_gu,
-            'metrics': {
-                'start_time': time_module.time(),
-                'end_time': None,
-                'elapsed_seconds': 0,
-                'stages': {
-                    'daiso': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-                    'convenience': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-                    'restaurant': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-                    'tobacco': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-                    'closure': {'status': 'pending', 'count': 0, 'time': 0, 'api_calls': 0},
-                },
-                'api_calls': {'kakao': 0, 'seoul': 0, 'daiso': 0, 'total': 0},
-                'data_quality': {
-                    'duplicates_removed': 0,
-                    'coords_missing': 0,
-                    'address_mismatch': 0,
-                    'total_records': 0,
-                    'coord_accuracy_avg': 0
-                },
-                'cross_validation': {
-                    'restaurant_match': 0,
-                    'tobacco_match': 0,
-                    'csv_match': 0,
-                    'normal': 0,
-                    'closed': 0,
-                    'total': 0
-                },
-                'logs': [],
-                'quadrants': []
-            }
-        }
-        
-        # 환경변수 설정
-        os.environ['KAKAO_API_KEY'] = kakao_api_key
+        # 지도 표시용 JS 키는 웹 프로세스에서만 사용
         os.environ['KAKAO_JS_KEY'] = kakao_js_key
-        os.environ['SEOUL_OPENAPI_KEY'] = seoul_api_key
         
-        # 백그라운드 스레드에서 수집 실행
-        thread = threading.Thread(
-            target=run_collection_task,
-            args=(target_gu,)
-        )
-        thread.daemon = True
-        thread.start()
+        # 작업 등록 (워커가 SKIP LOCKED로 가져가 실행)
+        job = await sync_to_async(enqueue_job)(target_gu, {
+            'kakao_api_key': kakao_api_key,
+            'seoul_api_key': seoul_api_key,
+        })
+        # 키 검증 중 다른 요청이 같은 구를 먼저 등록한 경우 (DB 제약으로 1건만 등록됨)
+        if job is None:
+            return JsonResponse({'success': False, 'error': f'이미 수집이 진행 중입니다. ({target_gu})'})
+        start_event_listener()
+        ensure_embedded_worker()
         
-        return JsonResponse({'success': True})
+        return JsonResponse({'success': True, 'job_id': job.pk})
         
     except Exception as e:
         return JsonResponse({'success': False, 'error': str(e)})
 
 
-def add_log(message, level='INFO'):
-    """로그 메시지 추가 (개발자 모니터링용)"""
-    import time as time_module
-    from datetime import datetime
-    timestamp = datetime.now().strftime('%H:%M:%S')
-    log_entry = {
-        'timestamp': timestamp,
-        'level': level,
-        'message': message
-    }
-    if 'metrics' in collection_status and collection_status['metrics']:
-        collection_status['metrics']['logs'].append(log_entry)
-        # 최대 100개 로그만 유지
-        if len(collection_status['metrics']['logs']) > 100:
-            collection_status['metrics']['logs'] = collection_status['metrics']['logs'][-100:]
+def _job_queryset(request):
+    """조회 대상 작업 쿼리셋 (?job_id= 지정 시 해당 작업, 없으면 가장 최근 작업)"""
+    job_id = request.GET.get('job_id')
+    if job_id:
+        if not job_id.isdigit():
+            return CollectionJob.objects.none()
+        return CollectionJob.objects.filter(pk=int(job_id))
+    return CollectionJob.objects.all()
 
 
-def update_elapsed_time():
-    """경과 시간 업데이트"""
-    import time as time_module
-    if collection_status.get('metrics') and collection_status['metrics'].get('start_time'):
-        collection_status['metrics']['elapsed_seconds'] = time_module.time() - collection_status['metrics']['start_time']
+def _get_job(request):
+    return _job_queryset(request).first()
 
 
-def run_collection_task(target_gu):
-    """백그라운드 수집 작업 (상세 metrics 추적 포함)"""
-    global collection_status
-    import time as time_module
-    from stores.models import YeongdeungpoDaiso, YeongdeungpoConvenience, SeoulRestaurantLicense, TobaccoRetailLicense, StoreClosureResult
-    
-    try:
-        add_log(f'{target_gu} 수집 시작', 'INFO')
-        
-        # ========================================
-        # Step 1: 다이소 수집 (20%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 다이소 수집 중...'
-        collection_status['progress'] = 10
-        collection_status['metrics']['stages']['daiso']['status'] = 'running'
-        add_log(f'[1/5] 다이소 수집 시작', 'INFO')
-        
-        call_command('v2_3_1_collect_yeongdeungpo_daiso', gu=target_gu, clear=True)
-        
-        daiso_count = YeongdeungpoDaiso.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
-        collection_status['metrics']['stages']['daiso'] = {
-            'status': 'completed',
-            'count': daiso_count,
-            'time': stage_time,
-            'api_calls': 1  # 다이소 API 1회
-        }
-        collection_status['metrics']['api_calls']['daiso'] = 1
-        collection_status['metrics']['api_calls']['total'] += 1
-        collection_status['progress'] = 20
-        add_log(f'✅ 다이소 {daiso_count}개 수집 완료 ({stage_time}초)', 'INFO')
-        
-        # 수집된 다이소 지점 목록 (N+1 방지: values() 사용으로 한 번만 조회)
-        daiso_data = list(YeongdeungpoDaiso.objects.filter(gu=target_gu).values('name', 'location'))
-        
-        # 수집된 다이소 지점 목록 로그
-        for daiso in daiso_data:
-            add_log(f'  📍 {daiso["name"]}', 'INFO')
-        
-        update_elapsed_time()
-        
-        # 4분면 좌표 데이터 수집 (위에서 조회한 데이터 재사용)
-        quadrants_data = []
-        DELTA_LAT, DELTA_LNG = 0.0117, 0.0147
-        for daiso in daiso_data:
-            if daiso['location']:
-                cx, cy = daiso['location'].x, daiso['location'].y
-                quadrants_data.append({
-                    'name': daiso['name'],
-                    'center': {'lat': cy, 'lng': cx},
-                    'quadrants': [
-                        {'name': 'NE', 'bounds': [[cy, cx], [cy + DELTA_LAT, cx + DELTA_LNG]]},
-                        {'name': 'NW', 'bounds': [[cy, cx - DELTA_LNG], [cy + DELTA_LAT, cx]]},
-                        {'name': 'SE', 'bounds': [[cy - DELTA_LAT, cx], [cy, cx + DELTA_LNG]]},
-                        {'name': 'SW', 'bounds': [[cy - DELTA_LAT, cx - DELTA_LNG], [cy, cx]]}
-                    ]
-                })
-        collection_status['metrics']['quadrants'] = quadrants_data
-        
-        # ========================================
-        # Step 2: 편의점 수집 (50%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 편의점 수집 중...'
-        collection_status['progress'] = 30
-        collection_status['metrics']['stages']['convenience']['status'] = 'running'
-        add_log(f'[2/5] 편의점 수집 시작 (4분면 검색)', 'INFO')
-        
-        call_command('v2_3_2_collect_Convenience_Only', gu=target_gu, clear=True, use_async=True)
-        
-        conv_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
-        # 추정 API 호출: 다이소 수 * 4분면 * 평균 3페이지
-        estimated_kakao_calls = daiso_count * 4 * 3
-        collection_status['metrics']['stages']['convenience'] = {
-            'status': 'completed',
-            'count': conv_count,
-            'time': stage_time,
-            'api_calls': estimated_kakao_calls
-        }
-        collection_status['metrics']['api_calls']['kakao'] += estimated_kakao_calls
-        collection_status['metrics']['api_calls']['total'] += estimated_kakao_calls
-        collection_status['progress'] = 50
-        add_log(f'✅ 편의점 {conv_count}개 수집 완료 ({stage_time}초, API ~{estimated_kakao_calls}회)', 'INFO')
-        update_elapsed_time()
-        
-        # ========================================
-        # Step 3: OpenAPI 휴게음식점 (70%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 휴게음식점 인허가 수집 중...'
-        collection_status['progress'] = 55
-        collection_status['metrics']['stages']['restaurant']['status'] = 'running'
-        add_log(f'[3/5] 휴게음식점 인허가 수집 시작', 'INFO')
-        
-        call_command('openapi_1', gu=target_gu, clear=True)
-        
-        restaurant_count = SeoulRestaurantLicense.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
-        estimated_seoul_calls = max(1, restaurant_count // 1000 + 1)
-        collection_status['metrics']['stages']['restaurant'] = {
-            'status': 'completed',
-            'count': restaurant_count,
-            'time': stage_time,
-            'api_calls': estimated_seoul_calls
-        }
-        collection_status['metrics']['api_calls']['seoul'] += estimated_seoul_calls
-        collection_status['metrics']['api_calls']['total'] += estimated_seoul_calls
-        collection_status['progress'] = 70
-        add_log(f'✅ 휴게음식점 {restaurant_count}개 수집 완료 ({stage_time}초)', 'INFO')
-        update_elapsed_time()
-        
-        # ========================================
-        # Step 4: OpenAPI 담배소매업 (85%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 담배소매업 인허가 수집 중...'
-        collection_status['progress'] = 75
-        collection_status['metrics']['stages']['tobacco']['status'] = 'running'
-        add_log(f'[4/5] 담배소매업 인허가 수집 시작', 'INFO')
-        
-        call_command('openapi_2', gu=target_gu, clear=True)
-        
-        tobacco_count = TobaccoRetailLicense.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
-        estimated_seoul_calls = max(1, tobacco_count // 1000 + 1)
-        collection_status['metrics']['stages']['tobacco'] = {
-            'status': 'completed',
-            'count': tobacco_count,
-            'time': stage_time,
-            'api_calls': estimated_seoul_calls
-        }
-        collection_status['metrics']['api_calls']['seoul'] += estimated_seoul_calls
-        collection_status['metrics']['api_calls']['total'] += estimated_seoul_calls
-        collection_status['progress'] = 85
-        add_log(f'✅ 담배소매업 {tobacco_count}개 수집 완료 ({stage_time}초)', 'INFO')
-        update_elapsed_time()
-        
-        # ========================================
-        # Step 5: 폐업 검증 (100%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 폐업 매장 검증 중...'
-        collection_status['progress'] = 90
-        collection_status['metrics']['stages']['closure']['status'] = 'running'
-        add_log(f'[5/5] 폐업 검증 시작 (교차 검증)', 'INFO')
-        
-        call_command('check_store_closure', gu=target_gu, clear=True)
-        
-        # 교차 검증 결과 수집
-        closure_results = StoreClosureResult.objects.filter(gu=target_gu)
-        normal_count = closure_results.filter(status='정상').count()
-        closed_count = closure_results.filter(status='폐업').count()
-        total_count = closure_results.count()
-        
-        stage_time = round(time_module.time() - stage_start, 2)
-        collection_status['metrics']['stages']['closure'] = {
-            'status': 'completed',
-            'count': total_count,
-            'time': stage_time,
-            'api_calls': 0
-        }
-        
-        # 교차 검증 상세 결과
-        # 매칭 이유별 카운트
-        restaurant_match = closure_results.filter(match_reason__icontains='이름').count()
-        tobacco_match = closure_results.filter(match_reason__icontains='주소').count()
-        csv_match = closure_results.filter(match_reason__icontains='좌표').count()
-        
-        collection_status['metrics']['cross_validation'] = {
-            'restaurant_match': restaurant_match,
-            'tobacco_match': tobacco_match,
-            'csv_match': csv_match,
-            'normal': normal_count,
-            'closed': closed_count,
-            'total': total_count
-        }
-        
-        # 데이터 품질 지표
-        coords_missing = YeongdeungpoConvenience.objects.filter(gu=target_gu, location__isnull=True).count()
-        collection_status['metrics']['data_quality'] = {
-            'duplicates_removed': 0,  # update_or_create로 처리됨
-            'coords_missing': coords_missing,
-            'address_mismatch': 0,
-            'total_records': conv_count,
-            'coord_accuracy_avg': 5.8  # 평균 좌표 변환 오차 (m)
-        }
-        
-        collection_status['progress'] = 100
-        add_log(f'✅ 폐업 검증 완료: 정상 {normal_count}개, 폐업 {closed_count}개 ({stage_time}초)', 'INFO')
-        
-        collection_status['message'] = '수집 완료!'
-        collection_status['completed'] = True
-        collection_status['metrics']['end_time'] = time_module.time()
-        update_elapsed_time()
-        add_log(f'🎉 전체 수집 완료! 총 소요시간: {round(collection_status["metrics"]["elapsed_seconds"], 1)}초', 'INFO')
-        
-    except Exception as e:
-        collection_status['error'] = str(e)
-        collection_status['message'] = f'오류 발생: {str(e)}'
-        add_log(f'❌ 오류 발생: {str(e)}', 'ERROR')
-    finally:
-        collection_status['running'] = False
+def _idle_status_payload():
+    """등록된 작업이 없을 때의 상태"""
+    return {
+        'job_id': None,
+        'target_gu': None,
+        'status': None,
+        'running': False,
+        'progress': 0,
+        'message': '',
+        'completed': False,
+        'error': None,
+    }
 
 
 @require_GET
-def check_status(request):
-    """수집 진행 상태 확인 API"""
-    return JsonResponse({
-        'running': collection_status['running'],
-        'progress': collection_status['progress'],
-        'message': collection_status['message'],
-        'completed': collection_status['completed'],
-        'error': collection_status['error']
-    })
+async def check_status(request):
+    """수집 진행 상태 확인 API (비동기 ORM 조회)"""
+    job = await _job_queryset(request).afirst()
+    return JsonResponse(job_status_payload(job) if job else _idle_status_payload())
+
+
+# ========================================
+# 실시간 이벤트 스트림 (SSE)
+# ========================================
+
+# 연결 유지용 keepalive 주기 (초) - 프록시 idle timeout보다 짧게
+SSE_KEEPALIVE_SECONDS = 15
+# 연결이 끊겼을 때 브라우저 재연결 대기 시간 (밀리초)
+SSE_RETRY_MS = 3000
+
+
+def _parse_last_event_id(request):
+    """
+    재연결 시 마지막으로 받은 이벤트 번호 (헤더 우선, 없으면 쿼리스트링)
+
+    다른 워커 프로세스가 발행한 id면 None → 스냅샷부터 다시 전송
+    """
+    value = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    return event_bus.parse_event_id(value)
+
+
+def _snapshot_event(job):
+    """현재 상태 전체 스냅샷 이벤트 (최초 연결/이어받기 불가 시)"""
+    metrics = (job.metrics if job else None) or {}
+    return {
+        'id': event_bus.last_id,
+        'event': 'snapshot',
+        'data': {
+            **(job_status_payload(job) if job else _idle_status_payload()),
+            'stages': metrics.get('stages', {}),
+            'logs': metrics.get('logs', []),
+        },
+    }
 
 
 @require_GET
-def get_results(request):
-    """수집 결과 반환 API (DB에서 읽기)"""
-    from .models import StoreClosureResult
+def collection_events(request):
+    """
+    수집 진행 이벤트 스트림 API (text/event-stream)
+    
+    - status: 진행률/메시지/완료/오류
+    - stage: 단계 전환 (pending → running → completed)
+    - log: 작업 로그 한 줄
+    - snapshot: 최초 연결 또는 놓친 이벤트를 이어받을 수 없을 때 전체 상태
     
-    target_gu = collection_status.get('target_gu', '영등포구')
+    ?job_id= 지정 시 해당 작업의 이벤트만 전송한다.
+    워커 프로세스의 이벤트는 Postgres LISTEN 스레드가 EventBus로 전달한다.
+    새 이벤트가 없으면 Condition 대기만 하므로 유휴 상태에서 CPU를 쓰지 않는다.
+    """
+    from django.core.handlers.asgi import ASGIRequest
+    from django.http import StreamingHttpResponse
+    
+    start_event_listener()
+    last_id = _parse_last_event_id(request)
+    job_id = request.GET.get('job_id')
+    job_id = int(job_id) if job_id and job_id.isdigit() else None
+    
+    # 스냅샷은 스트림 시작 전에 조회 (스트리밍 중에는 DB 연결을 잡지 않음)
+    snapshot = None
+    if last_id is None or not event_bus.can_resume(last_id):
+        snapshot = _snapshot_event(_get_job(request))
+    
+    preamble = [f'retry: {SSE_RETRY_MS}\n\n']
+    if snapshot:
+        last_id = snapshot['id']
+        preamble.append(format_sse(snapshot))
+    
+    def chunks(events):
+        if not events:
+            return [': keepalive\n\n']
+        return [format_sse(event) for event in events if job_id is None or event['data'].get('job_id') == job_id]
+    
+    def event_stream():
+        cursor = last_id
+        yield from preamble
+        while True:
+            events = event_bus.wait(cursor, timeout=SSE_KEEPALIVE_SECONDS)
+            cursor = events[-1]['id'] if events else cursor
+            yield from chunks(events)
+    
+    async def async_event_stream():
+        # ASGI는 동기 이터레이터를 list()로 끝까지 모은 뒤 전송하므로 무한 스트림은 async로 제공
+        cursor = last_id
+        for chunk in preamble:
+            yield chunk
+        while True:
+            events = await event_bus.wait_async(cursor, timeout=SSE_KEEPALIVE_SECONDS)
+            cursor = events[-1]['id'] if events else cursor
+            for chunk in chunks(events):
+                yield chunk
+    
+    stream = async_event_stream() if isinstance(request, ASGIRequest) else event_stream()
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 비활성화
+    return response
+
+
+def _results_gu(request):
+    """get_results 대상 구 (?gu= 지정, 없으면 마지막으로 데이터가 갱신된 구)"""
+    return request.GET.get('gu') or get_last_updated_gu('영등포구')
+
+
+def _parse_bbox(value):
+    """'minLng,minLat,maxLng,maxLat' → tuple (없으면 None, 형식 오류는 ValueError)"""
+    if not value:
+        return None
+    bbox = tuple(float(v) for v in value.split(','))
+    if len(bbox) != 4:
+        raise ValueError('bbox는 minLng,minLat,maxLng,maxLat 형식이어야 합니다.')
+    return bbox
+
+
+def _results_filters(request):
+    """
+    get_results 필터 파싱
+
+    ?bbox=minLng,minLat,maxLng,maxLat  지도 화면 영역
+    ?status=정상|폐업
+
+    Returns:
+        (bbox 또는 None, status 또는 None)
+
+    Raises:
+        ValueError: bbox 형식 오류
+    """
+    return _parse_bbox(request.GET.get('bbox')), request.GET.get('status') or None
+
+
+def _results_etag_name(request):
+    """get_results ETag 이름 (필터가 있으면 필터 값 해시 포함)"""
+    name = f'results-{payload_format(request)}'
+    filters = f"{request.GET.get('bbox', '')}|{request.GET.get('status', '')}"
+    if filters != '|':
+        name += '-' + hashlib.md5(filters.encode('utf-8')).hexdigest()[:8]
+    return name
+
+
+def _results_rows(target_gu, bbox=None, status=None):
+    """
+    get_results 행 목록
+
+    파이프라인이 남긴 mmap 스냅샷이 있으면 DB 대신 스냅샷에서 읽는다. (stores/snapshot.py)
+    """
+    snapshot = load_snapshot(target_gu)
+    if snapshot is not None:
+        return snapshot.rows(snapshot.select(bbox=bbox, status=status))
+    
+    from .models import StoreClosureResult
     
     # DB에서 데이터 읽기 (N+1 방지: values() 사용으로 필요한 필드만 조회)
-    closure_results = StoreClosureResult.objects.filter(gu=target_gu).values(
-        'name', 'address', 'latitude', 'longitude', 'status', 'match_reason'
+    closure_results = StoreClosureResult.objects.filter(gu=target_gu)
+    if bbox is not None:
+        min_lng, min_lat, max_lng, max_lat = bbox
+        closure_results = closure_results.filter(
+            longitude__range=(min_lng, max_lng),
+            latitude__range=(min_lat, max_lat),
+        )
+    if status is not None:
+        closure_results = closure_results.filter(status=status)
+    closure_results = closure_results.values(
+        'name', 'address', 'latitude', 'longitude', 'status', 'match_flags'
     )
     
     # 리스트 컴프리헨션으로 한 번에 처리
-    stores_list = [
+    return [
         {
             'name': store['name'],
             'address': store['address'],
             'lat': float(store['latitude']),
             'lng': float(store['longitude']),
             'status': store['status'],
-            'match_reason': store['match_reason']
+            'match_reason': StoreClosureResult.reason_label(store['match_flags'])
         }
         for store in closure_results
         if store['latitude'] and store['longitude']
     ]
+
+
+def _build_results_json(target_gu, fmt=FORMAT_ROWS, bbox=None, status=None):
+    """get_results용 JSON 페이로드 생성 (스냅샷/DB 조회 + 직렬화)"""
+    stores_list = _results_rows(target_gu, bbox, status)
     
-    return JsonResponse({
-        'stores': stores_list,
+    return json.dumps({
+        'stores': encode_stores(stores_list, fmt, dict_fields=STORE_DICT_FIELDS),
         'target_gu': target_gu
-    })
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+@require_GET
+@condition(
+    etag_func=lambda request: version_etag(_results_etag_name(request), _results_gu(request)),
+    last_modified_func=lambda request: version_last_modified(_results_gu(request)),
+)
+def get_results(request):
+    """
+    수집 결과 반환 API (스냅샷/DB에서 읽기, 데이터 버전 기준 캐시 + gzip/br 사전 압축)
+    
+    ?format=columnar      병렬 배열 + status/match_reason 사전 인코딩
+    ?format=columnar-f32  컬럼형 + 좌표 Float32 바이너리(base64)
+    ?bbox=minLng,minLat,maxLng,maxLat, ?status=폐업
+                          영역/상태 필터 (조합이 다양하므로 캐시하지 않고 스냅샷에서 바로 슬라이스)
+    """
+    target_gu = _results_gu(request)
+    fmt = payload_format(request)
+    try:
+        bbox, status = _results_filters(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'잘못된 bbox: {e}'}, status=400)
+    
+    if bbox is None and status is None:
+        variants = get_cached_variants(f'results:{fmt}', target_gu, lambda: _build_results_json(target_gu, fmt))
+        return compressed_response(request, variants, 'application/json')
+    
+    payload = _build_results_json(target_gu, fmt, bbox, status)
+    return HttpResponse(payload, content_type='application/json')
+
+
+# ========================================
+# 매장/인허가 검색
+# ========================================
+
+@require_GET
+def search(request):
+    """
+    매장/인허가 통합 검색 API (pg_trgm 인덱스, 유사도 순)
+    
+    ?q=검색어 (필수, 2글자 이상)
+    ?gu=영등포구
+    ?bbox=minLng,minLat,maxLng,maxLat
+    ?source=closure,tobacco  (convenience / closure / restaurant / tobacco, 기본 전체)
+    ?limit=20  (최대 100)
+    """
+    query = request.GET.get('q', '')
+    sources = [s for s in request.GET.get('source', '').split(',') if s] or None
+    try:
+        bbox = _parse_bbox(request.GET.get('bbox'))
+        limit = int(request.GET.get('limit', DEFAULT_SEARCH_LIMIT))
+        results = search_stores(query, gu=request.GET.get('gu') or None, bbox=bbox, sources=sources, limit=limit)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    return JsonResponse({'query': query, 'count': len(results), 'results': results})
+
+
+# ========================================
+# 육각 격자 폐업 밀도
+# ========================================
+
+def _hex_params(request):
+    """(resolution, gu) - 지원하지 않는 크기면 기본값"""
+    try:
+        resolution = int(request.GET.get('resolution', DEFAULT_HEX_RESOLUTION))
+    except ValueError:
+        resolution = DEFAULT_HEX_RESOLUTION
+    if resolution not in HEX_RESOLUTIONS:
+        resolution = DEFAULT_HEX_RESOLUTION
+    return resolution, request.GET.get('gu') or ALL_GU
+
+
+@require_GET
+@condition(
+    etag_func=lambda request: version_etag(f'hex-{_hex_params(request)[0]}', _hex_params(request)[1]),
+    last_modified_func=lambda request: version_last_modified(_hex_params(request)[1]),
+)
+def hex_density(request):
+    """
+    육각 격자 폐업 밀도 GeoJSON API (HexCell, 데이터 버전 기준 캐시 + 사전 압축)
+    
+    ?resolution=250|500|1000  육각형 변 길이(m), 기본 500
+    ?gu=영등포구               없으면 서울 전체
+    """
+    resolution, gu = _hex_params(request)
+    
+    def build():
+        geojson = hex_cells_geojson(resolution, None if gu == ALL_GU else gu)
+        return json.dumps(geojson, ensure_ascii=False, separators=(',', ':'))
+    
+    variants = get_cached_variants(f'hex:{resolution}', gu, build)
+    return compressed_response(request, variants, 'application/json')
+
+
+# ========================================
+# 다이소별 상권 밀도
+# ========================================
+
+@require_GET
+@condition(
+    etag_func=lambda request: version_etag('daiso_density', _results_gu(request)),
+    last_modified_func=lambda request: version_last_modified(_results_gu(request)),
+)
+def daiso_density(request):
+    """
+    다이소별 반경 내 편의점/인허가/폐업 매장 수 + 최근접 거리 API
+    (쿼리 1회, 다음 파이프라인 실행 전까지 캐시)
+    
+    ?gu=영등포구  없으면 마지막으로 데이터가 갱신된 구
+    """
+    target_gu = _results_gu(request)
+    variants = get_cached_variants('daiso_density', target_gu, lambda: daiso_density_json(target_gu))
+    return compressed_response(request, variants, 'application/json')
+
+
+# ========================================
+# 폐업 상태 변경 이력
+# ========================================
+
+DEFAULT_HISTORY_DAYS = 7
+MAX_HISTORY_DAYS = 365
+
+
+def _history_days(request):
+    """?days= (1~MAX_HISTORY_DAYS, 형식 오류면 기본값)"""
+    try:
+        days = int(request.GET.get('days', DEFAULT_HISTORY_DAYS))
+    except ValueError:
+        days = DEFAULT_HISTORY_DAYS
+    return max(1, min(days, MAX_HISTORY_DAYS))
+
+
+def _history_cache_name(request):
+    # 기간 기준이 '오늘'이므로 날짜가 바뀌면 새로 계산
+    return f'closure_history:{_history_days(request)}:{timezone.localdate().isoformat()}'
+
+
+@require_GET
+@condition(
+    etag_func=lambda request: version_etag(_history_cache_name(request), _results_gu(request)),
+    last_modified_func=lambda request: version_last_modified(_results_gu(request)),
+)
+def closure_history(request):
+    """
+    신규 폐업 매장 + 일자별 상태 전환 추이 API (StoreClosureHistory, 데이터 버전 기준 캐시)
+    
+    ?gu=영등포구  없으면 마지막으로 데이터가 갱신된 구
+    ?days=7       조회 기간 (일)
+    """
+    target_gu = _results_gu(request)
+    days = _history_days(request)
+    variants = get_cached_variants(
+        _history_cache_name(request), target_gu, lambda: closure_history_json(target_gu, days)
+    )
+    return compressed_response(request, variants, 'application/json')
+
+
+# ========================================
+# 구별 비교 (요약 테이블)
+# ========================================
+
+def gu_summary_view(request):
+    """구별 수집/검증 결과 비교 페이지"""
+    return render(request, 'gu_summary.html')
+
+
+def _build_gu_summary_json():
+    """구별 요약 JSON 페이로드 생성 (GuSummary 단일 쿼리)"""
+    from .models import GuSummary
+    
+    summaries = []
+    for row in GuSummary.objects.values():
+        total = row['closure_total']
+        row['closure_rate'] = round(row['closed_count'] / total * 100, 1) if total else 0
+        row['refreshed_at'] = row['refreshed_at'].isoformat() if row['refreshed_at'] else None
+        del row['id']
+        summaries.append(row)
+    
+    return json.dumps({'summaries': summaries}, ensure_ascii=False)
+
+
+@require_GET
+@condition(
+    etag_func=lambda request: version_etag('gu_summary', ALL_GU),
+    last_modified_func=lambda request: version_last_modified(ALL_GU),
+)
+def gu_summary(request):
+    """구별 요약 통계 API (파이프라인 완료 시 갱신된 GuSummary 조회)"""
+    payload = get_cached_payload('gu_summary', ALL_GU, _build_gu_summary_json)
+    return HttpResponse(payload, content_type='application/json')
 
 
 # ========================================
@@ -587,109 +712,61 @@ def dev_monitor_view(request):
     return render(request, 'dev_monitor.html', context)
 
 
+# 수집 중이 아닐 때 dev_status가 반환할 시스템 리소스 시계열 길이 (초)
+SYSTEM_HISTORY_SECONDS = 300
+
+
 @require_GET
 def dev_status(request):
     """개발자용 상세 상태 API - 모든 metrics + 시스템 리소스 반환"""
     import time as time_module
-    import threading
+    
+    job = _get_job(request)
+    status = job_status_payload(job) if job else _idle_status_payload()
+    metrics = (job.metrics if job else None) or initial_metrics()
     
     # 경과 시간 실시간 업데이트
-    if collection_status.get('running') and collection_status.get('metrics', {}).get('start_time'):
-        collection_status['metrics']['elapsed_seconds'] = time_module.time() - collection_status['metrics']['start_time']
+    if job and job.status == CollectionJob.STATUS_RUNNING and metrics.get('start_time'):
+        metrics['elapsed_seconds'] = time_module.time() - metrics['start_time']
+    
+    # 4분면 좌표는 작업당 한 번만 바뀌므로 분리 (dev_quadrants에서 사전 압축본으로 제공)
+    metrics['quadrant_count'] = len(metrics.pop('quadrants', None) or [])
     
-    # 시스템 리소스 수집
-    system_info = get_system_metrics()
+    # 시스템 리소스 (백그라운드 샘플러가 수집한 값만 읽음 - 요청 중 블로킹 없음)
+    system_sampler.start()
+    
+    # 수집 실행이 있었으면 실행 시작 시점부터, 없으면 최근 SYSTEM_HISTORY_SECONDS초
+    history_seconds = SYSTEM_HISTORY_SECONDS
+    if job and metrics.get('start_time'):
+        history_seconds = max(history_seconds, time_module.time() - metrics['start_time'] + system_sampler.interval)
     
     return JsonResponse({
-        'running': collection_status.get('running', False),
-        'progress': collection_status.get('progress', 0),
-        'message': collection_status.get('message', ''),
-        'completed': collection_status.get('completed', False),
-        'error': collection_status.get('error'),
-        'target_gu': collection_status.get('target_gu', ''),
-        'metrics': collection_status.get('metrics', {}),
-        'system': system_info
+        **status,
+        'metrics': metrics,
+        'system': system_sampler.latest(),
+        'system_history': system_sampler.history(seconds=history_seconds)
     })
 
 
-def get_system_metrics():
-    """시스템 리소스 메트릭 수집 (psutil)"""
-    import threading
+@require_GET
+def dev_quadrants(request):
+    """
+    개발자용 다이소 4분면 좌표 API (dev_status에서 분리)
     
-    try:
-        import psutil
-        
-        # CPU
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_count = psutil.cpu_count()
-        
-        # Memory
-        memory = psutil.virtual_memory()
-        memory_used_mb = round(memory.used / (1024 * 1024), 1)
-        memory_total_mb = round(memory.total / (1024 * 1024), 1)
-        memory_percent = memory.percent
-        
-        # Disk
-        disk = psutil.disk_usage('/')
-        disk_used_gb = round(disk.used / (1024 * 1024 * 1024), 1)
-        disk_total_gb = round(disk.total / (1024 * 1024 * 1024), 1)
-        disk_percent = disk.percent
-        
-        # Network (bytes since boot)
-        net = psutil.net_io_counters()
-        net_sent_mb = round(net.bytes_sent / (1024 * 1024), 1)
-        net_recv_mb = round(net.bytes_recv / (1024 * 1024), 1)
-        
-        # Process info
-        process = psutil.Process()
-        process_memory_mb = round(process.memory_info().rss / (1024 * 1024), 1)
-        process_cpu = process.cpu_percent(interval=0.1)
-        
-        # Threads
-        active_threads = threading.active_count()
-        
-        return {
-            'cpu': {
-                'percent': cpu_percent,
-                'cores': cpu_count,
-            },
-            'memory': {
-                'used_mb': memory_used_mb,
-                'total_mb': memory_total_mb,
-                'percent': memory_percent,
-            },
-            'disk': {
-                'used_gb': disk_used_gb,
-                'total_gb': disk_total_gb,
-                'percent': disk_percent,
-            },
-            'network': {
-                'sent_mb': net_sent_mb,
-                'recv_mb': net_recv_mb,
-            },
-            'process': {
-                'memory_mb': process_memory_mb,
-                'cpu_percent': process_cpu,
-            },
-            'threads': {
-                'active': active_threads,
-            }
-        }
-    except ImportError:
-        # psutil이 설치되지 않은 경우
-        return {
-            'cpu': {'percent': 0, 'cores': 0},
-            'memory': {'used_mb': 0, 'total_mb': 0, 'percent': 0},
-            'disk': {'used_gb': 0, 'total_gb': 0, 'percent': 0},
-            'network': {'sent_mb': 0, 'recv_mb': 0},
-            'process': {'memory_mb': 0, 'cpu_percent': 0},
-            'threads': {'active': 0},
-            'error': 'psutil not installed'
-        }
-    except Exception as e:
-        return {
-            'error': str(e)
-        }
+    다이소 수집 단계에서 한 번 계산된 후 바뀌지 않으므로
+    (작업, 개수) 기준으로 사전 압축본을 캐시한다.
+    """
+    job = _get_job(request)
+    quadrants = ((job.metrics if job else None) or {}).get('quadrants') or []
+    if not quadrants:
+        return JsonResponse({'job_id': job.id if job else None, 'quadrants': []})
+    
+    variants = get_cached_variants(
+        f'quadrants:{job.id}:{len(quadrants)}',
+        job.gu,
+        lambda: json.dumps({'job_id': job.id, 'quadrants': quadrants}, ensure_ascii=False, separators=(',', ':')),
+    )
+    return compressed_response(request, variants, 'application/json')
 
 
 # -------------------------------------------------------------------------